@@ -197,6 +197,12 @@ class EDMWizard(QWizard):
 
 def main():
     """Main entry point"""
+    # Copy-on-Write lets shallow copies and column selections share data until
+    # one side is written. It is always on from pandas 3.0, where setting the
+    # option only raises a deprecation warning, so opt in on pandas 2.x only
+    if pd.__version__.startswith('2.'):
+        pd.set_option('mode.copy_on_write', True)
+
     app = QApplication(sys.argv)
 
     # Set application style
@@ -8,10 +8,12 @@ import re
 import time
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..utils.constants import (
     PAS_API_URL,
     PAS_AUTH_URL,
+    PAS_HTTP_POOL_SIZE,
     PAS_SEARCH_PROVIDER_ID,
     PAS_SEARCH_PROVIDER_VERSION,
     PAS_PROPERTY_MANUFACTURER_NAME,
@@ -30,6 +32,18 @@ from ..utils.constants import (
 )
 
 
+def create_pas_session():
+    """Create a requests Session with a connection pool sized for parallel searches"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=PAS_HTTP_POOL_SIZE))
+    return session
+
+
+# Shared by all PAS requests so HTTPS connections stay open between calls
+# instead of paying a new TCP/TLS handshake for every token or search request
+PAS_SESSION = create_pas_session()
+
+
 class PASAPIClient:
     """Part Aggregation Service API Client with OAuth 2.0 authentication"""
 
@@ -74,7 +88,7 @@ class PASAPIClient:
             'Content-Type': 'application/x-www-form-urlencoded'
         }
 
-        response = requests.post(
+        response = PAS_SESSION.post(
             self.auth_url,
             auth=auth,
             data=auth_data,
@@ -218,7 +232,7 @@ class PASAPIClient:
             url = f"{self.pas_url}{endpoint}"
 
             while True:
-                response = requests.post(
+                response = PAS_SESSION.post(
                     url,
                     headers=headers,
                     json=request_body,
@@ -231,7 +245,7 @@ class PASAPIClient:
                     self.token_expires_at = None
                     token = self._get_access_token()
                     headers['Authorization'] = f'Bearer {token}'
-                    response = requests.post(
+                    response = PAS_SESSION.post(
                         url,
                         headers=headers,
                         json=request_body,
@@ -2,7 +2,17 @@
 Custom UI components for EDM Library Wizard
 """
 
-from PyQt5.QtWidgets import QGroupBox, QComboBox, QVBoxLayout, QWidget
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QEvent, QModelIndex, QPersistentModelIndex, QSize, pyqtSignal
+)
+from PyQt5.QtWidgets import (
+    QApplication, QGroupBox, QComboBox, QStyle, QStyledItemDelegate, QStyleOptionButton,
+    QStyleOptionViewItem, QVBoxLayout, QWidget
+)
 
 
 class CollapsibleGroupBox(QGroupBox):
@@ -74,3 +84,187 @@ class NoScrollComboBox(QComboBox):
             event: QWheelEvent
         """
         event.ignore()
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """
+    Read-only table model backed by a DataFrame
+
+    Cells are converted to text only when a view asks for them, so showing
+    a DataFrame does not create one QTableWidgetItem per cell. Missing
+    values display as empty strings. Sorting reorders rows by the
+    underlying values (numbers sort numerically, missing values last).
+    Used for the sheet previews in DataSourcePage and ColumnMappingPage.
+    """
+
+    def __init__(self, df=None, parent=None):
+        super().__init__(parent)
+        self.set_dataframe(df if df is not None else pd.DataFrame())
+
+    def set_dataframe(self, df):
+        """
+        Replace the displayed DataFrame
+
+        Args:
+            df: DataFrame to display
+        """
+        self.beginResetModel()
+        self._df = df
+        self._values = df.to_numpy(dtype=object)
+        self._missing = df.isna().to_numpy()
+        self._order = np.arange(len(df))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._values.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        row = self._order[index.row()]
+        if self._missing[row, index.column()]:
+            return ""
+        return str(self._values[row, index.column()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Reorder rows by the values in column (-1 restores the original order)"""
+        if not 0 <= column < self.columnCount():
+            self.layoutAboutToBeChanged.emit()
+            self._order = np.arange(len(self._df))
+            self.layoutChanged.emit()
+            return
+        values = self._df.iloc[:, column].reset_index(drop=True)
+        ascending = order == Qt.AscendingOrder
+        self.layoutAboutToBeChanged.emit()
+        try:
+            positions = values.sort_values(ascending=ascending, kind='stable', na_position='last').index
+        except TypeError:
+            # Mixed types (e.g. numbers and text) in one column: compare as text
+            positions = values.astype(str).where(values.notna()).sort_values(
+                ascending=ascending, kind='stable', na_position='last'
+            ).index
+        self._order = positions.to_numpy()
+        self.layoutChanged.emit()
+
+
+class RadioButtonDelegate(QStyledItemDelegate):
+    """
+    Item delegate that paints a radio button indicator from Qt.CheckStateRole
+
+    Replaces one QRadioButton cell widget per row: the checked state lives in
+    the model, only one row in the column is checked at a time, and a click
+    (or Space) on an unchecked cell checks it and emits toggled.
+    Used in SupplyFrameReviewPage for the match "Select" column.
+    """
+
+    toggled = pyqtSignal(QModelIndex)
+
+    def _style(self, option):
+        widget = option.widget
+        return widget.style() if widget else QApplication.style()
+
+    def _indicator_size(self, style, widget):
+        return QSize(
+            style.pixelMetric(QStyle.PM_ExclusiveIndicatorWidth, None, widget),
+            style.pixelMetric(QStyle.PM_ExclusiveIndicatorHeight, None, widget)
+        )
+
+    def paint(self, painter, option, index):
+        """
+        Draw the cell background followed by a centered radio indicator
+
+        Args:
+            painter: QPainter
+            option: QStyleOptionViewItem for the cell
+            index: QModelIndex being painted
+        """
+        style = self._style(option)
+        widget = option.widget
+
+        # Background and selection only - no text or check box
+        item_option = QStyleOptionViewItem(option)
+        self.initStyleOption(item_option, index)
+        item_option.features &= ~QStyleOptionViewItem.HasCheckIndicator
+        item_option.text = ''
+        style.drawControl(QStyle.CE_ItemViewItem, item_option, painter, widget)
+
+        button = QStyleOptionButton()
+        button.rect = QStyle.alignedRect(
+            option.direction, Qt.AlignCenter, self._indicator_size(style, widget), option.rect
+        )
+        button.state = QStyle.State_Enabled
+        button.state |= QStyle.State_On if index.data(Qt.CheckStateRole) == Qt.Checked else QStyle.State_Off
+        style.drawPrimitive(QStyle.PE_IndicatorRadioButton, button, painter, widget)
+
+    def sizeHint(self, option, index):
+        """Size the column for the indicator plus a small margin"""
+        size = self._indicator_size(self._style(option), option.widget)
+        return QSize(size.width() + 8, size.height() + 4)
+
+    def editorEvent(self, event, model, option, index):
+        """
+        Check the clicked row and uncheck the previously checked one
+
+        Returns:
+            True if the event was handled
+        """
+        if event.type() == QEvent.MouseButtonRelease:
+            if event.button() != Qt.LeftButton:
+                return False
+        elif event.type() == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            # Swallow double clicks so they do not toggle or open an editor
+            return event.type() == QEvent.MouseButtonDblClick
+
+        if index.data(Qt.CheckStateRole) == Qt.Checked:
+            return True
+
+        target = QPersistentModelIndex(index)
+        for row in range(model.rowCount(index.parent())):
+            other = model.index(row, index.column(), index.parent())
+            if other.data(Qt.CheckStateRole) == Qt.Checked:
+                model.setData(other, Qt.Unchecked, Qt.CheckStateRole)
+
+        index = QModelIndex(target)
+        model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        self.toggled.emit(index)
+        return True
+
+
+@contextmanager
+def bulk_table_update(*tables):
+    """
+    Suspend repaints, signals and sorting while tables are filled
+
+    Sorting is restored afterwards (re-sorting once by the current sort
+    column) and the viewports are repainted a single time.
+
+    Args:
+        *tables: QTableWidget instances about to be populated
+    """
+    states = []
+    for table in tables:
+        states.append((table.isSortingEnabled(), table.signalsBlocked()))
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+    try:
+        yield
+    finally:
+        for table, (sorting, blocked) in zip(tables, states):
+            table.blockSignals(blocked)
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
@@ -12,10 +12,10 @@ try:
     from PyQt5.QtWidgets import (
         QWizardPage, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QLineEdit,
         QPushButton, QFileDialog, QComboBox, QCheckBox, QTableWidget,
-        QTableWidgetItem, QHeaderView, QProgressBar, QMessageBox, QWidget,
-        QSplitter, QScrollArea, QSpinBox, QSizePolicy
+        QTableWidgetItem, QTableView, QAbstractItemView, QHeaderView, QProgressBar,
+        QMessageBox, QWidget, QSplitter, QScrollArea, QSpinBox, QSizePolicy, QProgressDialog
     )
-    from PyQt5.QtCore import Qt, QThread, pyqtSignal
+    from PyQt5.QtCore import Qt, QThread, QEventLoop, pyqtSignal
 except ImportError:
     print("Error: PyQt5 is required.")
     sys.exit(1)
@@ -26,8 +26,19 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
-from edm_wizard.workers.threads import AIDetectionThread, SheetDetectionWorker
-from edm_wizard.ui.components.custom_widgets import NoScrollComboBox
+from edm_wizard.workers.threads import AIDetectionThread, CombineThread, SheetDetectionWorker
+from edm_wizard.utils.ai_cache import get_ai_cache
+from edm_wizard.utils.data_processing import LazyExcelSheets, sheet_columns
+from edm_wizard.ui.components.custom_widgets import DataFrameTableModel, NoScrollComboBox, bulk_table_update
+
+# Mapping table column holding the dropdown for each mapping field
+MAPPING_FIELD_COLUMNS = {
+    'MFG': 2,
+    'MFG_PN': 3,
+    'MFG_PN_2': 4,
+    'Part_Number': 5,
+    'Description': 6
+}
 
 
 
@@ -117,6 +128,13 @@ class ColumnMappingPage(QWizardPage):
         """)
         ai_layout.addWidget(self.ai_detect_btn)
 
+        self.ignore_ai_cache_checkbox = QCheckBox("Ignore AI cache")
+        self.ignore_ai_cache_checkbox.setToolTip(
+            "Re-query Claude AI even for sheets analyzed in a previous run.\n"
+            "Fresh results replace the cached ones."
+        )
+        ai_layout.addWidget(self.ignore_ai_cache_checkbox)
+
         self.ai_status = QLabel("")
         ai_layout.addWidget(self.ai_status)
         ai_layout.addStretch()
@@ -133,10 +151,34 @@ class ColumnMappingPage(QWizardPage):
         self.mapping_table.setHorizontalHeaderLabels([
             "Include", "Sheet Name", "MFG Column", "MFG PN Column", "MFG PN Column 2", "Part Number Column", "Description Column", "Actions"
         ])
-        self.mapping_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Fixed, user-resizable widths: ResizeToContents re-measures every cell
+        # widget whenever the table changes
+        mapping_header = self.mapping_table.horizontalHeader()
+        mapping_header.setSectionResizeMode(QHeaderView.Interactive)
+        mapping_header.setDefaultSectionSize(140)
+        self.mapping_table.setColumnWidth(0, 60)  # Include checkbox
         self.mapping_table.setSelectionBehavior(QTableWidget.SelectRows)
         self.mapping_table.setSelectionMode(QTableWidget.SingleSelection)
         self.mapping_table.setSortingEnabled(True)  # Enable sorting
+        # Style the per-row Auto-Detect buttons once here rather than parsing
+        # a style sheet for every button created
+        self.mapping_table.setStyleSheet("""
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                font-weight: bold;
+                padding: 5px 10px;
+                border-radius: 3px;
+                font-size: 10pt;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+                color: #666666;
+            }
+        """)
         self.mapping_table.itemSelectionChanged.connect(self.on_sheet_selected)
 
         # Save/Load configuration and Toggle Select All button
@@ -230,8 +272,12 @@ class ColumnMappingPage(QWizardPage):
         self.preview_label.setStyleSheet("font-weight: bold;")
         preview_layout.addWidget(self.preview_label)
 
-        self.preview_table = QTableWidget()
+        self.preview_model = DataFrameTableModel()
+        self.preview_table = QTableView()
+        self.preview_table.setModel(self.preview_model)
+        self.preview_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.preview_table.setSortingEnabled(True)  # Enable sorting
+        self.preview_table.horizontalHeader().setDefaultSectionSize(140)
         preview_layout.addWidget(self.preview_table)
 
         preview_group.setLayout(preview_layout)
@@ -254,7 +300,10 @@ class ColumnMappingPage(QWizardPage):
 
         self.sheet_mappings = {}
         self.dataframes = {}
+        self.column_choices = {}  # sheet name -> [""] + column names, filled by populate_mapping_table
+        self.mapping_rows = {}  # sheet name -> widgets of its mapping table row, filled by populate_mapping_table
         self.combined_data = None  # Will store combined dataframe for PAS Search
+        self.persistent_ai_cache = get_ai_cache()  # On-disk cache of AI column mappings across runs
 
         # Set recommended defaults for filters
         self.filter_mfg.setChecked(False)  # Require MFG by default
@@ -285,9 +334,7 @@ class ColumnMappingPage(QWizardPage):
         if not dataframes:
             excel_path = prev_page.get_excel_path()
             if excel_path:
-                xl_file = pd.ExcelFile(excel_path)
-                dataframes = {sheet: pd.read_excel(excel_path, sheet_name=sheet)
-                            for sheet in xl_file.sheet_names}
+                dataframes = LazyExcelSheets(excel_path)
 
         self.dataframes = dataframes
         self.populate_mapping_table(dataframes)
@@ -300,27 +347,25 @@ class ColumnMappingPage(QWizardPage):
         """Enable or disable per-row action buttons based on API key availability"""
         enabled = bool(self.api_key and ANTHROPIC_AVAILABLE)
 
-        for row in range(self.mapping_table.rowCount()):
-            action_btn = self.mapping_table.cellWidget(row, 7)
-            if action_btn:
-                action_btn.setEnabled(enabled)
-                if not enabled:
-                    if not ANTHROPIC_AVAILABLE:
-                        action_btn.setToolTip("Anthropic package not installed")
-                    elif not self.api_key:
-                        action_btn.setToolTip("No API key provided. Please configure in the Start page.")
-                else:
-                    action_btn.setToolTip("Auto-detect column mappings for this sheet using AI")
+        for row_widgets in self.mapping_rows.values():
+            action_btn = row_widgets['action_btn']
+            action_btn.setEnabled(enabled)
+            if not enabled:
+                if not ANTHROPIC_AVAILABLE:
+                    action_btn.setToolTip("Anthropic package not installed")
+                elif not self.api_key:
+                    action_btn.setToolTip("No API key provided. Please configure in the Start page.")
+            else:
+                action_btn.setToolTip("Auto-detect column mappings for this sheet using AI")
 
     def populate_bulk_column_names(self):
         """Populate bulk assign dropdown with all available columns"""
-        all_columns = set()
-        for df in self.dataframes.values():
-            all_columns.update(df.columns.tolist())
+        # One set union over the cached header lists; the blank choice is re-added first
+        all_columns = set().union(*self.column_choices.values())
+        all_columns.discard("")
 
         self.bulk_column_name.clear()
-        self.bulk_column_name.addItem("")
-        self.bulk_column_name.addItems(sorted(all_columns))
+        self.bulk_column_name.addItems([""] + sorted(all_columns))
 
     def apply_bulk_assignment(self):
         """Apply bulk column assignment to all sheets"""
@@ -331,28 +376,25 @@ class ColumnMappingPage(QWizardPage):
             QMessageBox.warning(self, "No Selection", "Please select a column name to assign.")
             return
 
-        # Map column type to table column index
-        # Columns: Include(0), Sheet Name(1), MFG(2), MFG PN(3), MFG PN 2(4), Part Number(5), Description(6)
+        # Map column type to mapping field
         type_map = {
-            "MFG": 2,
-            "MFG PN": 3,
-            "MFG PN 2": 4,
-            "Part Number": 5,
-            "Description": 6
+            "MFG": "MFG",
+            "MFG PN": "MFG_PN",
+            "MFG PN 2": "MFG_PN_2",
+            "Part Number": "Part_Number",
+            "Description": "Description"
         }
-        col_idx = type_map.get(column_type)
+        field = type_map.get(column_type)
 
-        if col_idx is None:
+        if field is None:
             return
 
         # Apply to all rows
-        for row in range(self.mapping_table.rowCount()):
-            combo = self.mapping_table.cellWidget(row, col_idx)
-            if combo:
-                # Check if this column exists in this sheet
-                index = combo.findText(column_name)
-                if index >= 0:
-                    combo.setCurrentIndex(index)
+        for sheet_name, row_widgets in self.mapping_rows.items():
+            # Check if this column exists in this sheet
+            columns = self.column_choices[sheet_name]
+            if column_name in columns:
+                row_widgets['combos'][field].setCurrentIndex(columns.index(column_name))
 
         QMessageBox.information(self, "Bulk Assign Complete",
                                f"Assigned '{column_name}' to {column_type} for all applicable sheets.")
@@ -361,12 +403,8 @@ class ColumnMappingPage(QWizardPage):
         """Toggle all sheets (select all or unselect all based on button state)"""
         is_checked = self.toggle_select_btn.isChecked()
 
-        for row in range(self.mapping_table.rowCount()):
-            include_widget = self.mapping_table.cellWidget(row, 0)
-            if include_widget:
-                checkbox = include_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.setChecked(is_checked)
+        for row_widgets in self.mapping_rows.values():
+            row_widgets['include'].setChecked(is_checked)
 
         # Update button text based on state
         if is_checked:
@@ -397,85 +435,73 @@ class ColumnMappingPage(QWizardPage):
             f"Preview: {sheet_name} ({len(df)} total rows, showing first {len(preview_df)})"
         )
 
-        # Populate preview table
-        self.preview_table.setRowCount(len(preview_df))
-        self.preview_table.setColumnCount(len(preview_df.columns))
-        self.preview_table.setHorizontalHeaderLabels(preview_df.columns.tolist())
-
-        for i in range(len(preview_df)):
-            for j in range(len(preview_df.columns)):
-                value = preview_df.iloc[i, j]
-                item = QTableWidgetItem(str(value) if pd.notna(value) else "")
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.preview_table.setItem(i, j, item)
-
-        self.preview_table.resizeColumnsToContents()
+        # Populate preview table (cells are rendered on demand by the model)
+        self.preview_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.preview_model.set_dataframe(preview_df)
 
     def populate_mapping_table(self, dataframes):
         """Populate the mapping table with sheets and column dropdowns"""
-        self.mapping_table.setRowCount(len(dataframes))
-
-        for row, (sheet_name, df) in enumerate(dataframes.items()):
-            # Include checkbox
-            include_checkbox = QCheckBox()
-            include_checkbox.setChecked(True)
-            include_widget = QWidget()
-            include_layout = QHBoxLayout(include_widget)
-            include_layout.addWidget(include_checkbox)
-            include_layout.setAlignment(Qt.AlignCenter)
-            include_layout.setContentsMargins(0, 0, 0, 0)
-            self.mapping_table.setCellWidget(row, 0, include_widget)
-
-            # Sheet name
-            sheet_item = QTableWidgetItem(sheet_name)
-            sheet_item.setFlags(sheet_item.flags() & ~Qt.ItemIsEditable)
-            self.mapping_table.setItem(row, 1, sheet_item)
-
-            columns = [""] + df.columns.tolist()
-
-            # Create dropdowns for each mapping type
-            for col_idx, mapping_type in enumerate(["MFG", "MFG_PN", "MFG_PN_2", "Part_Number", "Description"], 2):
-                combo = NoScrollComboBox()
-                combo.addItems(columns)
-                combo.setProperty("sheet_name", sheet_name)
-                combo.setProperty("mapping_type", mapping_type)
-                self.mapping_table.setCellWidget(row, col_idx, combo)
-
-            # Add auto-detect action button
-            action_btn = QPushButton("🤖 Auto-Detect")
-            action_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    font-weight: bold;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                    font-size: 10pt;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-                QPushButton:disabled {
-                    background-color: #cccccc;
-                    color: #666666;
+        # Dropdown choices are built once per sheet and reused for every mapping column
+        self.column_choices = {
+            sheet_name: [""] + sheet_columns(dataframes, sheet_name) for sheet_name in dataframes
+        }
+
+        self.mapping_rows = {}
+
+        with bulk_table_update(self.mapping_table):
+            # Size the table once; rows are filled while repaints, signals
+            # and sorting are suspended
+            self.mapping_table.setRowCount(len(dataframes))
+
+            for row, sheet_name in enumerate(dataframes):
+                # Include checkbox
+                include_checkbox = QCheckBox()
+                include_checkbox.setChecked(True)
+                include_widget = QWidget()
+                include_layout = QHBoxLayout(include_widget)
+                include_layout.addWidget(include_checkbox)
+                include_layout.setAlignment(Qt.AlignCenter)
+                include_layout.setContentsMargins(0, 0, 0, 0)
+                self.mapping_table.setCellWidget(row, 0, include_widget)
+
+                # Sheet name
+                sheet_item = QTableWidgetItem(sheet_name)
+                sheet_item.setFlags(sheet_item.flags() & ~Qt.ItemIsEditable)
+                self.mapping_table.setItem(row, 1, sheet_item)
+
+                columns = self.column_choices[sheet_name]
+
+                # Create dropdowns for each mapping type
+                combos = {}
+                for mapping_type, col_idx in MAPPING_FIELD_COLUMNS.items():
+                    combo = NoScrollComboBox()
+                    combo.addItems(columns)
+                    combo.setProperty("sheet_name", sheet_name)
+                    combo.setProperty("mapping_type", mapping_type)
+                    self.mapping_table.setCellWidget(row, col_idx, combo)
+                    combos[mapping_type] = combo
+
+                # Add auto-detect action button
+                action_btn = QPushButton("🤖 Auto-Detect")
+                action_btn.setProperty("sheet_name", sheet_name)
+                # Rows move when the table is sorted, so the button is bound to its sheet
+                action_btn.clicked.connect(lambda checked, name=sheet_name: self.auto_detect_single_row(name))
+                action_btn.setToolTip("Auto-detect column mappings for this sheet using AI")
+                self.mapping_table.setCellWidget(row, 7, action_btn)
+
+                # Keep direct references so later lookups skip cellWidget/findChild
+                self.mapping_rows[sheet_name] = {
+                    'include': include_checkbox,
+                    'combos': combos,
+                    'action_btn': action_btn
                 }
-            """)
-            action_btn.setProperty("sheet_name", sheet_name)
-            action_btn.setProperty("row_index", row)
-            action_btn.clicked.connect(lambda checked, r=row: self.auto_detect_single_row(r))
-            action_btn.setToolTip("Auto-detect column mappings for this sheet using AI")
-            self.mapping_table.setCellWidget(row, 7, action_btn)
 
     def get_included_sheets(self):
         """Get list of sheets that are checked for inclusion"""
-        included = []
-        for row in range(self.mapping_table.rowCount()):
-            include_widget = self.mapping_table.cellWidget(row, 0)
-            checkbox = include_widget.findChild(QCheckBox)
-            if checkbox and checkbox.isChecked():
-                sheet_name = self.mapping_table.item(row, 1).text()
-                included.append(sheet_name)
-        return included
+        return [
+            sheet_name for sheet_name, row_widgets in self.mapping_rows.items()
+            if row_widgets['include'].isChecked()
+        ]
 
     def save_configuration(self):
         """Save current column mappings to a JSON file"""
@@ -510,33 +536,28 @@ class ColumnMappingPage(QWizardPage):
             return
 
         try:
-            with open(file_path, 'r') as f:
+            with open(file_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
 
             mappings = config.get('mappings', {})
 
             # Apply loaded mappings to table
-            for row in range(self.mapping_table.rowCount()):
-                sheet_name = self.mapping_table.item(row, 1).text()
-
+            for sheet_name, row_widgets in self.mapping_rows.items():
                 if sheet_name in mappings:
                     sheet_config = mappings[sheet_name]
+                    columns = self.column_choices[sheet_name]
 
                     # Set each dropdown
-                    for col_idx, key in enumerate(['MFG', 'MFG_PN', 'MFG_PN_2', 'Part_Number', 'Description'], 2):
-                        combo = self.mapping_table.cellWidget(row, col_idx)
-                        if combo and key in sheet_config:
-                            value = sheet_config[key]
-                            index = combo.findText(value)
-                            if index >= 0:
-                                combo.setCurrentIndex(index)
+                    for key, combo in row_widgets['combos'].items():
+                        if key in sheet_config and sheet_config[key] in columns:
+                            combo.setCurrentIndex(columns.index(sheet_config[key]))
 
             QMessageBox.information(self, "Success", "Configuration loaded successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load configuration:\n{str(e)}")
 
-    def auto_detect_single_row(self, row):
-        """Auto-detect column mappings for a single row using AI"""
+    def auto_detect_single_row(self, sheet_name):
+        """Auto-detect column mappings for a single sheet's row using AI"""
         if not self.api_key or not ANTHROPIC_AVAILABLE:
             QMessageBox.warning(
                 self,
@@ -545,13 +566,6 @@ class ColumnMappingPage(QWizardPage):
             )
             return
 
-        # Get sheet name for this row
-        sheet_item = self.mapping_table.item(row, 1)
-        if not sheet_item:
-            return
-
-        sheet_name = sheet_item.text()
-
         # Get the dataframe for this sheet
         if sheet_name not in self.dataframes:
             QMessageBox.warning(
@@ -562,10 +576,9 @@ class ColumnMappingPage(QWizardPage):
             return
 
         # Get the action button for this row
-        action_btn = self.mapping_table.cellWidget(row, 7)
-        if action_btn:
-            action_btn.setEnabled(False)
-            action_btn.setText("⏳ Detecting...")
+        action_btn = self.mapping_rows[sheet_name]['action_btn']
+        action_btn.setEnabled(False)
+        action_btn.setText("⏳ Detecting...")
 
         # Get selected model from StartPage
         start_page = self.wizard().page(0)
@@ -579,60 +592,21 @@ class ColumnMappingPage(QWizardPage):
             model
         )
 
-        # Connect signals with row information
-        self.single_sheet_worker.finished.connect(
-            lambda sname, mapping, r=row: self.on_single_sheet_finished(r, sname, mapping)
-        )
-        self.single_sheet_worker.error.connect(
-            lambda sname, error, r=row: self.on_single_sheet_error(r, sname, error)
-        )
+        # Signals carry the sheet name, which identifies the row
+        self.single_sheet_worker.finished.connect(self.on_single_sheet_finished)
+        self.single_sheet_worker.error.connect(self.on_single_sheet_error)
 
         self.single_sheet_worker.start()
 
-    def on_single_sheet_finished(self, row, sheet_name, mapping):
+    def on_single_sheet_finished(self, sheet_name, mapping):
         """Handle completion of single sheet auto-detection"""
-        # Column index mapping
-        col_map = {
-            'MFG': 2,
-            'MFG_PN': 3,
-            'MFG_PN_2': 4,
-            'Part_Number': 5,
-            'Description': 6
-        }
-
         # Apply mappings to this row
-        for field, col_idx in col_map.items():
-            if field in mapping:
-                mapping_info = mapping[field]
-                column_name = mapping_info.get('column')
-                confidence = mapping_info.get('confidence', 0)
-
-                combo = self.mapping_table.cellWidget(row, col_idx)
-                if combo and column_name:
-                    # Find and set the column
-                    index = combo.findText(column_name)
-                    if index >= 0:
-                        combo.setCurrentIndex(index)
-
-                        # Apply color coding based on confidence
-                        if confidence >= 80:
-                            # High confidence - green
-                            combo.setStyleSheet("background-color: #c8e6c9;")
-                        elif confidence >= 50:
-                            # Medium confidence - yellow
-                            combo.setStyleSheet("background-color: #fff9c4;")
-                        else:
-                            # Low confidence - orange
-                            combo.setStyleSheet("background-color: #ffe0b2;")
-
-                        # Add tooltip with confidence score
-                        combo.setToolTip(f"AI Confidence: {confidence}%")
+        self.apply_ai_mapping(sheet_name, mapping)
 
         # Re-enable the action button
-        action_btn = self.mapping_table.cellWidget(row, 7)
-        if action_btn:
-            action_btn.setEnabled(True)
-            action_btn.setText("🤖 Auto-Detect")
+        action_btn = self.mapping_rows[sheet_name]['action_btn']
+        action_btn.setEnabled(True)
+        action_btn.setText("🤖 Auto-Detect")
 
         # Show success message with confidence info
         QMessageBox.information(
@@ -646,13 +620,12 @@ class ColumnMappingPage(QWizardPage):
             "Hover over dropdowns to see confidence scores."
         )
 
-    def on_single_sheet_error(self, row, sheet_name, error_msg):
+    def on_single_sheet_error(self, sheet_name, error_msg):
         """Handle error from single sheet auto-detection"""
         # Re-enable the action button
-        action_btn = self.mapping_table.cellWidget(row, 7)
-        if action_btn:
-            action_btn.setEnabled(True)
-            action_btn.setText("🤖 Auto-Detect")
+        action_btn = self.mapping_rows[sheet_name]['action_btn']
+        action_btn.setEnabled(True)
+        action_btn.setText("🤖 Auto-Detect")
 
         QMessageBox.critical(
             self,
@@ -660,6 +633,46 @@ class ColumnMappingPage(QWizardPage):
             f"Failed to auto-detect columns for '{sheet_name}':\n{error_msg}"
         )
 
+    def apply_ai_mapping(self, sheet_name, sheet_mapping):
+        """Select AI-detected columns in a sheet's dropdowns and color them by confidence"""
+        # All dropdowns of a row share the sheet's choices, so one lookup
+        # table replaces a findText scan per dropdown
+        column_index = {}
+        for index, name in enumerate(self.column_choices.get(sheet_name, [])):
+            column_index.setdefault(name, index)
+
+        for field, combo in self.mapping_rows[sheet_name]['combos'].items():
+            if field not in sheet_mapping:
+                continue
+            mapping_info = sheet_mapping[field]
+            column_name = mapping_info.get('column')
+            confidence = mapping_info.get('confidence', 0)
+
+            index = column_index.get(column_name, -1) if column_name else -1
+            if index >= 0:
+                combo.setCurrentIndex(index)
+
+                # Apply color coding based on confidence
+                if confidence >= 80:
+                    color = "#c8e6c9"  # High confidence - green
+                elif confidence >= 50:
+                    color = "#fff9c4"  # Medium confidence - yellow
+                else:
+                    color = "#ffe0b2"  # Low confidence - orange
+                combo.setStyleSheet(f"background-color: {color};")
+
+                # Add tooltip with confidence score
+                combo.setToolTip(f"AI Confidence: {confidence}%")
+
+    def set_mapping_controls_enabled(self, enabled):
+        """Enable or disable every mapping dropdown and per-row action button"""
+        with bulk_table_update(self.mapping_table):
+            for row_widgets in self.mapping_rows.values():
+                for combo in row_widgets['combos'].values():
+                    combo.setEnabled(enabled)
+                # Per-row action button
+                row_widgets['action_btn'].setEnabled(enabled)
+
     def auto_detect_with_ai(self):
         """Use Claude AI to automatically detect column mappings"""
         if not self.api_key or not ANTHROPIC_AVAILABLE:
@@ -688,15 +701,7 @@ class ColumnMappingPage(QWizardPage):
         self.load_config_btn.setEnabled(False)
 
         # Disable all dropdowns and action buttons in the mapping table
-        for row in range(self.mapping_table.rowCount()):
-            for col in range(2, 7):  # Columns 2-6 are the dropdowns
-                combo = self.mapping_table.cellWidget(row, col)
-                if combo:
-                    combo.setEnabled(False)
-            # Disable per-row action button
-            action_btn = self.mapping_table.cellWidget(row, 7)
-            if action_btn:
-                action_btn.setEnabled(False)
+        self.set_mapping_controls_enabled(False)
 
         self.ai_status.setText("🔄 Starting AI analysis...")
         self.ai_status.setStyleSheet("color: blue;")
@@ -706,7 +711,13 @@ class ColumnMappingPage(QWizardPage):
         model = start_page.get_selected_model() if hasattr(start_page, 'get_selected_model') else "claude-sonnet-4-5-20250929"
 
         # Create and start AI detection thread
-        self.ai_thread = AIDetectionThread(self.api_key, self.dataframes, model)
+        self.ai_thread = AIDetectionThread(
+            self.api_key,
+            self.dataframes,
+            model,
+            ai_cache=self.persistent_ai_cache,
+            ignore_cache=self.ignore_ai_cache_checkbox.isChecked()
+        )
         self.ai_thread.progress.connect(self.on_ai_progress)
         self.ai_thread.finished.connect(self.on_ai_finished)
         self.ai_thread.error.connect(self.on_ai_error)
@@ -722,47 +733,10 @@ class ColumnMappingPage(QWizardPage):
         # Apply mappings to table with confidence indicators
         self.ai_status.setText("✅ Applying mappings...")
 
-        for row in range(self.mapping_table.rowCount()):
-            sheet_name = self.mapping_table.item(row, 1).text()
-
-            if sheet_name in all_mappings:
-                sheet_mapping = all_mappings[sheet_name]
-
-                # Column index mapping
-                col_map = {
-                    'MFG': 2,
-                    'MFG_PN': 3,
-                    'MFG_PN_2': 4,
-                    'Part_Number': 5,
-                    'Description': 6
-                }
-
-                for field, col_idx in col_map.items():
-                    if field in sheet_mapping:
-                        mapping_info = sheet_mapping[field]
-                        column_name = mapping_info.get('column')
-                        confidence = mapping_info.get('confidence', 0)
-
-                        combo = self.mapping_table.cellWidget(row, col_idx)
-                        if combo and column_name:
-                            # Find and set the column
-                            index = combo.findText(column_name)
-                            if index >= 0:
-                                combo.setCurrentIndex(index)
-
-                                # Apply color coding based on confidence
-                                if confidence >= 80:
-                                    # High confidence - green
-                                    combo.setStyleSheet("background-color: #c8e6c9;")
-                                elif confidence >= 50:
-                                    # Medium confidence - yellow
-                                    combo.setStyleSheet("background-color: #fff9c4;")
-                                else:
-                                    # Low confidence - orange
-                                    combo.setStyleSheet("background-color: #ffe0b2;")
-
-                                # Add tooltip with confidence score
-                                combo.setToolTip(f"AI Confidence: {confidence}%")
+        with bulk_table_update(self.mapping_table):
+            for sheet_name, sheet_mapping in all_mappings.items():
+                if sheet_name in self.mapping_rows:
+                    self.apply_ai_mapping(sheet_name, sheet_mapping)
 
         self.ai_status.setText("✓ Auto-detection complete!")
         self.ai_status.setStyleSheet("color: green;")
@@ -774,15 +748,7 @@ class ColumnMappingPage(QWizardPage):
         self.load_config_btn.setEnabled(True)
 
         # Re-enable all dropdowns and action buttons
-        for row in range(self.mapping_table.rowCount()):
-            for col in range(2, 7):
-                combo = self.mapping_table.cellWidget(row, col)
-                if combo:
-                    combo.setEnabled(True)
-            # Re-enable per-row action button
-            action_btn = self.mapping_table.cellWidget(row, 7)
-            if action_btn:
-                action_btn.setEnabled(True)
+        self.set_mapping_controls_enabled(True)
 
         # Remove progress bar
         ai_group = self.ai_detect_btn.parent()
@@ -832,15 +798,7 @@ class ColumnMappingPage(QWizardPage):
         self.load_config_btn.setEnabled(True)
 
         # Re-enable all dropdowns and action buttons
-        for row in range(self.mapping_table.rowCount()):
-            for col in range(2, 7):
-                combo = self.mapping_table.cellWidget(row, col)
-                if combo:
-                    combo.setEnabled(True)
-            # Re-enable per-row action button
-            action_btn = self.mapping_table.cellWidget(row, 7)
-            if action_btn:
-                action_btn.setEnabled(True)
+        self.set_mapping_controls_enabled(True)
 
         # Remove progress bar
         ai_group = self.ai_detect_btn.parent()
@@ -856,20 +814,10 @@ class ColumnMappingPage(QWizardPage):
 
     def get_mappings(self):
         """Get all column mappings"""
-        mappings = {}
-
-        for row in range(self.mapping_table.rowCount()):
-            sheet_name = self.mapping_table.item(row, 1).text()
-
-            mappings[sheet_name] = {
-                'MFG': self.mapping_table.cellWidget(row, 2).currentText(),
-                'MFG_PN': self.mapping_table.cellWidget(row, 3).currentText(),
-                'MFG_PN_2': self.mapping_table.cellWidget(row, 4).currentText(),
-                'Part_Number': self.mapping_table.cellWidget(row, 5).currentText(),
-                'Description': self.mapping_table.cellWidget(row, 6).currentText()
-            }
-
-        return mappings
+        return {
+            sheet_name: {field: combo.currentText() for field, combo in row_widgets['combos'].items()}
+            for sheet_name, row_widgets in self.mapping_rows.items()
+        }
 
     def should_combine(self):
         """Check if sheets should be combined - always True (mandatory)"""
@@ -956,86 +904,52 @@ class ColumnMappingPage(QWizardPage):
         filters = self.get_filter_conditions()
         included_sheets = self.get_included_sheets()
 
-        combined_data = []
-
-        for sheet_name in included_sheets:
-            if sheet_name not in self.dataframes:
-                continue
-
-            df = self.dataframes[sheet_name]
-            df_copy = df.copy()
-            df_copy['Source_Sheet'] = sheet_name
-
-            # Get mapped columns
-            sheet_mapping = mappings[sheet_name]
-
-            # ADD new standard columns by COPYING from mapped columns (preserve originals)
-            # This keeps original column names intact and adds standardized columns
-            for key, col_name in sheet_mapping.items():
-                if col_name and key != 'MFG_PN_2':  # MFG_PN_2 is handled separately
-                    # Only add if the source column exists and target doesn't already exist
-                    if col_name in df_copy.columns:
-                        # Copy values to new standard column name
-                        df_copy[key] = df_copy[col_name]
-
-            # Handle MFG PN fallback: if MFG_PN is empty, use MFG_PN_2
-            if 'MFG_PN' in df_copy.columns and sheet_mapping.get('MFG_PN_2'):
-                mfg_pn_2_col = sheet_mapping['MFG_PN_2']
-                if mfg_pn_2_col in df.columns:
-                    # Fill empty MFG_PN with values from MFG_PN_2
-                    empty_mask = df_copy['MFG_PN'].isna() | (df_copy['MFG_PN'].astype(str).str.strip() == '')
-                    df_copy.loc[empty_mask, 'MFG_PN'] = df[mfg_pn_2_col]
-
-            # Handle TBD fill: if MFG_PN is not empty but MFG is empty, set MFG to 'TBD'
-            if filters.get('Fill_TBD') and 'MFG' in df_copy.columns and 'MFG_PN' in df_copy.columns:
-                mfg_pn_filled = df_copy['MFG_PN'].notna() & (df_copy['MFG_PN'].astype(str).str.strip() != '')
-                mfg_empty = df_copy['MFG'].isna() | (df_copy['MFG'].astype(str).str.strip() == '')
-                df_copy.loc[mfg_pn_filled & mfg_empty, 'MFG'] = 'TBD'
-
-            # Apply filters using the NEW standard column names
-            mask = pd.Series([True] * len(df_copy))
-
-            if filters['MFG'] and 'MFG' in df_copy.columns:
-                mask &= df_copy['MFG'].notna() & (df_copy['MFG'].astype(str).str.strip() != '')
-
-            if filters['MFG_PN'] and 'MFG_PN' in df_copy.columns:
-                mask &= df_copy['MFG_PN'].notna() & (df_copy['MFG_PN'].astype(str).str.strip() != '')
-
-            if filters['Part_Number'] and 'Part_Number' in df_copy.columns:
-                mask &= df_copy['Part_Number'].notna() & (df_copy['Part_Number'].astype(str).str.strip() != '')
-
-            if filters['Description'] and 'Description' in df_copy.columns:
-                mask &= df_copy['Description'].notna() & (df_copy['Description'].astype(str).str.strip() != '')
-
-            df_filtered = df_copy[mask]
-
-            if len(df_filtered) > 0:
-                combined_data.append(df_filtered)
-
-        if combined_data:
-            combined_df = pd.concat(combined_data, ignore_index=True)
-
+        # The Excel file is already in the output folder (from Step 1)
+        # We just need to update it by adding the Combined sheet
+        if not excel_path or not os.path.exists(excel_path):
+            raise Exception("Excel file not found. Please go back to Step 1.")
+
+        # Parsing, combining and saving run in a worker thread; a local event
+        # loop keeps the UI painting while validatePage waits for the result
+        progress_dialog = QProgressDialog("Combining sheets...", None, 0, len(included_sheets), self)
+        progress_dialog.setWindowTitle("Combining Sheets")
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setValue(0)
+
+        result = {}
+        wait_loop = QEventLoop()
+
+        def on_progress(message, current, total):
+            progress_dialog.setLabelText(message)
+            progress_dialog.setValue(current)
+
+        def on_finished(combined_df):
+            result['combined_df'] = combined_df
+            wait_loop.quit()
+
+        def on_error(error_msg):
+            result['error'] = error_msg
+            wait_loop.quit()
+
+        self.combine_thread = CombineThread(self.dataframes, mappings, included_sheets, filters, excel_path)
+        self.combine_thread.progress.connect(on_progress)
+        self.combine_thread.finished.connect(on_finished)
+        self.combine_thread.error.connect(on_error)
+        self.combine_thread.start()
+        wait_loop.exec_()
+        self.combine_thread.wait()
+        progress_dialog.close()
+
+        if 'error' in result:
+            raise Exception(result['error'])
+
+        combined_df = result['combined_df']
+
+        if not combined_df.empty:
             # Store combined data for PAS Search page to access
             self.combined_data = combined_df
 
-            # The Excel file is already in the output folder (from Step 1)
-            # We just need to update it by adding the Combined sheet
-            if not excel_path or not os.path.exists(excel_path):
-                raise Exception("Excel file not found. Please go back to Step 1.")
-
-            # Read existing sheets from the Excel file
-            with pd.ExcelFile(excel_path) as xls:
-                existing_sheets = {sheet: pd.read_excel(excel_path, sheet_name=sheet)
-                                 for sheet in xls.sheet_names}
-
-            # Add/update the Combined sheet
-            existing_sheets['Combined'] = combined_df
-
-            # Write back all sheets to the same Excel file
-            with pd.ExcelWriter(excel_path, engine='xlsxwriter') as writer:
-                for sheet_name, df in existing_sheets.items():
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-
             # Store the Excel path for later use (same file, just updated)
             self.output_excel_path = excel_path
 
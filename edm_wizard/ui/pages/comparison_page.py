@@ -11,6 +11,7 @@ from pathlib import Path
 from datetime import datetime
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:
     print("Error: pandas is required. Install it with: pip install pandas")
@@ -27,8 +28,11 @@ try:
 except ImportError:
     print("Error: PyQt5 is required. Install it with: pip install PyQt5")
 
+from edm_wizard.utils.data_processing import display_strings
+from edm_wizard.ui.components.custom_widgets import bulk_table_update
+
 try:
-    from edm_wizard.utils.xml_generation import create_mfg_xml, create_mfgpn_xml
+    from edm_wizard.utils.xml_generation import create_mfg_xml, create_mfgpn_xml, xml_header
     from edm_wizard.utils.constants import DEFAULT_PROJECT_NAME, DEFAULT_CATALOG
     XML_AVAILABLE = True
 except ImportError:
@@ -191,6 +195,8 @@ class ComparisonPage(QWizardPage):
         # Store data
         self.original_df = None
         self.new_df = None
+        self.original_text = None  # Display strings of original_df, set by build_comparison
+        self.new_text = None  # Display strings of new_df, set by build_comparison
         self.all_rows = []
         self.syncing_scroll = False  # Prevent scroll recursion
 
@@ -312,31 +318,20 @@ class ComparisonPage(QWizardPage):
             self.original_df = self.original_df[mapped_columns]
             self.new_df = self.new_df[mapped_columns]
 
-            # Build row comparison data
-            self.all_rows = []
-            max_rows = max(len(self.original_df), len(self.new_df))
-
-            changed_count = 0
-            for i in range(max_rows):
-                row_changed = False
-                if i < len(self.original_df) and i < len(self.new_df):
-                    # Compare each cell (only mapped columns)
-                    for col in mapped_columns:
-                        old_val = str(self.original_df.iloc[i][col]) if pd.notna(self.original_df.iloc[i][col]) else ""
-                        new_val = str(self.new_df.iloc[i][col]) if pd.notna(self.new_df.iloc[i][col]) else ""
-                        if old_val != new_val:
-                            row_changed = True
-                            break
-                else:
-                    row_changed = True  # Row exists in one but not the other
+            # Convert both sides to display text once; comparisons, table
+            # population and exports all work on these arrays
+            self.original_text = display_strings(self.original_df)
+            self.new_text = display_strings(self.new_df)
 
-                if row_changed:
-                    changed_count += 1
+            # Build row comparison data: compare the overlapping rows cell by
+            # cell in one array operation; extra rows on either side are changes
+            max_rows = max(len(self.original_df), len(self.new_df))
+            common = min(len(self.original_df), len(self.new_df))
+            changed = [True] * max_rows
+            changed[:common] = (self.original_text[:common] != self.new_text[:common]).any(axis=1).tolist()
 
-                self.all_rows.append({
-                    'index': i,
-                    'changed': row_changed
-                })
+            self.all_rows = [{'index': i, 'changed': row_changed} for i, row_changed in enumerate(changed)]
+            changed_count = sum(changed)
 
             # Update summary
             total = len(self.all_rows)
@@ -378,52 +373,53 @@ class ComparisonPage(QWizardPage):
         self.right_table.setColumnCount(len(columns))
         self.right_table.setHorizontalHeaderLabels(display_headers)
 
-        # Set row counts
-        self.left_table.setRowCount(len(display_rows))
-        self.right_table.setRowCount(len(display_rows))
-
-        # Populate rows with Beyond Compare styling
-        for display_idx, row_info in enumerate(display_rows):
-            i = row_info['index']
-            row_changed = row_info['changed']
-
-            # Populate left table (original)
-            if i < len(self.original_df):
-                for col_idx, col in enumerate(columns):
-                    old_val = str(self.original_df.iloc[i][col]) if pd.notna(self.original_df.iloc[i][col]) else ""
-                    item = QTableWidgetItem(old_val)
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                    # Compare with new value for cell-level highlighting
-                    if i < len(self.new_df):
-                        new_val = str(self.new_df.iloc[i][col]) if pd.notna(self.new_df.iloc[i][col]) else ""
-                        if old_val != new_val:
+        original_text = self.original_text
+        new_text = self.new_text
+        original_rows = len(original_text)
+        new_rows = len(new_text)
+
+        with bulk_table_update(self.left_table, self.right_table):
+            # Set row counts
+            self.left_table.setRowCount(len(display_rows))
+            self.right_table.setRowCount(len(display_rows))
+
+            # Populate rows with Beyond Compare styling
+            for display_idx, row_info in enumerate(display_rows):
+                i = row_info['index']
+                old_row = original_text[i] if i < original_rows else None
+                new_row = new_text[i] if i < new_rows else None
+
+                # Populate left table (original)
+                if old_row is not None:
+                    for col_idx, old_val in enumerate(old_row):
+                        item = QTableWidgetItem(old_val)
+                        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+
+                        # Compare with new value for cell-level highlighting
+                        if new_row is not None and old_val != new_row[col_idx]:
                             # Cell changed - light red background, bold font
                             item.setBackground(QColor(255, 200, 200))  # Light red
                             font = item.font()
                             font.setBold(True)
                             item.setFont(font)
 
-                    self.left_table.setItem(display_idx, col_idx, item)
+                        self.left_table.setItem(display_idx, col_idx, item)
 
-            # Populate right table (new)
-            if i < len(self.new_df):
-                for col_idx, col in enumerate(columns):
-                    new_val = str(self.new_df.iloc[i][col]) if pd.notna(self.new_df.iloc[i][col]) else ""
-                    item = QTableWidgetItem(new_val)
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                # Populate right table (new)
+                if new_row is not None:
+                    for col_idx, new_val in enumerate(new_row):
+                        item = QTableWidgetItem(new_val)
+                        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
 
-                    # Compare with old value for cell-level highlighting
-                    if i < len(self.original_df):
-                        old_val = str(self.original_df.iloc[i][col]) if pd.notna(self.original_df.iloc[i][col]) else ""
-                        if old_val != new_val:
+                        # Compare with old value for cell-level highlighting
+                        if old_row is not None and old_row[col_idx] != new_val:
                             # Cell changed - light green background, bold font
                             item.setBackground(QColor(200, 255, 200))  # Light green
                             font = item.font()
                             font.setBold(True)
                             item.setFont(font)
 
-                    self.right_table.setItem(display_idx, col_idx, item)
+                        self.right_table.setItem(display_idx, col_idx, item)
 
         # Resize columns to fit content
         self.left_table.resizeColumnsToContents()
@@ -433,6 +429,26 @@ class ComparisonPage(QWizardPage):
         """Re-populate tables based on filter selection"""
         self.populate_tables()
 
+    def build_export_rows(self):
+        """
+        Interleave original and new display text column by column for export
+
+        Uses the display text built by build_comparison, where both sides
+        were reduced to the same mapped columns. The shorter side is padded
+        with empty strings.
+
+        Returns:
+            2D object ndarray with columns Original col1, New col1, Original col2, ...
+        """
+        original_text = self.original_text
+        new_text = self.new_text
+        max_rows = max(len(original_text), len(new_text))
+
+        rows = np.full((max_rows, 2 * original_text.shape[1]), '', dtype=object)
+        rows[:len(original_text), 0::2] = original_text
+        rows[:len(new_text), 1::2] = new_text
+        return rows
+
     def export_to_csv(self):
         """Export comparison to CSV"""
         try:
@@ -459,15 +475,7 @@ class ComparisonPage(QWizardPage):
                 writer.writerow(header)
 
                 # Write rows
-                max_rows = max(len(self.original_df), len(self.new_df))
-                for i in range(max_rows):
-                    row = []
-                    for col in columns:
-                        old_val = str(self.original_df.iloc[i][col]) if i < len(self.original_df) and pd.notna(self.original_df.iloc[i][col]) else ""
-                        new_val = str(self.new_df.iloc[i][col]) if i < len(self.new_df) and pd.notna(self.new_df.iloc[i][col]) else ""
-                        row.append(old_val)
-                        row.append(new_val)
-                    writer.writerow(row)
+                writer.writerows(self.build_export_rows().tolist())
 
             self.export_status.setText(f"Exported to: {csv_path.name}")
             self.export_status.setStyleSheet("color: green;")
@@ -490,20 +498,12 @@ class ComparisonPage(QWizardPage):
             excel_path = Path(output_folder) / f"Comparison_{timestamp}.xlsx"
 
             # Create comparison DataFrame
-            columns = list(self.original_df.columns)
-            export_data = []
-
-            max_rows = max(len(self.original_df), len(self.new_df))
-            for i in range(max_rows):
-                row = {}
-                for col in columns:
-                    old_val = str(self.original_df.iloc[i][col]) if i < len(self.original_df) and pd.notna(self.original_df.iloc[i][col]) else ""
-                    new_val = str(self.new_df.iloc[i][col]) if i < len(self.new_df) and pd.notna(self.new_df.iloc[i][col]) else ""
-                    row[f"Original {self.get_display_column_name(col)}"] = old_val
-                    row[f"New {self.get_display_column_name(col)}"] = new_val
-                export_data.append(row)
+            header = []
+            for col in self.original_df.columns:
+                header.append(f"Original {self.get_display_column_name(col)}")
+                header.append(f"New {self.get_display_column_name(col)}")
 
-            df = pd.DataFrame(export_data)
+            df = pd.DataFrame(self.build_export_rows(), columns=header)
 
             # Write to Excel
             df.to_excel(excel_path, index=False, engine='xlsxwriter')
@@ -998,12 +998,13 @@ class ComparisonPage(QWizardPage):
             project_name = self.project_name_input.text().strip() or DEFAULT_PROJECT_NAME
             catalog = self.catalog_input.text().strip() or DEFAULT_CATALOG
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            header = xml_header(project_name)
 
             # Export MFG XML
             manufacturers = self.new_df['MFG'].dropna().unique().tolist()
             manufacturers = [m for m in manufacturers if str(m).strip()]
             mfg_xml_path = Path(output_folder) / f"MFG_{timestamp}.xml"
-            mfg_count = create_mfg_xml(manufacturers, str(mfg_xml_path), project_name, catalog)
+            mfg_count = create_mfg_xml(manufacturers, str(mfg_xml_path), project_name, catalog, header=header)
 
             # Export MFG PN XML
             mfgpn_data = []
@@ -1020,7 +1021,7 @@ class ComparisonPage(QWizardPage):
                     })
 
             mfgpn_xml_path = Path(output_folder) / f"MFGPN_{timestamp}.xml"
-            mfgpn_count = create_mfgpn_xml(mfgpn_data, str(mfgpn_xml_path), project_name, catalog)
+            mfgpn_count = create_mfgpn_xml(mfgpn_data, str(mfgpn_xml_path), project_name, catalog, header=header)
 
             self.dialog_status.setText(
                 f"✓ Exported:\n"
@@ -11,7 +11,7 @@ import shutil
 try:
     from PyQt5.QtWidgets import (
         QWizardPage, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QLineEdit,
-        QPushButton, QFileDialog, QComboBox, QTableWidget, QTableWidgetItem,
+        QPushButton, QFileDialog, QComboBox, QTableView,
         QProgressBar, QMessageBox
     )
     from PyQt5.QtCore import Qt, QThread, pyqtSignal
@@ -20,7 +20,12 @@ except ImportError:
     sys.exit(1)
 
 from edm_wizard.workers.threads import AccessExportThread, SQLiteExportThread
+from edm_wizard.utils.data_processing import LazyExcelSheets, create_access_engine, load_parquet_cache
+from edm_wizard.ui.components.custom_widgets import DataFrameTableModel
+from edm_wizard.utils.constants import EXCEL_INVALID_SHEET_CHARS, EXCEL_MAX_SHEET_NAME_LENGTH
 
+# Replaces every invalid sheet name character with '_' in one str.translate pass
+_SHEET_NAME_REPLACE_TABLE = str.maketrans(dict.fromkeys(EXCEL_INVALID_SHEET_CHARS, '_'))
 
 
 class DataSourcePage(QWizardPage):
@@ -80,8 +85,11 @@ class DataSourcePage(QWizardPage):
         sheet_selector_layout.addStretch()
 
         self.preview_label = QLabel("No data loaded")
-        self.preview_table = QTableWidget()
+        self.preview_model = DataFrameTableModel()
+        self.preview_table = QTableView()
+        self.preview_table.setModel(self.preview_model)
         self.preview_table.setSortingEnabled(True)  # Enable sorting
+        self.preview_table.horizontalHeader().setDefaultSectionSize(140)
 
         preview_layout.addLayout(sheet_selector_layout)
         preview_layout.addWidget(self.preview_label)
@@ -104,6 +112,7 @@ class DataSourcePage(QWizardPage):
         # Store data
         self.exported_excel_path = None
         self.dataframes = {}
+        self.engines = {}  # Access database path -> SQLAlchemy engine, reused across exports
         self.detected_file_type = None  # Will be set by auto-detection
 
     def browse_file(self):
@@ -219,17 +228,33 @@ class DataSourcePage(QWizardPage):
         self.progress_bar.setVisible(True)
         self.progress_bar.setMaximum(0)  # Indeterminate
 
-        self.export_thread = thread_class(db_file, output_file)
+        if thread_class is AccessExportThread:
+            # Re-exporting the same database reuses its pooled ODBC connections
+            try:
+                engine = self.engine_for(db_file)
+            except Exception as e:
+                self.export_error(f"Error exporting Access database: {str(e)}")
+                return
+            self.export_thread = thread_class(db_file, output_file, engine=engine)
+        else:
+            self.export_thread = thread_class(db_file, output_file)
         self.export_thread.progress.connect(self.update_progress)
         self.export_thread.finished.connect(self.export_finished)
         self.export_thread.error.connect(self.export_error)
         self.export_thread.start()
 
+    def engine_for(self, mdb_file):
+        """Return the shared SQLAlchemy engine for an Access database, creating it on first use"""
+        key = os.path.normcase(os.path.abspath(mdb_file))
+        if key not in self.engines:
+            self.engines[key] = create_access_engine(mdb_file)
+        return self.engines[key]
+
     def update_progress(self, message):
         """Update progress label"""
         self.progress_label.setText(message)
 
-    def export_finished(self, excel_path, dataframes):
+    def export_finished(self, excel_path, dataframes, unsaved_tables):
         """Handle export completion"""
         self.progress_bar.setVisible(False)
         self.action_button.setEnabled(True)
@@ -239,8 +264,21 @@ class DataSourcePage(QWizardPage):
         # Show preview
         self.show_preview(dataframes)
 
-        QMessageBox.information(self, "Export Complete",
-                               f"Database exported successfully to:\n{excel_path}")
+        if unsaved_tables:
+            # These tables are neither in the workbook nor in the Parquet cache
+            table_list = "\n".join(f"  - {table}" for table in unsaved_tables[:10])
+            if len(unsaved_tables) > 10:
+                table_list += f"\n  ... and {len(unsaved_tables) - 10} more"
+            QMessageBox.warning(
+                self, "Export Complete with Warnings",
+                f"Database exported to:\n{excel_path}\n\n"
+                f"{len(unsaved_tables)} table(s) exceed the Excel row limit and could not be saved "
+                f"to the Parquet cache:\n{table_list}\n\n"
+                "They are available in this session only and will be missing when the workbook is reloaded."
+            )
+        else:
+            QMessageBox.information(self, "Export Complete",
+                                   f"Database exported successfully to:\n{excel_path}")
 
         self.completeChanged.emit()
 
@@ -262,18 +300,18 @@ class DataSourcePage(QWizardPage):
                                    "Output folder not set. Please go back to the Welcome page and select an output folder.")
                 return
 
-            # Load the Excel file
-            xl_file = pd.ExcelFile(excel_path)
-            self.dataframes = {sheet: pd.read_excel(excel_path, sheet_name=sheet)
-                             for sheet in xl_file.sheet_names}
+            # Prefer the Parquet copy saved by a database export; otherwise open
+            # the Excel file and parse sheets when first previewed or mapped
+            self.dataframes = load_parquet_cache(excel_path) or LazyExcelSheets(excel_path)
 
             # Copy Excel file to output folder
             import shutil
             base_name = Path(excel_path).name
             output_excel = os.path.join(output_folder, base_name)
 
-            # Copy the file
-            shutil.copy2(excel_path, output_excel)
+            # Copy the file (unless it already is the file in the output folder)
+            if not (os.path.exists(output_excel) and os.path.samefile(excel_path, output_excel)):
+                shutil.copy2(excel_path, output_excel)
 
             # Store the output path (not the original path)
             self.exported_excel_path = output_excel
@@ -311,9 +349,7 @@ class DataSourcePage(QWizardPage):
             # Use filename without extension as sheet name
             sheet_name = Path(csv_path).stem
             # Clean sheet name for Excel compatibility
-            sheet_name = sheet_name[:31]  # Excel max sheet name length
-            for char in ['\\', '/', '*', '?', ':', '[', ']']:
-                sheet_name = sheet_name.replace(char, '_')
+            sheet_name = sheet_name[:EXCEL_MAX_SHEET_NAME_LENGTH].translate(_SHEET_NAME_REPLACE_TABLE)
 
             self.dataframes = {sheet_name: df}
 
@@ -370,18 +406,9 @@ class DataSourcePage(QWizardPage):
             f"Preview: {sheet_name} ({len(df)} total rows, showing first {len(preview_df)})"
         )
 
-        # Populate table
-        self.preview_table.setRowCount(len(preview_df))
-        self.preview_table.setColumnCount(len(preview_df.columns))
-        self.preview_table.setHorizontalHeaderLabels(preview_df.columns.tolist())
-
-        for i in range(len(preview_df)):
-            for j in range(len(preview_df.columns)):
-                value = preview_df.iloc[i, j]
-                item = QTableWidgetItem(str(value) if pd.notna(value) else "")
-                self.preview_table.setItem(i, j, item)
-
-        self.preview_table.resizeColumnsToContents()
+        # Populate table (cells are rendered on demand by the model)
+        self.preview_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.preview_model.set_dataframe(preview_df)
 
     def isComplete(self):
         """Check if page is complete"""
@@ -5,8 +5,10 @@ Supply Frame Review Page: Results Review and Normalization
 import sys
 import os
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import json
+from collections import defaultdict
 from datetime import datetime
 import difflib
 
@@ -30,14 +32,26 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+# rapidfuzz (compiled, same scorers) is preferred; fuzzywuzzy is the fallback
 try:
-    from fuzzywuzzy import fuzz, process
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process as fuzzy_process
     FUZZYWUZZY_AVAILABLE = True
 except ImportError:
-    FUZZYWUZZY_AVAILABLE = False
+    try:
+        from fuzzywuzzy import fuzz, process
+        from fuzzywuzzy.utils import full_process as fuzzy_process
+        FUZZYWUZZY_AVAILABLE = True
+    except ImportError:
+        FUZZYWUZZY_AVAILABLE = False
 
-from edm_wizard.utils.xml_generation import escape_xml
-from edm_wizard.workers.threads import PartialMatchAIThread, ManufacturerNormalizationAIThread
+from edm_wizard.ui.components.custom_widgets import RadioButtonDelegate, bulk_table_update
+from edm_wizard.utils.ai_cache import get_ai_cache
+from edm_wizard.utils.data_processing import truncate_for_display
+from edm_wizard.workers.threads import (
+    PartialMatchAIThread, ManufacturerNormalizationAIThread, XMLGenerationThread, get_anthropic_client,
+    strip_code_fence
+)
 
 
 
@@ -53,10 +67,19 @@ class SupplyFrameReviewPage(QWizardPage):
         self.parts_needing_review = []
         self.manufacturer_normalizations = {}
         self.normalization_reasoning = {}  # Store fuzzy/AI reasoning for each normalization
+        self.local_normalizations = {}  # Case/whitespace variants resolved without the AI
+        self.local_normalization_reasoning = {}
         self.normalization_scopes = {}  # Store selected sheets for each normalization row {row_idx: [sheet1, sheet2, ...]}
         self.original_data = []  # Store original data for comparison
         self.api_key = None
         self.ai_cache = {}  # Cache AI normalization results to ensure consistency
+        self.persistent_ai_cache = get_ai_cache()  # On-disk cache of AI suggestions across runs
+
+        # Sibling wizard pages, cached in initializePage()
+        self._start_page = None
+        self._data_page = None
+        self._mapping_page = None
+        self._pas_page = None
         
         # Initialize categorized parts lists
         self.found_parts = []
@@ -151,9 +174,26 @@ class SupplyFrameReviewPage(QWizardPage):
         """Normalize manufacturer name for case-insensitive, trimmed comparisons."""
         return str(name or '').strip().upper()
 
+    @staticmethod
+    def _match_mfg(match):
+        """Return the canonical manufacturer of a PAS match (dict or legacy 'PN@MFG' string)."""
+        if isinstance(match, dict):
+            return match.get('mfg', '').strip()
+        if isinstance(match, str) and '@' in match:
+            return match.split('@', 1)[1].strip()
+        return ''
+
     def initializePage(self):
         """Initialize by loading data from CSV file created by PASSearchPage"""
-        pas_search_page = self.wizard().page(3)  # PASSearchPage is page 3
+        # Look up sibling pages once instead of on every handler call
+        wizard = self.wizard()
+        self._start_page = wizard.page(0)
+        self._data_page = wizard.page(1)
+        self._mapping_page = wizard.page(2)  # ColumnMappingPage
+        self._pas_page = wizard.page(3)  # PASSearchPage
+        self.api_key = self._start_page.get_api_key() if hasattr(self._start_page, 'get_api_key') else None
+
+        pas_search_page = self._pas_page
 
         # Check if page exists
         if pas_search_page is None:
@@ -192,7 +232,7 @@ class SupplyFrameReviewPage(QWizardPage):
 
             # Store original data for comparison later (convert DataFrame to list of dicts)
             # Get combined_data from ColumnMappingPage (page 2), not PAS Search Page
-            column_mapping_page = self.wizard().page(2)  # ColumnMappingPage
+            column_mapping_page = self._mapping_page
             if hasattr(column_mapping_page, 'combined_data') and column_mapping_page.combined_data is not None:
                 if not column_mapping_page.combined_data.empty:
                     # Convert DataFrame to list of dictionaries for easier processing
@@ -313,7 +353,7 @@ class SupplyFrameReviewPage(QWizardPage):
         self.parts_needing_review = multiple + need_review
 
         # Enable buttons if there are parts to review
-        start_page = self.wizard().page(0)
+        start_page = self._start_page
         api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
         
         if len(multiple) > 0:
@@ -389,7 +429,7 @@ class SupplyFrameReviewPage(QWizardPage):
     def identify_normalization_candidates(self):
         """Identify manufacturers that need normalization using fuzzy matching"""
         if not FUZZYWUZZY_AVAILABLE:
-            self.norm_status.setText("⚠ Fuzzy matching not available (install fuzzywuzzy)")
+            self.norm_status.setText("⚠ Fuzzy matching not available (install rapidfuzz or fuzzywuzzy)")
             return
 
         # Collect all manufacturer names from search results
@@ -441,6 +481,10 @@ class SupplyFrameReviewPage(QWizardPage):
         normalizations = {}
         reasoning_map = {}
 
+        # Normalize the canonical names once (lowercase, punctuation to spaces)
+        # instead of inside every extractOne call; maps name -> normalized name
+        processed_canonical = {name: fuzzy_process(name) for name in self.canonical_manufacturers}
+
         # Show ALL manufacturers, not just high-confidence matches
         for original in original_mfgs:
             # Skip if original is already in canonical list (exact match)
@@ -458,10 +502,13 @@ class SupplyFrameReviewPage(QWizardPage):
             best_match = None
             best_score = 0
 
-            if canonical_mfgs:  # Only search if we have canonical names
-                result = process.extractOne(original, canonical_mfgs, scorer=fuzz.ratio)
+            processed_original = fuzzy_process(original)
+            if processed_original:  # A name with no letters or digits matches nothing
+                # Mapping choices yield (normalized name, score, canonical name)
+                result = process.extractOne(processed_original, processed_canonical,
+                                            scorer=fuzz.ratio, processor=None)
                 if result:
-                    best_match, best_score = result[0], result[1]
+                    best_match, best_score = result[2], int(round(result[1]))
 
             # Add ALL manufacturers to the table with their best suggestion (if any)
             if best_match and best_score >= 70:  # Lower threshold for suggestions
@@ -517,6 +564,7 @@ class SupplyFrameReviewPage(QWizardPage):
                 checkbox_layout.addWidget(include_cb)
                 checkbox_layout.setAlignment(Qt.AlignCenter)
                 checkbox_layout.setContentsMargins(0, 0, 0, 0)
+                checkbox_widget.checkbox = include_cb  # Direct reference, avoids findChild on every scan
                 self.norm_table.setCellWidget(row_idx, 0, checkbox_widget)
 
                 # Column 1: Status - show the method
@@ -588,9 +636,7 @@ class SupplyFrameReviewPage(QWizardPage):
                 ai_btn.clicked.connect(lambda checked, r=row_idx, orig=original: self.analyze_single_manufacturer_ai(r, orig))
 
                 # Disable if no API key available
-                start_page = self.wizard().page(0)
-                api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
-                if not api_key or not ANTHROPIC_AVAILABLE:
+                if not self.api_key or not ANTHROPIC_AVAILABLE:
                     ai_btn.setEnabled(False)
                     ai_btn.setToolTip("AI analysis not available (no API key)")
 
@@ -626,7 +672,7 @@ class SupplyFrameReviewPage(QWizardPage):
             self.save_normalizations_btn.setEnabled(True)
 
             # Enable AI button if API key is available for additional validation
-            start_page = self.wizard().page(0)
+            start_page = self._start_page
             api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
             if api_key and ANTHROPIC_AVAILABLE:
                 self.ai_normalize_btn.setEnabled(True)
@@ -636,7 +682,7 @@ class SupplyFrameReviewPage(QWizardPage):
             )
 
             # Still enable AI button if available
-            start_page = self.wizard().page(0)
+            start_page = self._start_page
             api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
             if api_key and ANTHROPIC_AVAILABLE:
                 self.ai_normalize_btn.setEnabled(True)
@@ -900,6 +946,12 @@ class SupplyFrameReviewPage(QWizardPage):
             matches_table.setContextMenuPolicy(Qt.CustomContextMenu)
             matches_table.customContextMenuRequested.connect(self.show_match_context_menu)
 
+            # Select column is painted by a delegate instead of per-row radio widgets
+            select_delegate = RadioButtonDelegate(matches_table)
+            select_delegate.toggled.connect(self.on_match_radio_toggled)
+            matches_table.setItemDelegateForColumn(1, select_delegate)
+            matches_table.current_part = None
+
             # Set column resize modes
             header = matches_table.horizontalHeader()
             header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Option
@@ -1005,88 +1057,89 @@ class SupplyFrameReviewPage(QWizardPage):
     def populate_category_table(self, table, parts_list, show_actions=True):
         """Populate a category table with parts"""
         print(f"DEBUG populate_category_table: {len(parts_list)} parts, show_actions={show_actions}")
-        table.setRowCount(len(parts_list))
-
-        for row_idx, part in enumerate(parts_list):
-            # Ensure part is a dict and has required keys
-            if not isinstance(part, dict):
-                print(f"ERROR: Part at row {row_idx} is not a dict: {type(part)} - {part}")
-                continue
-
-            # Ensure matches key exists
-            if 'matches' not in part:
-                part['matches'] = []
-
-            if row_idx < 5:  # Log first 5
-                print(f"DEBUG: Adding row {row_idx}: {part.get('PartNumber', 'N/A')} | {part.get('ManufacturerName', 'N/A')} | {part.get('MatchStatus', 'N/A')}")
-
-            # Create items for Part Number and MFG
-            pn_item = QTableWidgetItem(part.get('PartNumber', 'N/A'))
-            mfg_item = QTableWidgetItem(part.get('ManufacturerName', 'N/A'))
-            status_item = QTableWidgetItem(part.get('MatchStatus', 'N/A'))
-
-            # Make editable for "editable" mode (None tab)
-            if show_actions == "editable":
-                # Store original values if not already stored (for revert functionality)
-                if 'original_pn' not in part:
-                    part['original_pn'] = part.get('PartNumber', 'N/A')
-                if 'original_mfg' not in part:
-                    part['original_mfg'] = part.get('ManufacturerName', 'N/A')
+        with bulk_table_update(table):
+            table.setRowCount(len(parts_list))
 
-                # Set tooltips showing original values
-                pn_item.setToolTip(f"Original: {part['original_pn']}\nRight-click to revert")
-                mfg_item.setToolTip(f"Original: {part['original_mfg']}\nRight-click to revert")
+            for row_idx, part in enumerate(parts_list):
+                # Ensure part is a dict and has required keys
+                if not isinstance(part, dict):
+                    print(f"ERROR: Part at row {row_idx} is not a dict: {type(part)} - {part}")
+                    continue
 
-                pn_item.setFlags(pn_item.flags() | Qt.ItemIsEditable)
-                mfg_item.setFlags(mfg_item.flags() | Qt.ItemIsEditable)
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)  # Status not editable
-            else:
-                # Make all non-editable for other tabs
-                pn_item.setFlags(pn_item.flags() & ~Qt.ItemIsEditable)
-                mfg_item.setFlags(mfg_item.flags() & ~Qt.ItemIsEditable)
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-
-            table.setItem(row_idx, 0, pn_item)
-            table.setItem(row_idx, 1, mfg_item)
-            table.setItem(row_idx, 2, status_item)
+                # Ensure matches key exists
+                if 'matches' not in part:
+                    part['matches'] = []
+
+                if row_idx < 5:  # Log first 5
+                    print(f"DEBUG: Adding row {row_idx}: {part.get('PartNumber', 'N/A')} | {part.get('ManufacturerName', 'N/A')} | {part.get('MatchStatus', 'N/A')}")
+
+                # Create items for Part Number and MFG
+                pn_item = QTableWidgetItem(part.get('PartNumber', 'N/A'))
+                mfg_item = QTableWidgetItem(part.get('ManufacturerName', 'N/A'))
+                status_item = QTableWidgetItem(part.get('MatchStatus', 'N/A'))
+
+                # Make editable for "editable" mode (None tab)
+                if show_actions == "editable":
+                    # Store original values if not already stored (for revert functionality)
+                    if 'original_pn' not in part:
+                        part['original_pn'] = part.get('PartNumber', 'N/A')
+                    if 'original_mfg' not in part:
+                        part['original_mfg'] = part.get('ManufacturerName', 'N/A')
+
+                    # Set tooltips showing original values
+                    pn_item.setToolTip(f"Original: {part['original_pn']}\nRight-click to revert")
+                    mfg_item.setToolTip(f"Original: {part['original_mfg']}\nRight-click to revert")
+
+                    pn_item.setFlags(pn_item.flags() | Qt.ItemIsEditable)
+                    mfg_item.setFlags(mfg_item.flags() | Qt.ItemIsEditable)
+                    status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)  # Status not editable
+                else:
+                    # Make all non-editable for other tabs
+                    pn_item.setFlags(pn_item.flags() & ~Qt.ItemIsEditable)
+                    mfg_item.setFlags(mfg_item.flags() & ~Qt.ItemIsEditable)
+                    status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
+
+                table.setItem(row_idx, 0, pn_item)
+                table.setItem(row_idx, 1, mfg_item)
+                table.setItem(row_idx, 2, status_item)
             
-            # Color-code re-searched parts that moved from None to other categories
-            if part.get('re_searched') and part.get('original_status') == 'None':
-                # Light cyan background to indicate this part was re-searched from None
-                highlight_color = QColor(200, 255, 255)  # Light cyan
-                pn_item.setBackground(highlight_color)
-                mfg_item.setBackground(highlight_color)
-                status_item.setBackground(highlight_color)
-
-            if show_actions == "editable":
-                # Add Re-search button for None tab
-                research_btn = QPushButton("🔍 Re-search")
-                research_btn.setToolTip("Re-search with modified values")
-                research_btn.clicked.connect(lambda checked, idx=row_idx: self.research_single_part(idx))
-                table.setCellWidget(row_idx, 3, research_btn)
-            elif show_actions:
-                # Reviewed indicator
-                reviewed_item = QTableWidgetItem("✓" if part.get('selected_match') else "")
-                reviewed_item.setTextAlignment(Qt.AlignCenter)
-                table.setItem(row_idx, 3, reviewed_item)
-
-                # AI indicator
-                ai_status = ""
-                if part.get('ai_processed'):
-                    ai_status = "🤖"
-                elif part.get('ai_processing'):
-                    ai_status = "⏳"
-                ai_item = QTableWidgetItem(ai_status)
-                ai_item.setTextAlignment(Qt.AlignCenter)
-                table.setItem(row_idx, 4, ai_item)
-
-                # Action button - AI Suggest (only if >1 match and not already processed)
-                matches = part.get('matches', [])
-                if len(matches) > 1 and not part.get('ai_processed'):
-                    ai_btn = QPushButton("🤖 AI")
-                    ai_btn.setToolTip("Use AI to suggest best match for this part")
-                    ai_btn.clicked.connect(lambda checked, idx=row_idx: self.ai_suggest_single(idx))
-                    table.setCellWidget(row_idx, 5, ai_btn)
+                # Color-code re-searched parts that moved from None to other categories
+                if part.get('re_searched') and part.get('original_status') == 'None':
+                    # Light cyan background to indicate this part was re-searched from None
+                    highlight_color = QColor(200, 255, 255)  # Light cyan
+                    pn_item.setBackground(highlight_color)
+                    mfg_item.setBackground(highlight_color)
+                    status_item.setBackground(highlight_color)
+
+                if show_actions == "editable":
+                    # Add Re-search button for None tab
+                    research_btn = QPushButton("🔍 Re-search")
+                    research_btn.setToolTip("Re-search with modified values")
+                    research_btn.clicked.connect(lambda checked, idx=row_idx: self.research_single_part(idx))
+                    table.setCellWidget(row_idx, 3, research_btn)
+                elif show_actions:
+                    # Reviewed indicator
+                    reviewed_item = QTableWidgetItem("✓" if part.get('selected_match') else "")
+                    reviewed_item.setTextAlignment(Qt.AlignCenter)
+                    table.setItem(row_idx, 3, reviewed_item)
+
+                    # AI indicator
+                    ai_status = ""
+                    if part.get('ai_processed'):
+                        ai_status = "🤖"
+                    elif part.get('ai_processing'):
+                        ai_status = "⏳"
+                    ai_item = QTableWidgetItem(ai_status)
+                    ai_item.setTextAlignment(Qt.AlignCenter)
+                    table.setItem(row_idx, 4, ai_item)
+
+                    # Action button - AI Suggest (only if >1 match and not already processed)
+                    matches = part.get('matches', [])
+                    if len(matches) > 1 and not part.get('ai_processed'):
+                        ai_btn = QPushButton("🤖 AI")
+                        ai_btn.setToolTip("Use AI to suggest best match for this part")
+                        ai_btn.clicked.connect(lambda checked, idx=row_idx: self.ai_suggest_single(idx))
+                        table.setCellWidget(row_idx, 5, ai_btn)
 
         print(f"DEBUG: Table populated with {table.rowCount()} rows")
 
@@ -1130,7 +1183,7 @@ class SupplyFrameReviewPage(QWizardPage):
             btn.setText("⏳ Searching...")
 
         # Get PAS search page to access the PAS client
-        pas_page = self.wizard().page(3)  # PASSearchPage is page 3
+        pas_page = self._pas_page
         if not pas_page or not hasattr(pas_page, 'pas_client'):
             QMessageBox.warning(self, "Error", "PAS API client not available.")
             if btn:
@@ -1273,7 +1326,7 @@ class SupplyFrameReviewPage(QWizardPage):
             return
 
         # Get PAS search page to access the PAS client
-        pas_page = self.wizard().page(3)  # PASSearchPage is page 3
+        pas_page = self._pas_page
         if not pas_page or not hasattr(pas_page, 'pas_client'):
             QMessageBox.warning(self, "Error", "PAS API client not available.\n\nPlease ensure you completed Step 3 (PAS Search).")
             return
@@ -1891,7 +1944,7 @@ class SupplyFrameReviewPage(QWizardPage):
             return
         
         # Get API key
-        start_page = self.wizard().page(0)
+        start_page = self._start_page
         self.api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
 
         if not self.api_key or not ANTHROPIC_AVAILABLE:
@@ -1900,7 +1953,7 @@ class SupplyFrameReviewPage(QWizardPage):
             return
 
         # Get combined data from previous step
-        xml_gen_page = self.wizard().page(3)
+        xml_gen_page = self._pas_page
         if hasattr(xml_gen_page, 'combined_data'):
             self.combined_data = xml_gen_page.combined_data
 
@@ -1934,7 +1987,9 @@ class SupplyFrameReviewPage(QWizardPage):
         self.ai_match_thread = PartialMatchAIThread(
             self.api_key,
             unprocessed_parts,
-            self.combined_data
+            self.combined_data,
+            ai_cache=self.persistent_ai_cache,
+            ignore_cache=self.ignore_ai_cache_checkbox.isChecked()
         )
         self.ai_match_thread.progress.connect(self.on_ai_match_progress)
         self.ai_match_thread.part_analyzed.connect(self.on_part_analyzed)
@@ -1950,14 +2005,14 @@ class SupplyFrameReviewPage(QWizardPage):
         # Re-enable buttons
         if category == "Multiple":
             self.multiple_auto_select_btn.setEnabled(True)
-            start_page = self.wizard().page(0)
+            start_page = self._start_page
             api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
             self.multiple_ai_suggest_btn.setEnabled(bool(api_key and ANTHROPIC_AVAILABLE))
             # Refresh table
             self.populate_category_table(self.multiple_table, self.multiple_parts, show_actions=True)
         elif category == "Need Review":
             self.need_review_auto_select_btn.setEnabled(True)
-            start_page = self.wizard().page(0)
+            start_page = self._start_page
             api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
             self.need_review_ai_suggest_btn.setEnabled(bool(api_key and ANTHROPIC_AVAILABLE))
             # Refresh table
@@ -2129,6 +2184,13 @@ class SupplyFrameReviewPage(QWizardPage):
         )
         ai_layout.addWidget(self.ai_normalize_btn)
 
+        self.ignore_ai_cache_checkbox = QCheckBox("Ignore AI cache")
+        self.ignore_ai_cache_checkbox.setToolTip(
+            "Re-query Claude AI even for parts and manufacturers analyzed in a previous run.\n"
+            "Fresh results replace the cached ones."
+        )
+        ai_layout.addWidget(self.ignore_ai_cache_checkbox)
+
         self.norm_status = QLabel("")
         ai_layout.addWidget(self.norm_status)
         ai_layout.addStretch()
@@ -2207,7 +2269,7 @@ class SupplyFrameReviewPage(QWizardPage):
             include_widget = self.norm_table.cellWidget(row_idx, 0)
             if not include_widget:
                 continue
-            include_checkbox = include_widget.findChild(QCheckBox)
+            include_checkbox = include_widget.checkbox
             if include_checkbox:
                 include_checkbox.setChecked(checked)
 
@@ -2416,7 +2478,7 @@ class SupplyFrameReviewPage(QWizardPage):
         supplyframe_mfgs = set()
 
         # From original data (Step 3)
-        xml_gen_page = self.wizard().page(3)
+        xml_gen_page = self._pas_page
         if hasattr(xml_gen_page, 'combined_data'):
             # Convert DataFrame to list of dictionaries if needed
             data = xml_gen_page.combined_data
@@ -2456,234 +2518,40 @@ class SupplyFrameReviewPage(QWizardPage):
     def populate_parts_list(self):
         """Populate the parts needing review list"""
         print(f"DEBUG populate_parts_list: parts_needing_review count = {len(self.parts_needing_review)}")
-        self.parts_list.setRowCount(len(self.parts_needing_review))
-
-        for row_idx, part in enumerate(self.parts_needing_review):
-            if row_idx < 5:  # Log first 5
-                print(f"DEBUG: Adding row {row_idx}: {part['PartNumber']} | {part['ManufacturerName']} | {part['MatchStatus']}")
-
-            self.parts_list.setItem(row_idx, 0, QTableWidgetItem(part['PartNumber']))
-            self.parts_list.setItem(row_idx, 1, QTableWidgetItem(part['ManufacturerName']))
-            self.parts_list.setItem(row_idx, 2, QTableWidgetItem(part['MatchStatus']))
-
-            # Reviewed indicator
-            reviewed_item = QTableWidgetItem("✓" if part.get('selected_match') else "")
-            reviewed_item.setTextAlignment(Qt.AlignCenter)
-            self.parts_list.setItem(row_idx, 3, reviewed_item)
-
-            # AI indicator
-            ai_status = ""
-            if part.get('ai_processed'):
-                ai_status = "🤖"
-            elif part.get('ai_processing'):
-                ai_status = "⏳"
-            ai_item = QTableWidgetItem(ai_status)
-            ai_item.setTextAlignment(Qt.AlignCenter)
-            self.parts_list.setItem(row_idx, 4, ai_item)
-
-            # Action button - AI Suggest (only if >1 match and not already processed)
-            if len(part['matches']) > 1 and not part.get('ai_processed'):
-                ai_btn = QPushButton("🤖 AI")
-                ai_btn.setToolTip("Use AI to suggest best match for this part")
-                ai_btn.clicked.connect(lambda checked, idx=row_idx: self.ai_suggest_single(idx))
-                self.parts_list.setCellWidget(row_idx, 5, ai_btn)
-
-        print(f"DEBUG: Parts list populated with {self.parts_list.rowCount()} rows")
-
-    def update_part_row(self, row_idx):
-        """Update a single row in the parts list (for real-time AI updates)"""
-        if row_idx >= len(self.parts_needing_review):
-            return
+        with bulk_table_update(self.parts_list):
+            self.parts_list.setRowCount(len(self.parts_needing_review))
 
-        part = self.parts_needing_review[row_idx]
-
-        # Update Reviewed indicator
-        reviewed_item = QTableWidgetItem("✓" if part.get('selected_match') else "")
-        reviewed_item.setTextAlignment(Qt.AlignCenter)
-        self.parts_list.setItem(row_idx, 3, reviewed_item)
-
-        # Update AI indicator
-        ai_status = ""
-        if part.get('ai_processed'):
-            ai_status = "🤖"
-        elif part.get('ai_processing'):
-            ai_status = "⏳"
-        ai_item = QTableWidgetItem(ai_status)
-        ai_item.setTextAlignment(Qt.AlignCenter)
-        self.parts_list.setItem(row_idx, 4, ai_item)
-
-        # Update/Remove Action button - remove if already processed
-        if part.get('ai_processed'):
-            # Remove the button if AI has processed this part
-            self.parts_list.setCellWidget(row_idx, 5, None)
-        elif len(part['matches']) > 1 and not part.get('ai_processing'):
-            # Re-add button if it's not processing and has multiple matches
-            ai_btn = QPushButton("🤖 AI")
-            ai_btn.setToolTip("Use AI to suggest best match for this part")
-            ai_btn.clicked.connect(lambda checked, idx=row_idx: self.ai_suggest_single(idx))
-            self.parts_list.setCellWidget(row_idx, 5, ai_btn)
-
-    def on_part_selected(self):
-        """Handle part selection - show matches"""
-        # Determine which table triggered the selection
-        sender = self.sender()
+            for row_idx, part in enumerate(self.parts_needing_review):
+                if row_idx < 5:  # Log first 5
+                    print(f"DEBUG: Adding row {row_idx}: {part['PartNumber']} | {part['ManufacturerName']} | {part['MatchStatus']}")
 
-        # Default to checking all tables
-        parts_list = None
-        matches_table = None
-        parts_data = None
-        selected_rows = None
+                self.parts_list.setItem(row_idx, 0, QTableWidgetItem(part['PartNumber']))
+                self.parts_list.setItem(row_idx, 1, QTableWidgetItem(part['ManufacturerName']))
+                self.parts_list.setItem(row_idx, 2, QTableWidgetItem(part['MatchStatus']))
 
-        # Check which table triggered the selection using sender()
-        # This ensures we use the correct table even if other tables have selections
-        if sender == self.multiple_table:
-            if self.multiple_table.selectedIndexes():
-                selected_rows = self.multiple_table.selectedIndexes()
-                parts_list = self.multiple_table
-                matches_table = self.multiple_matches_table
-                parts_data = self.multiple_parts
-        elif sender == self.need_review_table:
-            if self.need_review_table.selectedIndexes():
-                selected_rows = self.need_review_table.selectedIndexes()
-                parts_list = self.need_review_table
-                matches_table = self.need_review_matches_table
-                parts_data = self.need_review_parts
-        else:
-            # Fallback to checking all tables if sender is not recognized
-            # This handles cases where the method might be called manually
-            if hasattr(self, 'multiple_table') and self.multiple_table.selectedIndexes():
-                selected_rows = self.multiple_table.selectedIndexes()
-                parts_list = self.multiple_table
-                matches_table = self.multiple_matches_table
-                parts_data = self.multiple_parts
-            elif hasattr(self, 'need_review_table') and self.need_review_table.selectedIndexes():
-                selected_rows = self.need_review_table.selectedIndexes()
-                parts_list = self.need_review_table
-                matches_table = self.need_review_matches_table
-                parts_data = self.need_review_parts
-            else:
-                return
-
-        if not selected_rows or not parts_data:
-            return
-
-        row_idx = selected_rows[0].row()
-        if row_idx >= len(parts_data):
-            return
-            
-        part = parts_data[row_idx]
-        
-        # Ensure part is a dict and has required keys
-        if not isinstance(part, dict):
-            print(f"ERROR on_part_selected: part is not a dict: {type(part)} - {part}")
-            return
-        
-        if 'matches' not in part:
-            part['matches'] = []
-        
-        # Populate matches table
-        matches = part.get('matches', [])
-        matches_table.setRowCount(len(matches))
-
-        # Clean up old button group if it exists
-        if hasattr(matches_table, 'button_group') and matches_table.button_group is not None:
-            # Remove all buttons from the old group
-            for button in matches_table.button_group.buttons():
-                matches_table.button_group.removeButton(button)
-            # Set parent to None and delete immediately
-            old_group = matches_table.button_group
-            old_group.setParent(None)
-            matches_table.button_group = None
-            # Force immediate deletion by calling destructor
-            del old_group
-
-        # Create a new button group to ensure only one radio button can be selected at a time
-        button_group = QButtonGroup(matches_table)  # Set parent to matches_table
-        button_group.setExclusive(True)  # Explicitly set exclusive mode
-        # Store the button group to prevent garbage collection
-        matches_table.button_group = button_group
-
-        # Calculate similarity scores for confidence
-        from difflib import SequenceMatcher
-        original_pn = part.get('PartNumber', '').upper().strip()
-
-        # Find the match with the highest AI score (if any)
-        highest_ai_score_match_string = None
-        highest_ai_score = -1
-        if part.get('ai_processed') and part.get('ai_match_scores'):
-            ai_scores = part.get('ai_match_scores', {})
-            for match_string_key, score in ai_scores.items():
-                if score > highest_ai_score:
-                    highest_ai_score = score
-                    highest_ai_score_match_string = match_string_key
-
-        for match_idx, match in enumerate(matches):
-            # Extract match information using helper function
-            mpn, mfg, lifecycle_status, lifecycle_code, external_id, findchips_url, match_string = self._get_match_info(match)
-
-            # Column 0: Option number (1-based for readability, matching AI prompt)
-            option_item = QTableWidgetItem(str(match_idx + 1))
-            option_item.setTextAlignment(Qt.AlignCenter)
-            option_item.setToolTip(f"Option {match_idx + 1} (as referenced by AI)")
-            matches_table.setItem(match_idx, 0, option_item)
-
-            # Column 1: Radio button for selection - centered in cell
-            radio = QRadioButton()
-            # Check against match_string for compatibility
-            selected = part.get('selected_match')
-            if isinstance(selected, dict):
-                is_selected = (selected.get('match_string') == match_string)
-            else:
-                is_selected = (selected == match or selected == match_string)
-            radio.setChecked(is_selected)
-            radio.toggled.connect(lambda checked, p=part, m=match: self.on_match_selected(p, m, checked))
-
-            # Add radio button to the button group to ensure mutual exclusivity
-            button_group.addButton(radio)
-
-            # Create a widget to center the radio button
-            radio_widget = QWidget()
-            radio_layout = QHBoxLayout(radio_widget)
-            radio_layout.addWidget(radio)
-            radio_layout.setAlignment(Qt.AlignCenter)
-            radio_layout.setContentsMargins(0, 0, 0, 0)
-
-            matches_table.setCellWidget(match_idx, 1, radio_widget)
-
-            # Column 2: Part Number
-            matches_table.setItem(match_idx, 2, QTableWidgetItem(mpn))
-
-            # Column 3: Manufacturer
-            matches_table.setItem(match_idx, 3, QTableWidgetItem(mfg))
-
-            # Column 4: Lifecycle Status
-            lifecycle_item = QTableWidgetItem(lifecycle_status or '')
-            lifecycle_item.setToolTip(f"Lifecycle Status Code: {lifecycle_code}" if lifecycle_code else "No lifecycle info")
-            matches_table.setItem(match_idx, 4, lifecycle_item)
+                # Reviewed indicator
+                reviewed_item = QTableWidgetItem("✓" if part.get('selected_match') else "")
+                reviewed_item.setTextAlignment(Qt.AlignCenter)
+                self.parts_list.setItem(row_idx, 3, reviewed_item)
 
-            # Column 5: External ID (link)
-            external_item = QTableWidgetItem('')
-            if external_id:
-                # Truncate long URLs for display
-                display_url = external_id if len(external_id) <= 40 else external_id[:37] + '...'
-            # AI indicator
-            ai_status = ""
-            if part.get('ai_processed'):
-                ai_status = "🤖"
-            elif part.get('ai_processing'):
-                ai_status = "⏳"
-            ai_item = QTableWidgetItem(ai_status)
-            ai_item.setTextAlignment(Qt.AlignCenter)
-            self.parts_list.setItem(row_idx, 4, ai_item)
+                # AI indicator
+                ai_status = ""
+                if part.get('ai_processed'):
+                    ai_status = "🤖"
+                elif part.get('ai_processing'):
+                    ai_status = "⏳"
+                ai_item = QTableWidgetItem(ai_status)
+                ai_item.setTextAlignment(Qt.AlignCenter)
+                self.parts_list.setItem(row_idx, 4, ai_item)
 
-            # Action button - AI Suggest (only if >1 match and not already processed)
-            if len(part['matches']) > 1 and not part.get('ai_processed'):
-                ai_btn = QPushButton("🤖 AI")
-                ai_btn.setToolTip("Use AI to suggest best match for this part")
-                ai_btn.clicked.connect(lambda checked, idx=row_idx: self.ai_suggest_single(idx))
-                self.parts_list.setCellWidget(row_idx, 5, ai_btn)
+                # Action button - AI Suggest (only if >1 match and not already processed)
+                if len(part['matches']) > 1 and not part.get('ai_processed'):
+                    ai_btn = QPushButton("🤖 AI")
+                    ai_btn.setToolTip("Use AI to suggest best match for this part")
+                    ai_btn.clicked.connect(lambda checked, idx=row_idx: self.ai_suggest_single(idx))
+                    self.parts_list.setCellWidget(row_idx, 5, ai_btn)
 
-        print(f"DEBUG: Parts list populated with {self.parts_list.rowCount()} rows")
+            print(f"DEBUG: Parts list populated with {self.parts_list.rowCount()} rows")
 
     def update_part_row(self, row_idx):
         """Update a single row in the parts list (for real-time AI updates)"""
@@ -2778,143 +2646,140 @@ class SupplyFrameReviewPage(QWizardPage):
         
         # Populate matches table
         matches = part.get('matches', [])
-        matches_table.setRowCount(len(matches))
-
-        # Clean up old button group if it exists
-        if hasattr(matches_table, 'button_group') and matches_table.button_group is not None:
-            # Remove all buttons from the old group
-            for button in matches_table.button_group.buttons():
-                matches_table.button_group.removeButton(button)
-            # Set parent to None and delete immediately
-            old_group = matches_table.button_group
-            old_group.setParent(None)
-            matches_table.button_group = None
-            # Force immediate deletion by calling destructor
-            del old_group
+        matches_table.current_part = part  # Read by on_match_radio_toggled
+        with bulk_table_update(matches_table):
+            matches_table.setRowCount(len(matches))
 
-        # Create a new button group to ensure only one radio button can be selected at a time
-        button_group = QButtonGroup(matches_table)  # Set parent to matches_table
-        button_group.setExclusive(True)  # Explicitly set exclusive mode
-        # Store the button group to prevent garbage collection
-        matches_table.button_group = button_group
-
-        # Calculate similarity scores for confidence
-        from difflib import SequenceMatcher
-        original_pn = part.get('PartNumber', '').upper().strip()
-
-        # Find the match with the highest AI score (if any)
-        highest_ai_score_match_string = None
-        highest_ai_score = -1
-        if part.get('ai_processed') and part.get('ai_match_scores'):
-            ai_scores = part.get('ai_match_scores', {})
-            for match_string_key, score in ai_scores.items():
-                if score > highest_ai_score:
-                    highest_ai_score = score
-                    highest_ai_score_match_string = match_string_key
-
-        for match_idx, match in enumerate(matches):
-            # Extract match information using helper function
-            mpn, mfg, lifecycle_status, lifecycle_code, external_id, findchips_url, match_string = self._get_match_info(match)
-
-            # Column 0: Option number (1-based for readability, matching AI prompt)
-            option_item = QTableWidgetItem(str(match_idx + 1))
-            option_item.setTextAlignment(Qt.AlignCenter)
-            option_item.setToolTip(f"Option {match_idx + 1} (as referenced by AI)")
-            matches_table.setItem(match_idx, 0, option_item)
-
-            # Column 1: Radio button for selection - centered in cell
-            radio = QRadioButton()
-            # Check against match_string for compatibility
-            selected = part.get('selected_match')
-            if isinstance(selected, dict):
-                is_selected = (selected.get('match_string') == match_string)
-            else:
-                is_selected = (selected == match or selected == match_string)
-            radio.setChecked(is_selected)
-            radio.toggled.connect(lambda checked, p=part, m=match: self.on_match_selected(p, m, checked))
-
-            # Add radio button to the button group to ensure mutual exclusivity
-            button_group.addButton(radio)
-
-            # Create a widget to center the radio button
-            radio_widget = QWidget()
-            radio_layout = QHBoxLayout(radio_widget)
-            radio_layout.addWidget(radio)
-            radio_layout.setAlignment(Qt.AlignCenter)
-            radio_layout.setContentsMargins(0, 0, 0, 0)
-
-            matches_table.setCellWidget(match_idx, 1, radio_widget)
-
-            # Column 2: Part Number
-            matches_table.setItem(match_idx, 2, QTableWidgetItem(mpn))
+            # Calculate similarity scores for confidence
+            from difflib import SequenceMatcher
+            original_pn = part.get('PartNumber', '').upper().strip()
 
-            # Column 3: Manufacturer
-            matches_table.setItem(match_idx, 3, QTableWidgetItem(mfg))
+            # Find the match with the highest AI score (if any)
+            highest_ai_score_match_string = None
+            highest_ai_score = -1
+            if part.get('ai_processed') and part.get('ai_match_scores'):
+                ai_scores = part.get('ai_match_scores', {})
+                for match_string_key, score in ai_scores.items():
+                    if score > highest_ai_score:
+                        highest_ai_score = score
+                        highest_ai_score_match_string = match_string_key
 
-            # Column 4: Lifecycle Status
-            lifecycle_item = QTableWidgetItem(lifecycle_status or '')
-            lifecycle_item.setToolTip(f"Lifecycle Status Code: {lifecycle_code}" if lifecycle_code else "No lifecycle info")
+            for match_idx, match in enumerate(matches):
+                # Extract match information using helper function
+                mpn, mfg, lifecycle_status, lifecycle_code, external_id, findchips_url, match_string = self._get_match_info(match)
+
+                # Column 0: Option number (1-based for readability, matching AI prompt)
+                option_item = QTableWidgetItem(str(match_idx + 1))
+                option_item.setTextAlignment(Qt.AlignCenter)
+                option_item.setToolTip(f"Option {match_idx + 1} (as referenced by AI)")
+                matches_table.setItem(match_idx, 0, option_item)
+
+                # Column 1: Selection - drawn as a radio button by RadioButtonDelegate
+                # Check against match_string for compatibility
+                selected = part.get('selected_match')
+                if isinstance(selected, dict):
+                    is_selected = (selected.get('match_string') == match_string)
+                else:
+                    is_selected = (selected == match or selected == match_string)
+                select_item = QTableWidgetItem()
+                select_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                select_item.setData(Qt.CheckStateRole, Qt.Checked if is_selected else Qt.Unchecked)
+                select_item.setData(Qt.UserRole, match_idx)  # Survives sorting
+                matches_table.setItem(match_idx, 1, select_item)
+
+                # Column 2: Part Number
+                matches_table.setItem(match_idx, 2, QTableWidgetItem(mpn))
+
+                # Column 3: Manufacturer
+                matches_table.setItem(match_idx, 3, QTableWidgetItem(mfg))
+
+                # Column 4: Lifecycle Status
+                lifecycle_item = QTableWidgetItem(lifecycle_status or '')
+                lifecycle_item.setToolTip(f"Lifecycle Status Code: {lifecycle_code}" if lifecycle_code else "No lifecycle info")
             
-            # Color coding for lifecycle status
-            if lifecycle_status:
-                status_lower = lifecycle_status.lower()
-                if any(x in status_lower for x in ['active', 'production', 'preferred', 'recommended']):
-                    lifecycle_item.setBackground(QColor(200, 230, 201))  # Light Green
-                elif any(x in status_lower for x in ['obsolete', 'eol', 'end of life', 'discontinued']):
-                    lifecycle_item.setBackground(QColor(255, 205, 210))  # Light Red
-                elif any(x in status_lower for x in ['nrnd', 'not recommended', 'last time buy']):
-                    lifecycle_item.setBackground(QColor(255, 224, 178))  # Light Orange
-                elif any(x in status_lower for x in ['unknown', 'unconfirmed']):
-                    lifecycle_item.setBackground(QColor(255, 249, 196))  # Light Yellow
+                # Color coding for lifecycle status
+                if lifecycle_status:
+                    status_lower = lifecycle_status.lower()
+                    if any(x in status_lower for x in ['active', 'production', 'preferred', 'recommended']):
+                        lifecycle_item.setBackground(QColor(200, 230, 201))  # Light Green
+                    elif any(x in status_lower for x in ['obsolete', 'eol', 'end of life', 'discontinued']):
+                        lifecycle_item.setBackground(QColor(255, 205, 210))  # Light Red
+                    elif any(x in status_lower for x in ['nrnd', 'not recommended', 'last time buy']):
+                        lifecycle_item.setBackground(QColor(255, 224, 178))  # Light Orange
+                    elif any(x in status_lower for x in ['unknown', 'unconfirmed']):
+                        lifecycle_item.setBackground(QColor(255, 249, 196))  # Light Yellow
             
-            matches_table.setItem(match_idx, 4, lifecycle_item)
-
-            # Column 5: External ID (link)
-            external_item = QTableWidgetItem('')
-            if external_id:
-                # Truncate long URLs for display
-                display_url = external_id if len(external_id) <= 40 else external_id[:37] + '...'
-                external_item.setText(display_url)
-                external_item.setToolTip(f"Click to open: {external_id}")
-                external_item.setForeground(QColor(0, 0, 255))  # Blue for links
-            matches_table.setItem(match_idx, 5, external_item)
-
-            # Column 6: Similarity score
-            match_pn = mpn.upper().strip()
-            match_mfg = mfg.upper().strip()
-            original_mfg = part.get('ManufacturerName', '').upper().strip()
+                matches_table.setItem(match_idx, 4, lifecycle_item)
+
+                # Column 5: External ID (link)
+                external_item = QTableWidgetItem('')
+                if external_id:
+                    # Truncate long URLs for display
+                    display_url = external_id if len(external_id) <= 40 else external_id[:37] + '...'
+                    external_item.setText(display_url)
+                    external_item.setToolTip(f"Click to open: {external_id}")
+                    external_item.setForeground(QColor(0, 0, 255))  # Blue for links
+                matches_table.setItem(match_idx, 5, external_item)
+
+                # Column 6: Similarity score
+                match_pn = mpn.upper().strip()
+                match_mfg = mfg.upper().strip()
+                original_mfg = part.get('ManufacturerName', '').upper().strip()
             
-            # Calculate PN similarity
-            pn_sim = SequenceMatcher(None, original_pn, match_pn).ratio()
+                # Calculate PN similarity
+                pn_sim = SequenceMatcher(None, original_pn, match_pn).ratio()
             
-            # Calculate MFG similarity
-            mfg_sim = SequenceMatcher(None, original_mfg, match_mfg).ratio()
+                # Calculate MFG similarity
+                mfg_sim = SequenceMatcher(None, original_mfg, match_mfg).ratio()
             
-            # Weighted average: 60% PN, 40% MFG
-            similarity = (pn_sim * 0.6) + (mfg_sim * 0.4)
+                # Weighted average: 60% PN, 40% MFG
+                similarity = (pn_sim * 0.6) + (mfg_sim * 0.4)
             
-            similarity_pct = int(similarity * 100)
-            similarity_item = QTableWidgetItem(f"{similarity_pct}%")
-            similarity_item.setTextAlignment(Qt.AlignCenter)
-            similarity_item.setToolTip(f"Combined similarity: {similarity_pct}%\n(PN: {int(pn_sim*100)}%, MFG: {int(mfg_sim*100)}%)")
-            matches_table.setItem(match_idx, 6, similarity_item)
+                similarity_pct = int(similarity * 100)
+                similarity_item = QTableWidgetItem(f"{similarity_pct}%")
+                similarity_item.setTextAlignment(Qt.AlignCenter)
+                similarity_item.setToolTip(f"Combined similarity: {similarity_pct}%\n(PN: {int(pn_sim*100)}%, MFG: {int(mfg_sim*100)}%)")
+                matches_table.setItem(match_idx, 6, similarity_item)
 
 
-            # Column 7: AI Score - only show if AI has processed this part
-            ai_score_item = QTableWidgetItem("")
-            ai_score_item.setTextAlignment(Qt.AlignCenter)
-            has_ai_score = False
-            if part.get('ai_processed') and part.get('ai_match_scores'):
-                # Get AI confidence for this specific match
-                ai_scores = part.get('ai_match_scores', {})
-                # Check both match and match_string
-                score_key = match if not isinstance(match, dict) else match_string
-                if score_key in ai_scores:
-                    ai_conf = ai_scores[score_key]
-                    ai_score_item.setText(f"{ai_conf}%")
-                    ai_score_item.setToolTip("AI confidence score (considers context, manufacturer, description)")
-                    has_ai_score = True
-            matches_table.setItem(match_idx, 7, ai_score_item)
+                # Column 7: AI Score - only show if AI has processed this part
+                ai_score_item = QTableWidgetItem("")
+                ai_score_item.setTextAlignment(Qt.AlignCenter)
+                has_ai_score = False
+                if part.get('ai_processed') and part.get('ai_match_scores'):
+                    # Get AI confidence for this specific match
+                    ai_scores = part.get('ai_match_scores', {})
+                    # Check both match and match_string
+                    score_key = match if not isinstance(match, dict) else match_string
+                    if score_key in ai_scores:
+                        ai_conf = ai_scores[score_key]
+                        ai_score_item.setText(f"{ai_conf}%")
+                        ai_score_item.setToolTip("AI confidence score (considers context, manufacturer, description)")
+                        has_ai_score = True
+                matches_table.setItem(match_idx, 7, ai_score_item)
+
+    def on_match_radio_toggled(self, index):
+        """Handle a match chosen in the Select column of a matches table"""
+        part = getattr(self.sender().parent(), 'current_part', None)
+        if not part:
+            return
+        match_idx = index.data(Qt.UserRole)
+        matches = part.get('matches', [])
+        if match_idx is not None and 0 <= match_idx < len(matches):
+            self.on_match_selected(part, matches[match_idx], True)
+
+    def on_match_button_toggled(self, button, checked):
+        """Handle a radio button toggled in a matches table's button group"""
+        if not checked:
+            return
+        button_group = self.sender()
+        part = getattr(button_group.parent(), 'current_part', None)
+        if not part:
+            return
+        match_idx = button_group.id(button)
+        matches = part.get('matches', [])
+        if 0 <= match_idx < len(matches):
+            self.on_match_selected(part, matches[match_idx], True)
 
     def on_match_selected(self, part, match, checked):
         """Handle match selection"""
@@ -2959,8 +2824,11 @@ class SupplyFrameReviewPage(QWizardPage):
         # Create a new button group to ensure only one radio button can be selected at a time
         button_group = QButtonGroup(self.matches_table)  # Set parent to matches_table
         button_group.setExclusive(True)  # Explicitly set exclusive mode
+        # One slot for the whole group; the button id is the match index
+        button_group.buttonToggled.connect(self.on_match_button_toggled)
         # Store the button group to prevent garbage collection
         self.matches_table.button_group = button_group
+        self.matches_table.current_part = part
 
         from difflib import SequenceMatcher
         original_pn = part['PartNumber'].upper().strip()
@@ -2994,10 +2862,9 @@ class SupplyFrameReviewPage(QWizardPage):
             else:
                 is_selected = (selected == match or selected == match_string)
             radio.setChecked(is_selected)
-            radio.toggled.connect(lambda checked, p=part, m=match: self.on_match_selected(p, m, checked))
 
             # Add radio button to the button group to ensure mutual exclusivity
-            button_group.addButton(radio)
+            button_group.addButton(radio, match_idx)
 
             radio_widget = QWidget()
             radio_layout = QHBoxLayout(radio_widget)
@@ -3304,7 +3171,7 @@ class SupplyFrameReviewPage(QWizardPage):
             return
 
         # Get API key
-        start_page = self.wizard().page(0)
+        start_page = self._start_page
         self.api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
 
         if not self.api_key or not ANTHROPIC_AVAILABLE:
@@ -3313,7 +3180,7 @@ class SupplyFrameReviewPage(QWizardPage):
             return
 
         # Get combined data from previous step
-        xml_gen_page = self.wizard().page(3)
+        xml_gen_page = self._pas_page
         if hasattr(xml_gen_page, 'combined_data'):
             self.combined_data = xml_gen_page.combined_data
 
@@ -3337,7 +3204,9 @@ class SupplyFrameReviewPage(QWizardPage):
         self.ai_match_thread = PartialMatchAIThread(
             self.api_key,
             unprocessed_parts,
-            self.combined_data
+            self.combined_data,
+            ai_cache=self.persistent_ai_cache,
+            ignore_cache=self.ignore_ai_cache_checkbox.isChecked()
         )
         
         # Connect signals - reuse existing handlers but they might need adaptation
@@ -3441,7 +3310,7 @@ class SupplyFrameReviewPage(QWizardPage):
         #     return
 
         # Get API key
-        start_page = self.wizard().page(0)
+        start_page = self._start_page
         self.api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
 
         if not self.api_key or not ANTHROPIC_AVAILABLE:
@@ -3450,7 +3319,7 @@ class SupplyFrameReviewPage(QWizardPage):
             return
 
         # Get combined data from previous step
-        xml_gen_page = self.wizard().page(3)
+        xml_gen_page = self._pas_page
         if hasattr(xml_gen_page, 'combined_data'):
             self.combined_data = xml_gen_page.combined_data
 
@@ -3465,7 +3334,9 @@ class SupplyFrameReviewPage(QWizardPage):
         self.ai_match_thread = PartialMatchAIThread(
             self.api_key,
             parts_to_process,
-            self.combined_data
+            self.combined_data,
+            ai_cache=self.persistent_ai_cache,
+            ignore_cache=self.ignore_ai_cache_checkbox.isChecked()
         )
         self.ai_match_thread.progress.connect(lambda msg, cur, tot: self.csv_summary.setText(f"🤖 Analyzing part..."))
         self.ai_match_thread.part_analyzed.connect(lambda idx, result: self.on_part_analyzed(row_idx, result))
@@ -3476,7 +3347,7 @@ class SupplyFrameReviewPage(QWizardPage):
     def ai_suggest_matches(self):
         """Use AI to suggest best matches for all unprocessed parts"""
         # Get API key
-        start_page = self.wizard().page(0)
+        start_page = self._start_page
         self.api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
 
         if not self.api_key or not ANTHROPIC_AVAILABLE:
@@ -3485,7 +3356,7 @@ class SupplyFrameReviewPage(QWizardPage):
             return
 
         # Get combined data from previous step
-        xml_gen_page = self.wizard().page(3)
+        xml_gen_page = self._pas_page
         if hasattr(xml_gen_page, 'combined_data'):
             self.combined_data = xml_gen_page.combined_data
 
@@ -3513,7 +3384,9 @@ class SupplyFrameReviewPage(QWizardPage):
         self.ai_match_thread = PartialMatchAIThread(
             self.api_key,
             unprocessed_parts,
-            self.combined_data
+            self.combined_data,
+            ai_cache=self.persistent_ai_cache,
+            ignore_cache=self.ignore_ai_cache_checkbox.isChecked()
         )
         self.ai_match_thread.progress.connect(self.on_ai_match_progress)
         self.ai_match_thread.part_analyzed.connect(self.on_part_analyzed)  # NEW: real-time updates
@@ -3690,7 +3563,7 @@ class SupplyFrameReviewPage(QWizardPage):
     def ai_detect_normalizations(self):
         """Use AI to detect manufacturer normalizations"""
         # Get API key
-        start_page = self.wizard().page(0)
+        start_page = self._start_page
         self.api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
 
         if not self.api_key or not ANTHROPIC_AVAILABLE:
@@ -3699,35 +3572,41 @@ class SupplyFrameReviewPage(QWizardPage):
             return
 
         # Collect manufacturers - CRITICAL: Keep source and target separate!
-        source_mfgs = set()  # Only manufacturers from user's original data
-        canonical_mfgs = set()  # Only canonical manufacturers from PAS
-
         # From original data (ONLY manufacturers from Step 3 - the SOURCE)
-        xml_gen_page = self.wizard().page(3)
-        if hasattr(xml_gen_page, 'combined_data'):
-            # Convert DataFrame to list of dictionaries if needed
-            data = xml_gen_page.combined_data
-            if hasattr(data, 'to_dict'):
-                data = data.to_dict('records')
-            for row in data:
-                if isinstance(row, dict) and row.get('MFG'):
-                    source_mfgs.add(row['MFG'])
+        source_mfgs = set()
+        data = getattr(self._pas_page, 'combined_data', None)
+        if isinstance(data, pd.DataFrame):
+            if 'MFG' in data.columns:
+                source_mfgs = {mfg for mfg in data['MFG'].dropna().unique() if mfg}
+        elif data is not None:
+            source_mfgs = {row['MFG'] for row in data if isinstance(row, dict) and row.get('MFG')}
 
         # From search results - collect ONLY canonical manufacturers from PAS (the TARGET)
         # DO NOT add user's original manufacturers here - they're already in source_mfgs
-        if hasattr(self, 'search_results'):
-            for part in self.search_results:
-                # Extract canonical manufacturer names from MatchValue column
-                for match in part.get('matches', []):
-                    # Match is a dict with 'mfg' key containing the canonical manufacturer
-                    if isinstance(match, dict):
-                        mfg = match.get('mfg', '').strip()
-                        if mfg:
-                            canonical_mfgs.add(mfg)
-                    # Legacy support: if match is a string (old format)
-                    elif isinstance(match, str) and '@' in match:
-                        _, mfg = match.split('@', 1)
-                        canonical_mfgs.add(mfg.strip())
+        canonical_mfgs = {
+            mfg
+            for part in self.search_results
+            for mfg in map(self._match_mfg, part.get('matches', []))
+            if mfg
+        }
+
+        # Names already canonical are dropped, and names differing from a canonical
+        # name only in case/whitespace are resolved locally - only the rest go to the AI
+        canonical_index = {' '.join(mfg.split()).upper(): mfg for mfg in canonical_mfgs}
+        self.local_normalizations = {}
+        self.local_normalization_reasoning = {}
+        mfgs_to_query = []
+        for mfg in source_mfgs:
+            canonical = canonical_index.get(' '.join(str(mfg).split()).upper())
+            if canonical is None:
+                mfgs_to_query.append(mfg)
+            elif canonical != mfg:
+                self.local_normalizations[mfg] = canonical
+                self.local_normalization_reasoning[mfg] = {
+                    'method': 'fuzzy',
+                    'score': 100,
+                    'reasoning': f"Differs from '{canonical}' only in case or whitespace"
+                }
 
         self.norm_status.setText("🤖 Analyzing manufacturers...")
         self.norm_status.setStyleSheet("color: blue;")
@@ -3736,8 +3615,10 @@ class SupplyFrameReviewPage(QWizardPage):
         # Start AI thread with SEPARATE source and target lists
         self.ai_norm_thread = ManufacturerNormalizationAIThread(
             self.api_key,
-            list(source_mfgs),  # Only user's original manufacturers
-            list(canonical_mfgs)  # Only PAS canonical manufacturers
+            mfgs_to_query,  # Only user's original manufacturers still needing analysis
+            list(canonical_mfgs),  # Only PAS canonical manufacturers
+            ai_cache=self.persistent_ai_cache,
+            ignore_cache=self.ignore_ai_cache_checkbox.isChecked()
         )
         self.ai_norm_thread.progress.connect(lambda msg: self.norm_status.setText(msg))
         self.ai_norm_thread.finished.connect(self.on_ai_norm_finished)
@@ -3746,6 +3627,10 @@ class SupplyFrameReviewPage(QWizardPage):
 
     def on_ai_norm_finished(self, normalizations, reasoning_map):
         """Apply pure AI normalization suggestions"""
+        # Add the variants resolved locally before the AI call
+        normalizations = {**self.local_normalizations, **normalizations}
+        reasoning_map = {**self.local_normalization_reasoning, **reasoning_map}
+
         self.manufacturer_normalizations = normalizations
         self.normalization_reasoning = reasoning_map  # Store reasoning for context menu
 
@@ -3782,7 +3667,7 @@ class SupplyFrameReviewPage(QWizardPage):
 
         # Get all unique manufacturers from original data (ensure we show EVERYTHING)
         unique_original_mfgs = set()
-        pas_search_page = self.wizard().page(3)  # PASSearchPage is page 3
+        pas_search_page = self._pas_page
         if pas_search_page and hasattr(pas_search_page, 'combined_data'):
             data = pas_search_page.combined_data
             if hasattr(data, 'to_dict'):
@@ -3801,135 +3686,135 @@ class SupplyFrameReviewPage(QWizardPage):
             all_entries[original] = canonical
 
         # Populate normalization table with ALL manufacturers
-        self.norm_table.setRowCount(len(all_entries))
-
-        row_idx = 0
-        for original, canonical in sorted(all_entries.items()):
-            # Include checkbox - center it in the cell
-            include_cb = QCheckBox()
-            # Check if this is from AI/fuzzy suggestions (in normalizations dict)
-            has_suggestion = original in normalizations
-            if has_suggestion:
-                method = reasoning_map.get(original, {}).get('method', 'manual')
-                # Check fuzzy/AI matches, uncheck exact matches and identity mappings
-                include_cb.setChecked(method != 'exact' and original != canonical)
-            else:
-                # Identity mapping (no change) - uncheck by default
-                include_cb.setChecked(False)
+        with bulk_table_update(self.norm_table):
+            self.norm_table.setRowCount(len(all_entries))
+
+            row_idx = 0
+            for original, canonical in sorted(all_entries.items()):
+                # Include checkbox - center it in the cell
+                include_cb = QCheckBox()
+                # Check if this is from AI/fuzzy suggestions (in normalizations dict)
+                has_suggestion = original in normalizations
+                if has_suggestion:
+                    method = reasoning_map.get(original, {}).get('method', 'manual')
+                    # Check fuzzy/AI matches, uncheck exact matches and identity mappings
+                    include_cb.setChecked(method != 'exact' and original != canonical)
+                else:
+                    # Identity mapping (no change) - uncheck by default
+                    include_cb.setChecked(False)
             
-            # Create a widget to center the checkbox
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(include_cb)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            self.norm_table.setCellWidget(row_idx, 0, checkbox_widget)
-
-            # Column 1: Status - show the method (MOVED TO COLUMN 1)
-            if has_suggestion:
-                method = reasoning_map.get(original, {}).get('method', 'manual')
-                score = reasoning_map.get(original, {}).get('score', 0)
-                status_map = {
-                    'exact': 'Exact',
-                    'fuzzy': 'Fuzzy',
-                    'ai': 'AI',
-                    'manual': 'Manual'
-                }
-                status_text = status_map.get(method, 'Manual')
-            else:
-                status_text = 'No Change'
-                method = 'no_change'
-                score = 0
+                # Create a widget to center the checkbox
+                checkbox_widget = QWidget()
+                checkbox_layout = QHBoxLayout(checkbox_widget)
+                checkbox_layout.addWidget(include_cb)
+                checkbox_layout.setAlignment(Qt.AlignCenter)
+                checkbox_layout.setContentsMargins(0, 0, 0, 0)
+                checkbox_widget.checkbox = include_cb  # Direct reference, avoids findChild on every scan
+                self.norm_table.setCellWidget(row_idx, 0, checkbox_widget)
+
+                # Column 1: Status - show the method (MOVED TO COLUMN 1)
+                if has_suggestion:
+                    method = reasoning_map.get(original, {}).get('method', 'manual')
+                    score = reasoning_map.get(original, {}).get('score', 0)
+                    status_map = {
+                        'exact': 'Exact',
+                        'fuzzy': 'Fuzzy',
+                        'ai': 'AI',
+                        'manual': 'Manual'
+                    }
+                    status_text = status_map.get(method, 'Manual')
+                else:
+                    status_text = 'No Change'
+                    method = 'no_change'
+                    score = 0
 
-            status_item = QTableWidgetItem(status_text)
-            status_item.setTextAlignment(Qt.AlignCenter)
+                status_item = QTableWidgetItem(status_text)
+                status_item.setTextAlignment(Qt.AlignCenter)
             
-            # Color code the status
-            if method == 'exact':
-                status_item.setBackground(QColor(230, 255, 230))  # Light green
-            elif method == 'fuzzy':
-                status_item.setBackground(QColor(255, 250, 205))  # Light yellow
-            elif method == 'ai':
-                status_item.setBackground(QColor(230, 240, 255))  # Light blue
-            elif method == 'manual':
-                status_item.setBackground(QColor(255, 240, 200))  # Light orange
-            else:  # no_change
-                status_item.setBackground(QColor(248, 248, 248))  # Very light gray
+                # Color code the status
+                if method == 'exact':
+                    status_item.setBackground(QColor(230, 255, 230))  # Light green
+                elif method == 'fuzzy':
+                    status_item.setBackground(QColor(255, 250, 205))  # Light yellow
+                elif method == 'ai':
+                    status_item.setBackground(QColor(230, 240, 255))  # Light blue
+                elif method == 'manual':
+                    status_item.setBackground(QColor(255, 240, 200))  # Light orange
+                else:  # no_change
+                    status_item.setBackground(QColor(248, 248, 248))  # Very light gray
             
-            self.norm_table.setItem(row_idx, 1, status_item)
+                self.norm_table.setItem(row_idx, 1, status_item)
 
-            # Column 2: Original MFG (read-only)
-            self.norm_table.setItem(row_idx, 2, QTableWidgetItem(original))
+                # Column 2: Original MFG (read-only)
+                self.norm_table.setItem(row_idx, 2, QTableWidgetItem(original))
 
-            # Column 3: Normalize To (editable combo box)
-            normalize_combo = QComboBox()
-            normalize_combo.setEditable(True)
-            # Disable mouse wheel
-            normalize_combo.wheelEvent = lambda event: event.ignore()
-            normalize_combo.setFocusPolicy(Qt.StrongFocus)
+                # Column 3: Normalize To (editable combo box)
+                normalize_combo = QComboBox()
+                normalize_combo.setEditable(True)
+                # Disable mouse wheel
+                normalize_combo.wheelEvent = lambda event: event.ignore()
+                normalize_combo.setFocusPolicy(Qt.StrongFocus)
 
-            # Add only PAS canonical manufacturers to dropdown
-            if hasattr(self, 'canonical_manufacturers'):
-                for mfg in sorted(self.canonical_manufacturers):
-                    normalize_combo.addItem(mfg)
-            else:
-                # Fallback to canonical_mfgs from this function
-                for mfg in sorted(canonical_mfgs):
-                    normalize_combo.addItem(mfg)
+                # Add only PAS canonical manufacturers to dropdown
+                if hasattr(self, 'canonical_manufacturers'):
+                    for mfg in sorted(self.canonical_manufacturers):
+                        normalize_combo.addItem(mfg)
+                else:
+                    # Fallback to canonical_mfgs from this function
+                    for mfg in sorted(canonical_mfgs):
+                        normalize_combo.addItem(mfg)
 
-            # Set current suggestion
-            normalize_combo.setCurrentText(canonical)
-            self.norm_table.setCellWidget(row_idx, 3, normalize_combo)
+                # Set current suggestion
+                normalize_combo.setCurrentText(canonical)
+                self.norm_table.setCellWidget(row_idx, 3, normalize_combo)
 
-            # Column 4: Similarity - show fuzzy match score only
-            similarity_item = QTableWidgetItem("")
-            similarity_item.setTextAlignment(Qt.AlignCenter)
-            if method == 'fuzzy' and score > 0:
-                similarity_item.setText(f"{score}%")
-                similarity_item.setToolTip(f"Fuzzy match similarity: {score}%")
-            self.norm_table.setItem(row_idx, 4, similarity_item)
+                # Column 4: Similarity - show fuzzy match score only
+                similarity_item = QTableWidgetItem("")
+                similarity_item.setTextAlignment(Qt.AlignCenter)
+                if method == 'fuzzy' and score > 0:
+                    similarity_item.setText(f"{score}%")
+                    similarity_item.setToolTip(f"Fuzzy match similarity: {score}%")
+                self.norm_table.setItem(row_idx, 4, similarity_item)
 
-            # Column 5: AI Score - show AI confidence score only
-            ai_score_item = QTableWidgetItem("")
-            ai_score_item.setTextAlignment(Qt.AlignCenter)
-            if method == 'ai' and score > 0:
-                ai_score_item.setText(f"{score}%")
-                ai_score_item.setToolTip(f"AI match confidence: {score}%")
-            self.norm_table.setItem(row_idx, 5, ai_score_item)
+                # Column 5: AI Score - show AI confidence score only
+                ai_score_item = QTableWidgetItem("")
+                ai_score_item.setTextAlignment(Qt.AlignCenter)
+                if method == 'ai' and score > 0:
+                    ai_score_item.setText(f"{score}%")
+                    ai_score_item.setToolTip(f"AI match confidence: {score}%")
+                self.norm_table.setItem(row_idx, 5, ai_score_item)
 
-            # Column 6: AI Analyze button
-            ai_btn = QPushButton("🤖 AI")
-            ai_btn.setMaximumWidth(60)
-            ai_btn.setToolTip("Run AI analysis for this manufacturer")
-            ai_btn.clicked.connect(lambda checked, r=row_idx, orig=original: self.analyze_single_manufacturer_ai(r, orig))
+                # Column 6: AI Analyze button
+                ai_btn = QPushButton("🤖 AI")
+                ai_btn.setMaximumWidth(60)
+                ai_btn.setToolTip("Run AI analysis for this manufacturer")
+                ai_btn.clicked.connect(lambda checked, r=row_idx, orig=original: self.analyze_single_manufacturer_ai(r, orig))
 
-            # Disable if no API key available
-            start_page = self.wizard().page(0)
-            api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
-            if not api_key or not ANTHROPIC_AVAILABLE:
-                ai_btn.setEnabled(False)
-                ai_btn.setToolTip("AI analysis not available (no API key)")
-
-            # Center the button in the cell
-            ai_btn_widget = QWidget()
-            ai_btn_layout = QHBoxLayout(ai_btn_widget)
-            ai_btn_layout.addWidget(ai_btn)
-            ai_btn_layout.setAlignment(Qt.AlignCenter)
-            ai_btn_layout.setContentsMargins(0, 0, 0, 0)
-            self.norm_table.setCellWidget(row_idx, 6, ai_btn_widget)
-
-            # Column 7: Scope dropdown
-            scope_combo = QComboBox()
-            scope_combo.addItems(["All Catalogs", "Per Catalog"])
-            # Disable mouse wheel
-            scope_combo.wheelEvent = lambda event: event.ignore()
-            scope_combo.setFocusPolicy(Qt.StrongFocus)
-            self.norm_table.setCellWidget(row_idx, 7, scope_combo)
-
-            # Note: Color coding is already applied to Status column above
-            # No need for additional row color coding
-
-            row_idx += 1
+                # Disable if no API key available
+                if not self.api_key or not ANTHROPIC_AVAILABLE:
+                    ai_btn.setEnabled(False)
+                    ai_btn.setToolTip("AI analysis not available (no API key)")
+
+                # Center the button in the cell
+                ai_btn_widget = QWidget()
+                ai_btn_layout = QHBoxLayout(ai_btn_widget)
+                ai_btn_layout.addWidget(ai_btn)
+                ai_btn_layout.setAlignment(Qt.AlignCenter)
+                ai_btn_layout.setContentsMargins(0, 0, 0, 0)
+                self.norm_table.setCellWidget(row_idx, 6, ai_btn_widget)
+
+                # Column 7: Scope dropdown
+                scope_combo = QComboBox()
+                scope_combo.addItems(["All Catalogs", "Per Catalog"])
+                # Disable mouse wheel
+                scope_combo.wheelEvent = lambda event: event.ignore()
+                scope_combo.setFocusPolicy(Qt.StrongFocus)
+                self.norm_table.setCellWidget(row_idx, 7, scope_combo)
+
+                # Note: Color coding is already applied to Status column above
+                # No need for additional row color coding
+
+                row_idx += 1
 
         # Count method types
         fuzzy_count = sum(1 for v in reasoning_map.values() if v.get('method') == 'fuzzy')
@@ -3970,7 +3855,7 @@ class SupplyFrameReviewPage(QWizardPage):
             QMessageBox.warning(self, "AI Not Available", "Claude AI package not installed.")
             return
 
-        start_page = self.wizard().page(0)
+        start_page = self._start_page
         api_key = start_page.get_api_key() if hasattr(start_page, 'get_api_key') else None
         if not api_key:
             QMessageBox.warning(self, "No API Key", "Please configure Claude AI API key in Step 1.")
@@ -4009,8 +3894,7 @@ class SupplyFrameReviewPage(QWizardPage):
 
         try:
             # Call AI for single manufacturer
-            from anthropic import Anthropic
-            client = Anthropic(api_key=api_key)
+            client = get_anthropic_client(api_key)
 
             prompt = f"""Analyze this manufacturer name and suggest a normalized form.
 
@@ -4041,16 +3925,8 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
                 messages=[{"role": "user", "content": prompt}]
             )
 
-            response_text = response.content[0].text.strip()
-
             # Clean up code blocks
-            if response_text.startswith('```'):
-                parts = response_text.split('```')
-                if len(parts) >= 2:
-                    response_text = parts[1]
-                    if response_text.startswith('json'):
-                        response_text = response_text[4:]
-                    response_text = response_text.strip()
+            response_text = strip_code_fence(response.content[0].text.strip())
 
             # Parse JSON
             import re
@@ -4112,7 +3988,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
         # Check the Include checkbox if normalization is different
         include_widget = self.norm_table.cellWidget(row_idx, 0)
         if include_widget:
-            checkbox = include_widget.findChild(QCheckBox)
+            checkbox = include_widget.checkbox
             if checkbox and original_mfg != canonical_name:
                 checkbox.setChecked(True)
 
@@ -4131,7 +4007,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
         scope_data = scope_combo.currentData()
         if scope_data == "specific":
             # Get available sheets from the combined data
-            xml_gen_page = self.wizard().page(3)
+            xml_gen_page = self._pas_page
             available_sheets = []
 
             if hasattr(xml_gen_page, 'combined_data'):
@@ -4257,23 +4133,33 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
         """Apply all changes and generate comparison"""
         try:
             # Get the combined data from ColumnMappingPage (Step 2)
-            column_mapping_page = self.wizard().page(2)  # ColumnMappingPage
+            column_mapping_page = self._mapping_page
             if not hasattr(column_mapping_page, 'combined_data') or column_mapping_page.combined_data is None or column_mapping_page.combined_data.empty:
                 QMessageBox.warning(self, "No Data",
                                   "No combined data available from Step 2.\n"
                                   "Please complete Step 2 first.")
                 return
 
-            # Create a copy of the original data (convert DataFrame to list of dicts)
-            import copy
-            old_data = column_mapping_page.combined_data.to_dict('records')
-            new_data = column_mapping_page.combined_data.to_dict('records')
+            # Work on copies of the MFG / MFG_PN columns; the DataFrame from Step 2
+            # stays untouched and serves as the "old" side of the comparison
+            old_df = column_mapping_page.combined_data
+            mfg_values = old_df['MFG'].to_numpy(dtype=object, copy=True)
+            pn_values = old_df['MFG_PN'].to_numpy(dtype=object, copy=True)
 
             # Track changes for summary
             matches_applied = 0
             normalizations_applied = 0
 
+            # Rows whose MFG / MFG_PN were touched, so the comparison only has
+            # to check those rows
+            touched_mfg = np.zeros(len(old_df), dtype=bool)
+            touched_pn = np.zeros(len(old_df), dtype=bool)
+
             # Step 1: Apply selected partial matches
+            # Index row positions by (MFG_PN, MFG) once instead of scanning
+            # every row for every part
+            pn_mfg_index = old_df.groupby(['MFG_PN', 'MFG'], sort=False, dropna=False).indices
+
             if hasattr(self, 'search_results'):
                 for part_data in self.search_results:
                     if 'selected_match' in part_data and part_data['selected_match']:
@@ -4292,24 +4178,39 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
                             continue  # Skip invalid format
 
                         if new_pn and new_mfg:
-                            # Find and update all matching records in new_data
-                            original_pn = part_data['PartNumber']
-                            original_mfg = part_data['ManufacturerName']
-
-                            for record in new_data:
-                                if (record['MFG_PN'] == original_pn and
-                                    record['MFG'] == original_mfg):
-                                    record['MFG_PN'] = new_pn
-                                    record['MFG'] = new_mfg
-                                    matches_applied += 1
+                            # Find and update all matching rows
+                            original_key = (part_data['PartNumber'], part_data['ManufacturerName'])
+                            new_key = (new_pn, new_mfg)
+                            if original_key == new_key:
+                                matches_applied += len(pn_mfg_index.get(original_key, ()))
+                                continue
+
+                            indices = pn_mfg_index.pop(original_key, None)
+                            if indices is None or not len(indices):
+                                continue
+                            pn_values[indices] = new_pn
+                            mfg_values[indices] = new_mfg
+                            matches_applied += len(indices)
+                            touched_pn[indices] = True
+                            touched_mfg[indices] = True
+
+                            # Keep the index in sync so later parts see updated values
+                            if new_key in pn_mfg_index:
+                                indices = np.concatenate([pn_mfg_index[new_key], indices])
+                            pn_mfg_index[new_key] = indices
 
             # Step 2: Apply manufacturer normalizations
+            # Bucket row positions by MFG so each normalization only visits
+            # the rows it can affect
+            mfg_index = pd.Series(mfg_values).groupby(mfg_values, sort=False).indices
+            source_sheets = old_df['Source_Sheet'].to_numpy() if 'Source_Sheet' in old_df.columns else None
+
             for row_idx in range(self.norm_table.rowCount()):
                 # Check if this normalization is included
                 include_widget = self.norm_table.cellWidget(row_idx, 0)
                 if not include_widget:
                     continue
-                include_checkbox = include_widget.findChild(QCheckBox)
+                include_checkbox = include_widget.checkbox
                 if not include_checkbox or not include_checkbox.isChecked():
                     continue
 
@@ -4327,25 +4228,45 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
                 # Get selected sheets for this row (if specific sheets were selected)
                 selected_sheets = self.normalization_scopes.get(row_idx, None)
 
+                bucket = mfg_index.get(variation)
+                if bucket is None or not len(bucket):
+                    continue
+
                 # Apply normalization based on scope
                 if scope == "All Catalogs" or selected_sheets is None:
                     # Apply to all records with this manufacturer variation
-                    for record in new_data:
-                        if record['MFG'] == variation:
-                            record['MFG'] = canonical
-                            normalizations_applied += 1
+                    moved = bucket
+                    remaining = bucket[:0]
+                elif source_sheets is None:
+                    continue
                 else:
                     # Apply only to records from selected sheets
-                    for record in new_data:
-                        if record['MFG'] == variation and record.get('Source_Sheet') in selected_sheets:
-                            record['MFG'] = canonical
-                            normalizations_applied += 1
+                    in_scope = np.isin(source_sheets[bucket], list(selected_sheets))
+                    moved = bucket[in_scope]
+                    remaining = bucket[~in_scope]
+
+                mfg_values[moved] = canonical
+                normalizations_applied += len(moved)
+                touched_mfg[moved] = True
+
+                if variation != canonical:
+                    mfg_index[variation] = remaining
+                    if canonical in mfg_index:
+                        moved = np.concatenate([mfg_index[canonical], moved])
+                    mfg_index[canonical] = moved
+
+            new_df = old_df.copy()
+            new_df['MFG'] = mfg_values
+            new_df['MFG_PN'] = pn_values
 
             # Step 3: Populate comparison tables
-            self.populate_comparison_tables(old_data, new_data)
+            # (a touched value may have been changed back, so confirm against old_df)
+            changed_mfg = set(np.flatnonzero(touched_mfg & (old_df['MFG'].to_numpy(dtype=object) != mfg_values)).tolist())
+            changed_pn = set(np.flatnonzero(touched_pn & (old_df['MFG_PN'].to_numpy(dtype=object) != pn_values)).tolist())
+            self.populate_comparison_tables(old_df, new_df, changed_mfg, changed_pn)
 
             # Step 4: Store the new data for later use
-            self.updated_data = new_data
+            self.updated_data = new_df
 
             # Show summary
             QMessageBox.information(self, "Changes Applied",
@@ -4357,57 +4278,73 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to apply changes:\n{str(e)}")
 
-    def populate_comparison_tables(self, old_data, new_data):
-        """Populate side-by-side comparison tables with highlighting"""
-        # Clear existing data
-        self.old_data_table.setRowCount(0)
-        self.new_data_table.setRowCount(0)
-
-        # Set row count
-        row_count = len(old_data)
-        self.old_data_table.setRowCount(row_count)
-        self.new_data_table.setRowCount(row_count)
-
-        # Track changes
-        changed_rows = 0
-
-        for idx, (old_record, new_record) in enumerate(zip(old_data, new_data)):
-            row_changed = False
-
-            # Old data table
-            old_mfg_item = QTableWidgetItem(old_record['MFG'])
-            old_pn_item = QTableWidgetItem(old_record['MFG_PN'])
-            old_desc_item = QTableWidgetItem(old_record['Description'][:50] + "..."
-                                            if len(old_record['Description']) > 50
-                                            else old_record['Description'])
-
-            # New data table
-            new_mfg_item = QTableWidgetItem(new_record['MFG'])
-            new_pn_item = QTableWidgetItem(new_record['MFG_PN'])
-            new_desc_item = QTableWidgetItem(new_record['Description'][:50] + "..."
-                                            if len(new_record['Description']) > 50
-                                            else new_record['Description'])
-
-            # Highlight changes
-            if old_record['MFG'] != new_record['MFG']:
-                new_mfg_item.setBackground(QColor(255, 255, 200))  # Light yellow
-                row_changed = True
-
-            if old_record['MFG_PN'] != new_record['MFG_PN']:
-                new_pn_item.setBackground(QColor(255, 255, 200))  # Light yellow
-                row_changed = True
-
-            if row_changed:
-                changed_rows += 1
-
-            # Set items
-            self.old_data_table.setItem(idx, 0, old_mfg_item)
-            self.old_data_table.setItem(idx, 1, old_pn_item)
-            self.old_data_table.setItem(idx, 2, old_desc_item)
-
-            self.new_data_table.setItem(idx, 0, new_mfg_item)
-            self.new_data_table.setItem(idx, 1, new_pn_item)
-            self.new_data_table.setItem(idx, 2, new_desc_item)
+    def populate_comparison_tables(self, old_df, new_df, changed_mfg=None, changed_pn=None):
+        """
+        Populate side-by-side comparison tables with highlighting
+
+        old_df / new_df are row-aligned DataFrames with MFG, MFG_PN and
+        Description columns. changed_mfg / changed_pn are optional sets of row
+        positions whose MFG or MFG_PN differ; when omitted they are computed
+        by comparing the columns.
+        """
+        def changed_positions(column):
+            old_col = old_df[column].reset_index(drop=True)
+            new_col = new_df[column].reset_index(drop=True)
+            same = old_col.eq(new_col) | (old_col.isna() & new_col.isna())
+            return set(np.flatnonzero(~same.to_numpy()).tolist())
+
+        if changed_mfg is None:
+            changed_mfg = changed_positions('MFG')
+        if changed_pn is None:
+            changed_pn = changed_positions('MFG_PN')
+
+        with bulk_table_update(self.old_data_table, self.new_data_table):
+            # Clear existing data
+            self.old_data_table.setRowCount(0)
+            self.new_data_table.setRowCount(0)
+
+            # Set row count
+            row_count = len(old_df)
+            self.old_data_table.setRowCount(row_count)
+            self.new_data_table.setRowCount(row_count)
+
+            # Track changes
+            changed_rows = len(changed_mfg | changed_pn)
+
+            # Truncate descriptions for display once per column instead of per row
+            old_descs = truncate_for_display(old_df['Description'])
+            new_descs = truncate_for_display(new_df['Description'])
+
+            highlight = QColor(255, 255, 200)  # Light yellow
+
+            rows = zip(old_df['MFG'].tolist(), old_df['MFG_PN'].tolist(),
+                       new_df['MFG'].tolist(), new_df['MFG_PN'].tolist())
+            for idx, (old_mfg, old_pn, new_mfg, new_pn) in enumerate(rows):
+                # Old data table
+                old_mfg_item = QTableWidgetItem(old_mfg)
+                old_pn_item = QTableWidgetItem(old_pn)
+                old_desc_item = QTableWidgetItem(old_descs[idx])
+
+                # New data table
+                new_mfg_item = QTableWidgetItem(new_mfg)
+                new_pn_item = QTableWidgetItem(new_pn)
+                new_desc_item = QTableWidgetItem(new_descs[idx])
+
+                # Highlight changes
+                if idx in changed_mfg:
+                    new_mfg_item.setBackground(highlight)
+
+                if idx in changed_pn:
+                    new_pn_item.setBackground(highlight)
+
+                # Set items
+                self.old_data_table.setItem(idx, 0, old_mfg_item)
+                self.old_data_table.setItem(idx, 1, old_pn_item)
+                self.old_data_table.setItem(idx, 2, old_desc_item)
+
+                self.new_data_table.setItem(idx, 0, new_mfg_item)
+                self.new_data_table.setItem(idx, 1, new_pn_item)
+                self.new_data_table.setItem(idx, 2, new_desc_item)
 
         # Update summary label
         self.comparison_summary.setText(
@@ -4418,14 +4355,14 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
     def regenerate_xml(self):
         """Regenerate XML files with updated data"""
         try:
-            if not hasattr(self, 'updated_data') or not self.updated_data:
+            if getattr(self, 'updated_data', None) is None or self.updated_data.empty:
                 QMessageBox.warning(self, "No Data",
                                   "No updated data available.\n"
                                   "Please apply changes first.")
                 return
 
             # Get configuration from XMLGenerationPage (Step 3)
-            prev_page_3 = self.wizard().page(3)  # XMLGenerationPage
+            prev_page_3 = self._pas_page
 
             # Get project settings
             project_name = prev_page_3.project_name.text()
@@ -4433,7 +4370,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
             output_dir = Path(prev_page_3.output_path.text())
 
             # Get Excel file path to determine base name
-            prev_page_1 = self.wizard().page(1)  # DataSourcePage
+            prev_page_1 = self._data_page
             excel_path = prev_page_1.get_excel_path()
 
             if not excel_path:
@@ -4447,129 +4384,58 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
             mfg_xml_path = output_dir / f"{base_name}_MFG_Updated.xml"
             mfgpn_xml_path = output_dir / f"{base_name}_MFGPN_Updated.xml"
 
-            # Extract unique manufacturers from updated data
-            unique_mfgs = sorted(set(record['MFG'] for record in self.updated_data
-                                    if record['MFG'] and record['MFG'].strip()))
-
-            # Prepare MFGPN data
-            mfgpn_data = []
-            for record in self.updated_data:
-                if record['MFG'] and record['MFG_PN']:
-                    mfgpn_data.append({
-                        'MFG': record['MFG'],
-                        'MFG_PN': record['MFG_PN'],
-                        'Description': record.get('Description', 'This is the PN description.')
-                    })
-
-            # Generate MFG XML
-            mfg_count = self.create_mfg_xml(unique_mfgs, mfg_xml_path, project_name, catalog)
-
-            # Generate MFGPN XML
-            mfgpn_count = self.create_mfgpn_xml(mfgpn_data, mfgpn_xml_path, project_name, catalog)
-
-            # Show success message
-            QMessageBox.information(self, "XML Generated",
-                                  f"Updated XML files generated successfully!\n\n"
-                                  f"Files created:\n"
-                                  f"• {mfg_xml_path.name} ({mfg_count} manufacturers)\n"
-                                  f"• {mfgpn_xml_path.name} ({mfgpn_count} part numbers)\n\n"
-                                  f"Output folder:\n{output_dir}")
+            # Extract unique manufacturers and unique (MFG, MFG_PN) pairs in one pass
+            updated_df = self.updated_data
+            if 'Description' in updated_df.columns:
+                descriptions = updated_df['Description'].tolist()
+            else:
+                descriptions = ['This is the PN description.'] * len(updated_df)
+
+            unique_mfgs = set()
+            unique_pairs = {}
+            for mfg, mfg_pn, description in zip(updated_df['MFG'].tolist(), updated_df['MFG_PN'].tolist(), descriptions):
+                if mfg and mfg.strip():
+                    unique_mfgs.add(mfg)
+                if mfg and mfg_pn:
+                    unique_pairs.setdefault((mfg, mfg_pn), description)
+            unique_mfgs = sorted(unique_mfgs)
+
+            # Write both XML files in the background to keep the UI responsive
+            self.xml_regen_paths = (mfg_xml_path, mfgpn_xml_path, output_dir)
+            self.xml_regen_thread = XMLGenerationThread(
+                unique_mfgs,
+                unique_pairs,
+                mfg_xml_path,
+                mfgpn_xml_path,
+                project_name,
+                catalog
+            )
+            self.xml_regen_thread.progress.connect(self.on_xml_regen_progress)
+            self.xml_regen_thread.finished.connect(self.on_xml_regen_finished)
+            self.xml_regen_thread.error.connect(self.on_xml_regen_error)
+            self.xml_regen_thread.start()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to regenerate XML:\n{str(e)}")
 
-    def escape_xml(self, text):
-        """Escape special XML characters"""
-        if pd.isna(text):
-            return ""
-        text = str(text)
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace('"', "&quot;")
-        text = text.replace("'", "&apos;")
-        return text
-
-    def create_mfg_xml(self, manufacturers, output_file, project_name, catalog):
-        """Create MFG XML file"""
-        root = ET.Element('data')
-
-        for mfg in manufacturers:
-            obj = ET.SubElement(root, 'object')
-            obj.set('objectid', self.escape_xml(mfg))
-            obj.set('catalog', catalog)
-            obj.set('class', '090')
-
-            field1 = ET.SubElement(obj, 'field')
-            field1.set('id', '090obj_skn')
-            field1.text = catalog
-
-            field2 = ET.SubElement(obj, 'field')
-            field2.set('id', '090obj_id')
-            field2.text = self.escape_xml(mfg)
-
-            field3 = ET.SubElement(obj, 'field')
-            field3.set('id', '090her_name')
-            field3.text = self.escape_xml(mfg)
-
-        self.save_xml(root, output_file, project_name)
-        return len(manufacturers)
-
-    def create_mfgpn_xml(self, mfgpn_data, output_file, project_name, catalog):
-        """Create MFGPN XML file"""
-        # Remove duplicates
-        unique_pairs = {}
-        for item in mfgpn_data:
-            key = (item['MFG'], item['MFG_PN'])
-            if key not in unique_pairs:
-                unique_pairs[key] = item['Description']
-
-        root = ET.Element('data')
-
-        for (mfg, mfg_pn), description in unique_pairs.items():
-            objectid = f"{mfg}:{mfg_pn}"
-
-            obj = ET.SubElement(root, 'object')
-            obj.set('objectid', self.escape_xml(objectid))
-            obj.set('class', '060')
-
-            field1 = ET.SubElement(obj, 'field')
-            field1.set('id', '060partnumber')
-            field1.text = self.escape_xml(mfg_pn)
-
-            field2 = ET.SubElement(obj, 'field')
-            field2.set('id', '060mfgref')
-            field2.text = self.escape_xml(mfg)
-
-            field3 = ET.SubElement(obj, 'field')
-            field3.set('id', '060komp_name')
-            field3.text = self.escape_xml(description)
-
-        self.save_xml(root, output_file, project_name)
-        return len(unique_pairs)
-
-    def save_xml(self, root, output_file, project_name):
-        """Format and save XML file"""
-        xml_str = ET.tostring(root, encoding='utf-8', method='xml')
-        dom = minidom.parseString(xml_str)
-
-        comment_lines = [
-            f'Created By: EDM Library Creator v1.7.000.0130',
-            f'DDP Project: {project_name}',
-            f'Date: {datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")}'
-        ]
-
-        xml_lines = ['<?xml version="1.0" encoding="utf-8" standalone="yes"?>']
-        for comment in comment_lines:
-            xml_lines.append(f'<!--{comment}-->')
-
-        formatted = dom.toprettyxml(indent='  ', encoding='utf-8').decode('utf-8')
-        xml_content = '\n'.join(formatted.split('\n')[1:])
-
-        final_xml = '\n'.join(xml_lines) + '\n' + xml_content
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(final_xml)
+    def on_xml_regen_progress(self, message, current, total):
+        """Update XML regeneration progress"""
+        self.csv_summary.setText(f"{message} ({current}/{total})")
+        self.csv_summary.setStyleSheet("padding: 5px; background-color: #e3f2fd; border-radius: 3px;")
+
+    def on_xml_regen_finished(self, counts):
+        """Show XML regeneration results"""
+        mfg_xml_path, mfgpn_xml_path, output_dir = self.xml_regen_paths
+        QMessageBox.information(self, "XML Generated",
+                              f"Updated XML files generated successfully!\n\n"
+                              f"Files created:\n"
+                              f"• {mfg_xml_path.name} ({counts['mfg_count']} manufacturers)\n"
+                              f"• {mfgpn_xml_path.name} ({counts['mfgpn_count']} part numbers)\n\n"
+                              f"Output folder:\n{output_dir}")
+
+    def on_xml_regen_error(self, error_msg):
+        """Handle XML regeneration errors"""
+        QMessageBox.critical(self, "Error", f"Failed to regenerate XML:\n{error_msg}")
 
     def show_normalization_context_menu(self, position):
         """Show context menu for normalization table"""
@@ -4654,7 +4520,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
         for row_idx in range(self.norm_table.rowCount()):
             include_widget = self.norm_table.cellWidget(row_idx, 0)
             if include_widget:
-                include_checkbox = include_widget.findChild(QCheckBox)
+                include_checkbox = include_widget.checkbox
                 if include_checkbox and include_checkbox.isChecked():
                     enabled_count += 1
 
@@ -4673,7 +4539,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
                 include_widget = self.norm_table.cellWidget(row_idx, 0)
                 if not include_widget:
                     continue
-                include_checkbox = include_widget.findChild(QCheckBox)
+                include_checkbox = include_widget.checkbox
                 if include_checkbox and include_checkbox.isChecked():
                     original_item = self.norm_table.item(row_idx, 2)
                     if original_item:
@@ -4701,7 +4567,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
                 include_widget = self.norm_table.cellWidget(row_idx, 0)
                 if not include_widget:
                     continue
-                include_checkbox = include_widget.findChild(QCheckBox)
+                include_checkbox = include_widget.checkbox
                 if include_checkbox and include_checkbox.isChecked():
                     original_item = self.norm_table.item(row_idx, 2)  # Column 2: Original MFG
                     normalize_combo = self.norm_table.cellWidget(row_idx, 3)  # Column 3: Normalize To
@@ -4733,7 +4599,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
         """Apply normalizations and create output file with Combined_New sheet"""
         try:
             # Get the combined data from Step 2
-            column_mapping_page = self.wizard().page(2)
+            column_mapping_page = self._mapping_page
             if not hasattr(column_mapping_page, 'combined_data') or column_mapping_page.combined_data is None:
                 QMessageBox.warning(self, "No Data", "No combined data found from Step 2.")
                 return False
@@ -4746,7 +4612,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
             source_excel = column_mapping_page.output_excel_path
 
             # Get output folder from StartPage
-            start_page = self.wizard().page(0)
+            start_page = self._start_page
             output_folder = start_page.get_output_folder() if hasattr(start_page, 'get_output_folder') else None
 
             if not output_folder:
@@ -4818,7 +4684,7 @@ IMPORTANT: Return ONLY valid JSON, no markdown, no other text."""
                     include_widget = self.norm_table.cellWidget(row_idx, 0)
                     if not include_widget:
                         continue
-                    include_checkbox = include_widget.findChild(QCheckBox)
+                    include_checkbox = include_widget.checkbox
                     if include_checkbox and include_checkbox.isChecked():
                         original_item = self.norm_table.item(row_idx, 2)  # Column 2: Original MFG
                         normalize_combo = self.norm_table.cellWidget(row_idx, 3)  # Column 3: Normalize To
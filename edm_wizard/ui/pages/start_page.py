@@ -4,9 +4,10 @@ Start Page: Claude AI API Key and PAS API Configuration
 
 import sys
 import os
+import re
 from pathlib import Path
 from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from PyQt5.QtWidgets import (
@@ -14,7 +15,7 @@ try:
         QGroupBox, QLabel, QLineEdit, QPushButton, QCheckBox, QComboBox,
         QSpinBox, QFileDialog, QMessageBox, QApplication
     )
-    from PyQt5.QtCore import Qt, QSettings, QThread, pyqtSignal
+    from PyQt5.QtCore import Qt, QSettings, QThread, QTimer, pyqtSignal
 except ImportError:
     print("Error: PyQt5 is required.")
     sys.exit(1)
@@ -25,6 +26,40 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+from edm_wizard.workers.threads import ApiTestThread
+from edm_wizard.utils.serialization import dumps_json, loads_json
+from edm_wizard.api.pas_client import PAS_SESSION
+from edm_wizard.utils.constants import PAS_AUTH_URL
+
+CONFIG_FILE = Path.home() / ".edm_wizard_config.json"
+
+# Version number in XPED installation folder names such as "XPED2510"
+_XPED_VERSION_RE = re.compile(r'XPED(\d+)', re.IGNORECASE)
+
+# Quiet period after the last keystroke before credential widgets are refreshed
+CREDENTIALS_DEBOUNCE_MS = 150
+
+# Root directories searched for XPED installations
+XPED_SEARCH_ROOTS = [r"C:\SiemensEDA", r"C:\MentorGraphics", r"C:\Program Files\SiemensEDA", r"C:\Program Files\MentorGraphics"]
+
+
+def _scan_xped_root(root_path):
+    """Return (sdd_home_path, folder_name) for each XPED install with SDD_HOME under root_path"""
+    found = []
+    try:
+        # scandir entries cache the directory flag, saving a stat per item
+        with os.scandir(root_path) as entries:
+            for entry in entries:
+                # Directories whose name contains "XPED" (case-insensitive)
+                if "XPED" in entry.name.upper() and entry.is_dir():
+                    # Check if SDD_HOME subdirectory exists
+                    sdd_home_path = os.path.join(entry.path, "SDD_HOME")
+                    if os.path.isdir(sdd_home_path):
+                        found.append((sdd_home_path, entry.name))
+    except OSError:
+        pass  # Missing or unreadable root
+    return found
+
 
 
 class StartPage(QWizardPage):
@@ -35,6 +70,10 @@ class StartPage(QWizardPage):
         self.setTitle("Welcome to EDM Library Wizard")
         self.setSubTitle("Configure API credentials for intelligent column mapping and part search")
 
+        # Coalesce per-keystroke textChanged signals into one widget update
+        self._api_debounce = self._create_debounce_timer(self._apply_api_key_state)
+        self._pas_debounce = self._create_debounce_timer(self._apply_pas_credentials_state)
+
         # Create scroll area to handle overflow
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -300,37 +339,42 @@ class StartPage(QWizardPage):
         self.setLayout(page_layout)
 
         # Load saved credentials if available
+        self.saved_config = {}  # Last contents written to / read from CONFIG_FILE
         self.load_saved_credentials()
 
         # Store whether APIs are validated
         self.api_validated = False
         self.pas_validated = False
         self.skip_ai_mode = False
+        self.api_test_thread = None
 
     def load_saved_credentials(self):
         """Load API credentials from config file if it exists"""
-        config_file = Path.home() / ".edm_wizard_config.json"
+        config_file = CONFIG_FILE
         if config_file.exists():
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    if 'api_key' in config:
-                        self.api_key_input.setText(config['api_key'])
-                        self.test_status.setText("✓ Loaded saved Claude API key")
-                        self.test_status.setStyleSheet("color: green;")
-                    if 'client_id' in config:
-                        self.client_id_input.setText(config['client_id'])
-                    if 'client_secret' in config:
-                        self.client_secret_input.setText(config['client_secret'])
-                        if config.get('client_id') and config.get('client_secret'):
-                            self.test_pas_status.setText("✓ Loaded saved PAS credentials")
-                            self.test_pas_status.setStyleSheet("color: green;")
+                config = loads_json(config_file.read_bytes())
+                self.saved_config = config
+                if 'api_key' in config:
+                    self.api_key_input.setText(config['api_key'])
+                if 'client_id' in config:
+                    self.client_id_input.setText(config['client_id'])
+                if 'client_secret' in config:
+                    self.client_secret_input.setText(config['client_secret'])
+                # Apply the field updates now so they do not clear the messages below
+                self.flush_credential_updates()
+                if 'api_key' in config:
+                    self.test_status.setText("✓ Loaded saved Claude API key")
+                    self.test_status.setStyleSheet("color: green;")
+                if config.get('client_id') and config.get('client_secret'):
+                    self.test_pas_status.setText("✓ Loaded saved PAS credentials")
+                    self.test_pas_status.setStyleSheet("color: green;")
             except Exception as e:
                 pass
 
     def save_credentials(self):
         """Save all credentials to config file"""
-        config_file = Path.home() / ".edm_wizard_config.json"
+        config_file = CONFIG_FILE
         try:
             config = {}
             if self.save_key_checkbox.isChecked() and self.api_key_input.text().strip():
@@ -341,33 +385,64 @@ class StartPage(QWizardPage):
                 if self.client_secret_input.text().strip():
                     config['client_secret'] = self.client_secret_input.text()
             
-            if config:
-                with open(config_file, 'w') as f:
-                    json.dump(config, f)
+            # Skip the write when nothing changed (this runs on every page advance);
+            # otherwise write a temp file and rename it so a crash mid-write
+            # never leaves a truncated config
+            if config and config != self.saved_config:
+                tmp_file = config_file.with_name(config_file.name + '.tmp')
+                tmp_file.write_text(dumps_json(config), encoding='utf-8')
+                os.replace(tmp_file, config_file)
+                self.saved_config = config
         except Exception as e:
             QMessageBox.warning(self, "Save Error", f"Could not save credentials: {str(e)}")
 
     def clear_saved_credentials(self):
         """Clear saved credentials from config file"""
-        config_file = Path.home() / ".edm_wizard_config.json"
+        config_file = CONFIG_FILE
+        self.saved_config = {}
         if config_file.exists():
             try:
                 config_file.unlink()
             except Exception as e:
                 pass
 
+    def _create_debounce_timer(self, slot):
+        """Create a single-shot timer that calls slot once typing pauses"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(CREDENTIALS_DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
+
+    def flush_credential_updates(self):
+        """Run any pending debounced widget updates immediately"""
+        if self._api_debounce.isActive():
+            self._api_debounce.stop()
+            self._apply_api_key_state()
+        if self._pas_debounce.isActive():
+            self._pas_debounce.stop()
+            self._apply_pas_credentials_state()
+
     def on_api_key_changed(self):
+        """Invalidate the API test result and schedule the widget update"""
+        self.api_validated = False
+        self._api_debounce.start()
+
+    def _apply_api_key_state(self):
         """Enable test button when API key is entered"""
         self.test_btn.setEnabled(len(self.api_key_input.text().strip()) > 0)
-        self.api_validated = False
         self.test_status.setText("")
 
     def on_pas_credentials_changed(self):
+        """Invalidate the PAS test result and schedule the widget update"""
+        self.pas_validated = False
+        self._pas_debounce.start()
+
+    def _apply_pas_credentials_state(self):
         """Enable test button when PAS credentials are entered"""
         has_both = (len(self.client_id_input.text().strip()) > 0 and 
                    len(self.client_secret_input.text().strip()) > 0)
         self.test_pas_btn.setEnabled(has_both)
-        self.pas_validated = False
         self.test_pas_status.setText("")
 
     def toggle_key_visibility(self):
@@ -399,36 +474,45 @@ class StartPage(QWizardPage):
             )
             return
 
+        # The test reads the current text; a pending update would clear its status
+        self._api_debounce.stop()
+
         api_key = self.api_key_input.text().strip()
         if not api_key:
             self.test_status.setText("⚠ Please enter an API key")
             self.test_status.setStyleSheet("color: orange;")
             return
 
+        if self.api_test_thread is not None and self.api_test_thread.isRunning():
+            return
+
         self.test_status.setText("Testing connection...")
         self.test_status.setStyleSheet("color: blue;")
         self.test_btn.setEnabled(False)
-        QApplication.processEvents()
 
-        try:
-            client = Anthropic(api_key=api_key)
-            # Simple test message - use Claude Haiku 4.5 (fast and cost-effective)
-            response = client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=10,
-                messages=[{"role": "user", "content": "test"}]
-            )
+        # Run the request in the background so the window stays responsive
+        self.api_test_thread = ApiTestThread(api_key)
+        self.api_test_thread.finished.connect(self.on_api_test_finished)
+        self.api_test_thread.start()
 
+    def on_api_test_finished(self, success, error_msg):
+        """Handle the result of the Claude API connection test"""
+        tested_key = self.api_test_thread.api_key
+        self.test_btn.setEnabled(bool(self.api_key_input.text().strip()))
+
+        # The key was edited while the test ran: the result no longer applies
+        if tested_key != self.api_key_input.text().strip():
+            return
+
+        if success:
             self.api_validated = True
             self.test_status.setText("✓ Connection successful!")
             self.test_status.setStyleSheet("color: green;")
 
             # Save credentials if checkbox is checked
             self.save_credentials()
-
-        except Exception as e:
+        else:
             self.api_validated = False
-            error_msg = str(e)
             # Show more detailed error message
             self.test_status.setText(f"✗ Failed: {error_msg[:50]}...")
             self.test_status.setStyleSheet("color: red;")
@@ -444,13 +528,14 @@ class StartPage(QWizardPage):
                 "3. You have internet connectivity"
             )
 
-        self.test_btn.setEnabled(True)
-
     def test_pas_credentials(self):
         """Test the PAS API connection"""
         client_id = self.client_id_input.text().strip()
         client_secret = self.client_secret_input.text().strip()
 
+        # The test reads the current text; a pending update would clear its status
+        self._pas_debounce.stop()
+
         if not client_id or not client_secret:
             self.test_pas_status.setText("⚠ Please enter both credentials")
             self.test_pas_status.setStyleSheet("color: orange;")
@@ -462,11 +547,8 @@ class StartPage(QWizardPage):
         QApplication.processEvents()
 
         try:
-            import requests
-            import urllib.parse
-
             # PAS authentication endpoint
-            auth_url = "https://samauth.us-east-1.sws.siemens.com/token"
+            auth_url = PAS_AUTH_URL
             
             # Use basic auth with client credentials
             auth = (client_id, client_secret)
@@ -480,7 +562,7 @@ class StartPage(QWizardPage):
                 'Content-Type': 'application/x-www-form-urlencoded'
             }
             
-            response = requests.post(
+            response = PAS_SESSION.post(
                 auth_url,
                 auth=auth,
                 data=auth_data,
@@ -538,29 +620,17 @@ class StartPage(QWizardPage):
         QApplication.processEvents()
 
         # Search for any XPED installation in common root directories
-        found_paths = []
-        try:
-            for root_path in [r"C:\SiemensEDA", r"C:\MentorGraphics", r"C:\Program Files\SiemensEDA", r"C:\Program Files\MentorGraphics"]:
-                if os.path.exists(root_path):
-                    # Search for directories matching *XPED* pattern
-                    for item in os.listdir(root_path):
-                        item_path = os.path.join(root_path, item)
-                        # Check if it's a directory and contains "XPED" (case-insensitive)
-                        if os.path.isdir(item_path) and "XPED" in item.upper():
-                            # Check if SDD_HOME subdirectory exists
-                            sdd_home_path = os.path.join(item_path, "SDD_HOME")
-                            if os.path.exists(sdd_home_path) and os.path.isdir(sdd_home_path):
-                                found_paths.append((sdd_home_path, item))
-        except Exception as e:
-            pass
+        # Roots are scanned concurrently so one slow (e.g. network) volume
+        # does not add its latency to the others; map keeps root order
+        with ThreadPoolExecutor(max_workers=len(XPED_SEARCH_ROOTS)) as executor:
+            found_paths = [path for root_found in executor.map(_scan_xped_root, XPED_SEARCH_ROOTS)
+                           for path in root_found]
 
         # If we found any XPED installations with SDD_HOME, use the first one (or latest version)
         if found_paths:
             # Sort by version number (extract from name) - prefer higher versions
             def extract_version(name):
-                # Extract numeric part from names like "XPED2510"
-                import re
-                match = re.search(r'XPED(\d+)', name.upper())
+                match = _XPED_VERSION_RE.search(name)
                 return int(match.group(1)) if match else 0
 
             found_paths.sort(key=lambda x: extract_version(x[1]), reverse=True)
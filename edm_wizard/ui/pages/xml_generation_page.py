@@ -6,12 +6,10 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-import json
 import threading
 import time
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
 import requests
 
 try:
@@ -41,7 +39,8 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
-from edm_wizard.utils.xml_generation import escape_xml
+from edm_wizard.workers.threads import XMLGenerationThread
+from edm_wizard.utils.serialization import dumps_json
 
 
 
@@ -150,27 +149,11 @@ class XMLGenerationPage(QWizardPage):
             mappings = prev_page_1.get_mappings()
             output_dir = Path(self.output_path.text())
 
-            # Check if Combined sheet should be used
-            if prev_page_1.should_combine():
-                # Reload to get Combined sheet
-                xl_file = pd.ExcelFile(excel_path)
-                if 'Combined' in xl_file.sheet_names:
-                    combined_df = pd.read_excel(excel_path, sheet_name='Combined')
-                    # Combined sheet already has standardized column names
-                    self.generate_xml_from_df(combined_df, excel_path,
-                                             {'MFG': 'MFG', 'MFG_PN': 'MFG_PN',
-                                              'Description': 'Description'})
-                else:
-                    QMessageBox.warning(self, "Warning", "Combined sheet not found. Using individual sheets.")
-                    self.generate_xml_from_sheets(dataframes, excel_path, mappings)
-            else:
-                self.generate_xml_from_sheets(dataframes, excel_path, mappings)
-
-            # Copy Excel file to output folder
+            # Copy Excel file to output folder (contents only; file metadata is not needed)
             excel_filename = Path(excel_path).name
             dest_excel = output_dir / excel_filename
             if Path(excel_path) != dest_excel:
-                shutil.copy2(excel_path, dest_excel)
+                shutil.copyfile(excel_path, dest_excel)
 
             # Save configuration file to output folder
             config_file = output_dir / "column_mapping_config.json"
@@ -179,11 +162,32 @@ class XMLGenerationPage(QWizardPage):
                 'timestamp': self.timestamp,
                 'version': '1.0'
             }
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(config_file, 'w', encoding='utf-8') as f:
+                f.write(dumps_json(config, indent=True))
 
-            self.xml_generated = True
-            self.completeChanged.emit()
+            # Check if Combined sheet should be used
+            if prev_page_1.should_combine():
+                # The mapping page keeps the frame it wrote to the Combined
+                # sheet, so the workbook only needs re-reading without it
+                combined_df = getattr(prev_page_1, 'combined_data', None)
+                if combined_df is None or combined_df.empty:
+                    with pd.ExcelFile(excel_path) as xl_file:
+                        if 'Combined' in xl_file.sheet_names:
+                            # Only the standardized part columns are used
+                            combined_df = xl_file.parse(
+                                'Combined', usecols=lambda col: col in ('MFG', 'MFG_PN', 'Description'))
+                        else:
+                            combined_df = None
+                if combined_df is not None:
+                    # Combined sheet already has standardized column names
+                    self.generate_xml_from_df(combined_df, excel_path,
+                                             {'MFG': 'MFG', 'MFG_PN': 'MFG_PN',
+                                              'Description': 'Description'})
+                else:
+                    QMessageBox.warning(self, "Warning", "Combined sheet not found. Using individual sheets.")
+                    self.generate_xml_from_sheets(dataframes, excel_path, mappings)
+            else:
+                self.generate_xml_from_sheets(dataframes, excel_path, mappings)
 
         except Exception as e:
             QMessageBox.critical(self, "Generation Error", f"Failed to generate XML files: {str(e)}")
@@ -193,9 +197,7 @@ class XMLGenerationPage(QWizardPage):
         prev_page_1 = self.wizard().page(2)  # ColumnMappingPage is now page 2
         included_sheets = prev_page_1.get_included_sheets()
 
-        all_mfg = set()
-        all_mfgpn = []
-        self.combined_data = []
+        part_frames = []
 
         for sheet_name, df in dataframes.items():
             # Skip sheets that are not included
@@ -208,110 +210,135 @@ class XMLGenerationPage(QWizardPage):
                 continue
 
             # Extract data
-            mfg_col = mapping['MFG']
-            mfgpn_col = mapping['MFG_PN']
-            desc_col = mapping.get('Description', '')
+            part_frames.append(self.extract_part_columns(df, mapping))
 
-            df_filtered = df[[mfg_col, mfgpn_col]].copy()
-            if desc_col:
-                df_filtered['Description'] = df[desc_col]
-            else:
-                df_filtered['Description'] = "This is the PN description."
-
-            df_filtered.columns = ['MFG', 'MFG_PN', 'Description']
-
-            # Handle TBD option
-            if self.tbd_checkbox.isChecked():
-                mask = (df_filtered['MFG_PN'].notna()) & (df_filtered['MFG_PN'].astype(str).str.strip() != '')
-                df_filtered.loc[mask & (df_filtered['MFG'].isna() | (df_filtered['MFG'].astype(str).str.strip() == '')), 'MFG'] = 'TBD'
-
-            # Collect unique MFG
-            mfg_values = df_filtered['MFG'].dropna()
-            all_mfg.update(mfg_values.astype(str).str.strip().unique())
-
-            # Collect MFG/MFGPN pairs
-            df_pairs = df_filtered[['MFG', 'MFG_PN', 'Description']].dropna(subset=['MFG', 'MFG_PN'])
-            for _, row in df_pairs.iterrows():
-                data_row = {
-                    'MFG': str(row['MFG']).strip(),
-                    'MFG_PN': str(row['MFG_PN']).strip(),
-                    'Description': str(row['Description']) if pd.notna(row['Description']) else "This is the PN description."
-                }
-                all_mfgpn.append(data_row)
-                self.combined_data.append(data_row)
-
-        # Generate XML files
-        self.create_xml_files(all_mfg, all_mfgpn, excel_path)
+        self.generate_xml_from_parts(part_frames, excel_path)
 
     def generate_xml_from_df(self, df, excel_path, mapping):
         """Generate XML from a single dataframe"""
-        all_mfg = set()
-        all_mfgpn = []
+        self.generate_xml_from_parts([self.extract_part_columns(df, mapping)], excel_path)
 
-        mfg_col = mapping['MFG']
-        mfgpn_col = mapping['MFG_PN']
-        desc_col = mapping.get('Description', '')
+    def generate_xml_from_parts(self, part_frames, excel_path):
+        """
+        Generate XML from frames returned by extract_part_columns
 
-        df_copy = df.copy()
+        The frames are concatenated first so stripping, the TBD fill and
+        deduplication each run once over all sheets.
+        """
+        if part_frames:
+            df_parts = pd.concat(part_frames, ignore_index=True)
+        else:
+            df_parts = pd.DataFrame(columns=['MFG', 'MFG_PN', 'Description'], dtype='string')
+
+        df_parts['MFG'] = df_parts['MFG'].str.strip()
+        df_parts['MFG_PN'] = df_parts['MFG_PN'].str.strip()
 
         # Handle TBD option
         if self.tbd_checkbox.isChecked():
-            mask = (df_copy[mfgpn_col].notna()) & (df_copy[mfgpn_col].astype(str).str.strip() != '')
-            df_copy.loc[mask & (df_copy[mfg_col].isna() | (df_copy[mfg_col].astype(str).str.strip() == '')), mfg_col] = 'TBD'
-
-        # Collect unique MFG
-        mfg_values = df_copy[mfg_col].dropna()
-        all_mfg.update(mfg_values.astype(str).str.strip().unique())
+            tbd_mask = df_parts['MFG_PN'].fillna('').ne('') & df_parts['MFG'].fillna('').eq('')
+            df_parts['MFG'] = df_parts['MFG'].mask(tbd_mask, 'TBD')
 
         # Collect MFG/MFGPN pairs and store combined data
-        self.combined_data = []
-        for _, row in df_copy.iterrows():
-            if pd.notna(row[mfg_col]) and pd.notna(row[mfgpn_col]):
-                desc = row[desc_col] if desc_col and pd.notna(row[desc_col]) else "This is the PN description."
-                data_row = {
-                    'MFG': str(row[mfg_col]).strip(),
-                    'MFG_PN': str(row[mfgpn_col]).strip(),
-                    'Description': str(desc)
-                }
-                all_mfgpn.append(data_row)
-                self.combined_data.append(data_row)
+        self.combined_data = self.build_mfgpn_frame(df_parts)
 
         # Generate XML files
-        self.create_xml_files(all_mfg, all_mfgpn, excel_path)
+        self.create_xml_files(self.unique_manufacturers(df_parts['MFG']), self.combined_data, excel_path)
+
+    @staticmethod
+    def unique_manufacturers(mfg):
+        """Return the sorted, non-empty unique values of an MFG column"""
+        mfgs = mfg.dropna().drop_duplicates()
+        return np.sort(mfgs[mfgs.ne('')].to_numpy(dtype=object))
+
+    @staticmethod
+    def extract_part_columns(df, mapping):
+        """
+        Select the mapped MFG, MFG_PN and Description columns of a sheet
+
+        MFG and MFG_PN are cast to StringDtype (missing cells stay NA) and
+        Description to object, so concatenating sheets whose columns have
+        different dtypes does not change how the values are rendered.
+        """
+        desc_col = mapping.get('Description', '')
+        return pd.DataFrame({
+            'MFG': df[mapping['MFG']].astype('string'),
+            'MFG_PN': df[mapping['MFG_PN']].astype('string'),
+            'Description': df[desc_col].astype(object) if desc_col else "This is the PN description."
+        })
+
+    @staticmethod
+    def build_mfgpn_frame(df):
+        """
+        Normalize the combined part columns for the MFGPN XML
+
+        Rows missing MFG or MFG_PN are dropped and missing descriptions get
+        the placeholder text. Whole columns are converted at once instead of
+        iterating rows.
+        """
+        df_pairs = df.dropna(subset=['MFG', 'MFG_PN'])
+        return pd.DataFrame({
+            'MFG': df_pairs['MFG'].to_numpy(dtype=object),
+            'MFG_PN': df_pairs['MFG_PN'].to_numpy(dtype=object),
+            'Description': df_pairs['Description'].fillna("This is the PN description.").astype(str).to_numpy(dtype=object)
+        })
 
     def create_xml_files(self, manufacturers, mfgpn_data, excel_path):
         """Create MFG and MFGPN XML files"""
         output_dir = Path(self.output_path.text())
-        base_name = Path(excel_path).stem
-        project_name = self.project_name.text()
-        catalog = self.catalog.text()
+        excel_file = Path(excel_path)
+        base_name = excel_file.stem
 
         mfg_xml_path = output_dir / f"{base_name}_MFG.xml"
         mfgpn_xml_path = output_dir / f"{base_name}_MFGPN.xml"
 
-        # Create MFG XML
-        mfg_count = self.create_mfg_xml(manufacturers, mfg_xml_path, project_name, catalog)
-
-        # Create MFGPN XML
-        mfgpn_count = self.create_mfgpn_xml(mfgpn_data, mfgpn_xml_path, project_name, catalog)
-
-        # Build comprehensive summary
-        summary = f"✓ All Files Generated Successfully!\n\n"
-        summary += f"Output Folder: {output_dir}\n"
-        summary += f"{'-' * 60}\n\n"
-
-        # List all files in output folder
-        summary += "Files Created:\n"
-        summary += f"  1. {Path(excel_path).name}\n"
-        summary += f"      - Excel workbook with all data\n"
-        summary += f"  2. column_mapping_config.json\n"
-        summary += f"      - Column mapping configuration (reusable)\n"
-        summary += f"  3. {mfg_xml_path.name}\n"
-        summary += f"      - Manufacturers ({mfg_count} entries)\n"
-        summary += f"  4. {mfgpn_xml_path.name}\n"
-        summary += f"      - Manufacturer Part Numbers ({mfgpn_count} entries)\n\n"
-
-        summary += f"All files are saved in:\n{output_dir}"
+        # Write both XML files in the background to keep the UI responsive
+        self.xml_output_paths = (output_dir, excel_file, mfg_xml_path, mfgpn_xml_path)
+        self.generate_button.setEnabled(False)
+        self.status_label.setStyleSheet("")
+        self.xml_thread = XMLGenerationThread(
+            manufacturers,
+            mfgpn_data,
+            mfg_xml_path,
+            mfgpn_xml_path,
+            self.project_name.text(),
+            self.catalog.text()
+        )
+        self.xml_thread.progress.connect(self.on_xml_progress)
+        self.xml_thread.finished.connect(self.on_xml_finished)
+        self.xml_thread.error.connect(self.on_xml_error)
+        self.xml_thread.start()
+
+    def on_xml_progress(self, message, current, total):
+        """Update XML generation progress"""
+        self.status_label.setText(f"{message} ({current}/{total})")
+
+    def on_xml_finished(self, counts):
+        """Show the generation summary once both XML files are written"""
+        output_dir, excel_file, mfg_xml_path, mfgpn_xml_path = self.xml_output_paths
+        mfg_count = counts['mfg_count']
+        mfgpn_count = counts['mfgpn_count']
+        self.generate_button.setEnabled(True)
+
+        # Build comprehensive summary, listing all files in output folder
+        summary = "\n".join([
+            "✓ All Files Generated Successfully!",
+            "",
+            f"Output Folder: {output_dir}",
+            '-' * 60,
+            "",
+            "Files Created:",
+            f"  1. {excel_file.name}",
+            "      - Excel workbook with all data",
+            "  2. column_mapping_config.json",
+            "      - Column mapping configuration (reusable)",
+            f"  3. {mfg_xml_path.name}",
+            f"      - Manufacturers ({mfg_count} entries)",
+            f"  4. {mfgpn_xml_path.name}",
+            f"      - Manufacturer Part Numbers ({mfgpn_count} entries)",
+            "",
+            "All files are saved in:",
+            f"{output_dir}",
+        ])
 
         self.summary_text.setText(summary)
         self.status_label.setText("✓ All files generated and saved successfully")
@@ -326,100 +353,14 @@ class XMLGenerationPage(QWizardPage):
                                f"- MFG XML ({mfg_count} manufacturers)\n"
                                f"- MFGPN XML ({mfgpn_count} part numbers)")
 
-    def escape_xml(self, text):
-        """Escape special XML characters"""
-        if pd.isna(text):
-            return ""
-        text = str(text)
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace('"', "&quot;")
-        text = text.replace("'", "&apos;")
-        return text
-
-    def create_mfg_xml(self, manufacturers, output_file, project_name, catalog):
-        """Create MFG XML file"""
-        manufacturers = sorted([m for m in manufacturers if m])
-
-        root = ET.Element('data')
-
-        for mfg in manufacturers:
-            obj = ET.SubElement(root, 'object')
-            obj.set('objectid', self.escape_xml(mfg))
-            obj.set('catalog', catalog)
-            obj.set('class', '090')
-
-            field1 = ET.SubElement(obj, 'field')
-            field1.set('id', '090obj_skn')
-            field1.text = catalog
-
-            field2 = ET.SubElement(obj, 'field')
-            field2.set('id', '090obj_id')
-            field2.text = self.escape_xml(mfg)
-
-            field3 = ET.SubElement(obj, 'field')
-            field3.set('id', '090her_name')
-            field3.text = self.escape_xml(mfg)
-
-        self.save_xml(root, output_file, project_name)
-        return len(manufacturers)
-
-    def create_mfgpn_xml(self, mfgpn_data, output_file, project_name, catalog):
-        """Create MFGPN XML file"""
-        # Remove duplicates
-        unique_pairs = {}
-        for item in mfgpn_data:
-            key = (item['MFG'], item['MFG_PN'])
-            if key not in unique_pairs:
-                unique_pairs[key] = item['Description']
-
-        root = ET.Element('data')
-
-        for (mfg, mfg_pn), description in unique_pairs.items():
-            objectid = f"{mfg}:{mfg_pn}"
-
-            obj = ET.SubElement(root, 'object')
-            obj.set('objectid', self.escape_xml(objectid))
-            obj.set('class', '060')
-
-            field1 = ET.SubElement(obj, 'field')
-            field1.set('id', '060partnumber')
-            field1.text = self.escape_xml(mfg_pn)
-
-            field2 = ET.SubElement(obj, 'field')
-            field2.set('id', '060mfgref')
-            field2.text = self.escape_xml(mfg)
-
-            field3 = ET.SubElement(obj, 'field')
-            field3.set('id', '060komp_name')
-            field3.text = self.escape_xml(description)
-
-        self.save_xml(root, output_file, project_name)
-        return len(unique_pairs)
-
-    def save_xml(self, root, output_file, project_name):
-        """Format and save XML file"""
-        xml_str = ET.tostring(root, encoding='utf-8', method='xml')
-        dom = minidom.parseString(xml_str)
-
-        comment_lines = [
-            f'Created By: EDM Library Creator v1.7.000.0130',
-            f'DDP Project: {project_name}',
-            f'Date: {datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")}'
-        ]
-
-        xml_lines = ['<?xml version="1.0" encoding="utf-8" standalone="yes"?>']
-        for comment in comment_lines:
-            xml_lines.append(f'<!--{comment}-->')
-
-        formatted = dom.toprettyxml(indent='  ', encoding='utf-8').decode('utf-8')
-        xml_content = '\n'.join(formatted.split('\n')[1:])
-
-        final_xml = '\n'.join(xml_lines) + '\n' + xml_content
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(final_xml)
+        self.xml_generated = True
+        self.completeChanged.emit()
+
+    def on_xml_error(self, error_msg):
+        """Handle XML generation error"""
+        self.generate_button.setEnabled(True)
+        self.status_label.setText("")
+        QMessageBox.critical(self, "Generation Error", f"Failed to generate XML files: {error_msg}")
 
     def isComplete(self):
         """Check if page is complete"""
@@ -0,0 +1,107 @@
+"""
+Persistent cache for Claude AI suggestions
+
+Part match suggestions and manufacturer normalizations are stored on disk so
+that re-running the wizard on the same data does not re-query the API for
+inputs that were already analyzed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+# Bump when a prompt changes so stale answers are not reused
+AI_CACHE_VERSION = 1
+AI_CACHE_FILE = Path.home() / ".edm_wizard_ai_cache.json"
+
+
+def make_cache_key(*parts):
+    """
+    Build a stable hash key from the given input values
+
+    Args:
+        *parts: JSON-serializable values identifying the AI request
+
+    Returns:
+        SHA-1 hex digest string
+    """
+    payload = json.dumps([AI_CACHE_VERSION, *parts], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class AICache:
+    """JSON-file backed key/value cache, grouped by namespace"""
+
+    def __init__(self, cache_file=AI_CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """Load cached entries from disk (missing or corrupt files are ignored)"""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get('version') == AI_CACHE_VERSION:
+                self.entries = data.get('entries', {})
+        except Exception:
+            self.entries = {}
+
+    def get(self, namespace, key):
+        """Return the cached value or None"""
+        with self.lock:
+            return self.entries.get(namespace, {}).get(key)
+
+    def set(self, namespace, key, value):
+        """Store a value (call save() to persist)"""
+        with self.lock:
+            self.entries.setdefault(namespace, {})[key] = value
+            self.dirty = True
+
+    def save(self):
+        """Write the cache to disk if anything changed"""
+        with self.lock:
+            if not self.dirty:
+                return
+            # Write to a temp file and rename so an interrupted save never
+            # leaves a truncated cache behind
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump({'version': AI_CACHE_VERSION, 'entries': self.entries}, f)
+                os.replace(tmp_file, self.cache_file)
+                self.dirty = False
+            except Exception:
+                pass
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self.lock:
+            self.entries = {}
+            self.dirty = True
+
+
+_shared_caches = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_ai_cache(cache_file=AI_CACHE_FILE):
+    """
+    Return the shared AICache for a cache file, creating it on first use
+
+    Each AICache writes only its own in-memory entries on save(), so two
+    instances on the same file would overwrite each other's namespaces;
+    every page uses this instance instead.
+    """
+    key = Path(cache_file).resolve()
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = AICache(cache_file)
+        return cache
@@ -13,6 +13,7 @@ PAS_SEARCH_PROVIDER_ID = 44
 PAS_SEARCH_PROVIDER_VERSION = 2
 PAS_SUPPLY_CHAIN_ENRICHER_ID = 33
 PAS_SUPPLY_CHAIN_ENRICHER_VERSION = 1
+PAS_HTTP_POOL_SIZE = 32  # Kept-alive connections per host (searches run up to 30 at once)
 
 # PAS API Property IDs
 PAS_PROPERTY_MANUFACTURER_NAME = "6230417e"
@@ -37,9 +38,29 @@ DEFAULT_MAX_MATCHES = 10
 DEFAULT_AI_MAX_RETRIES = 5
 DEFAULT_PREVIEW_ROWS = 10
 
+# AI column detection batching
+AI_DETECTION_TOKEN_BUDGET = 60000  # Estimated input tokens packed into one request
+AI_DETECTION_OUTPUT_TOKENS_PER_SHEET = 300  # Response budget per sheet in a batch
+AI_SAMPLE_MAX_CHARS = 80  # Longer text values in sample rows are truncated
+
+# Database export
+DB_FETCH_BATCH_SIZE = 10000  # Rows fetched per cursor.fetchmany() call
+DB_EXPORT_MAX_WORKERS = 4  # Tables fetched concurrently, one connection each
+
 # Excel Configuration
 EXCEL_MAX_SHEET_NAME_LENGTH = 31
+EXCEL_MAX_ROWS = 1048576  # Rows per worksheet, including the header row
+# xlsxwriter options for database exports: rows are flushed to disk as they
+# are written (see data_processing.write_dataframe_rows). Text is written as
+# plain strings, skipping the per-cell URL and formula checks.
+XLSX_STREAMING_OPTIONS = {
+    'constant_memory': True,
+    'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    'strings_to_urls': False,
+    'strings_to_formulas': False
+}
 EXCEL_INVALID_SHEET_CHARS = ['\\', '/', '*', '?', ':', '[', ']']
+XLSX_WRITE_BUFFER_SIZE = 1024 * 1024  # Output file buffer for database exports (bytes)
 
 # XML Configuration
 XML_CLASS_MFG = "090"
@@ -2,8 +2,54 @@
 Data processing utilities for EDM Library Wizard
 """
 
+import contextlib
+import datetime
+import json
+import numbers
+import os
+import shutil
+import threading
+import urllib.parse
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-from .constants import EXCEL_MAX_SHEET_NAME_LENGTH, EXCEL_INVALID_SHEET_CHARS
+import sqlalchemy as sa
+from .constants import (
+    DB_EXPORT_MAX_WORKERS, DB_FETCH_BATCH_SIZE, EXCEL_MAX_ROWS, EXCEL_MAX_SHEET_NAME_LENGTH,
+    EXCEL_INVALID_SHEET_CHARS
+)
+
+try:
+    import pyarrow.parquet as pq  # also required by DataFrame.to_parquet / read_parquet
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+PARQUET_CACHE_MANIFEST = 'sheets.json'
+TABLE_INDEX_SHEET = 'TableIndex'
+
+# Elementwise str() over an object ndarray, looping in C instead of Python
+_TO_STR = np.frompyfunc(str, 1, 1)
+
+
+def _excel_cell_value(value):
+    """Return value if xlsxwriter can write it, else its str() (as DataFrame.to_excel does)"""
+    if isinstance(value, float) and np.isinf(value):
+        return 'inf' if value > 0 else '-inf'  # to_excel's default inf_rep
+    if value is None or isinstance(value, (str, bool, numbers.Real, datetime.date, datetime.time, datetime.timedelta)):
+        return value
+    if isinstance(value, np.bool_):
+        return bool(value)
+    return str(value)  # e.g. bytes (Access OLE objects), uuid.UUID
+
+
+_TO_EXCEL_CELL = np.frompyfunc(_excel_cell_value, 1, 1)
+
+# str.translate table that deletes every invalid sheet name character in one pass
+_SHEET_NAME_DELETE_TABLE = str.maketrans('', '', ''.join(EXCEL_INVALID_SHEET_CHARS))
 
 
 def clean_sheet_name(name):
@@ -20,9 +66,654 @@ def clean_sheet_name(name):
     Returns:
         Cleaned sheet name
     """
-    for char in EXCEL_INVALID_SHEET_CHARS:
-        name = name.replace(char, '')
-    return name[:EXCEL_MAX_SHEET_NAME_LENGTH]
+    return name.translate(_SHEET_NAME_DELETE_TABLE)[:EXCEL_MAX_SHEET_NAME_LENGTH]
+
+
+def clean_sheet_names(names):
+    """
+    Clean a list of names with clean_sheet_name's rules in one vectorized pass
+
+    Args:
+        names: Sheet (e.g. table) names to clean
+
+    Returns:
+        List of cleaned sheet names, in the order of names
+    """
+    return (
+        pd.Series(names, dtype=object)
+        .str.translate(_SHEET_NAME_DELETE_TABLE)
+        .str.slice(0, EXCEL_MAX_SHEET_NAME_LENGTH)
+        .tolist()
+    )
+
+
+def read_table_raw(connection, query, batch_size=DB_FETCH_BATCH_SIZE):
+    """
+    Read a query result into a DataFrame through a raw DB-API cursor
+
+    Bypasses pandas.read_sql/SQLAlchemy row wrapping: rows are fetched in
+    batches and handed to DataFrame.from_records in one go.
+
+    Args:
+        connection: DB-API connection (e.g. engine.raw_connection())
+        query: SQL query to execute
+        batch_size: Rows per fetchmany() call
+
+    Returns:
+        DataFrame with the query's column names
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.arraysize = batch_size
+        cursor.execute(query)
+        columns = [column[0] for column in cursor.description]
+        rows = []
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            rows.extend(tuple(row) for row in batch)
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    finally:
+        cursor.close()
+
+
+def create_access_engine(mdb_file):
+    """
+    Create a SQLAlchemy engine for an Access database (.mdb / .accdb)
+
+    The connection pool holds one connection per concurrent table fetch and
+    pings pooled connections before reuse, so an engine can be kept and
+    shared by later exports of the same database.
+
+    Args:
+        mdb_file: Path to the Access database
+
+    Returns:
+        SQLAlchemy engine (no connection is opened until first use)
+    """
+    conn_str = (
+        r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
+        r"DBQ=" + str(mdb_file)
+    )
+    quoted_conn_str = urllib.parse.quote_plus(conn_str)
+    return sa.create_engine(
+        f"access+pyodbc:///?odbc_connect={quoted_conn_str}",
+        pool_size=DB_EXPORT_MAX_WORKERS,
+        pool_pre_ping=True
+    )
+
+
+def iter_tables_raw(engine, tables, query_template, max_workers=DB_EXPORT_MAX_WORKERS):
+    """
+    Fetch several tables concurrently and yield them in the given order
+
+    Each worker thread reads one table on its own engine.raw_connection(),
+    so ODBC latency overlaps across tables while the caller consumes
+    (e.g. writes) the results one at a time.
+
+    Args:
+        engine: SQLAlchemy engine
+        tables: List of table names
+        query_template: Query with a {table} placeholder, e.g. "SELECT * FROM [{table}]"
+        max_workers: Maximum concurrent fetches
+
+    Yields:
+        (table, DataFrame) tuples in the order of tables
+    """
+    def fetch(table):
+        connection = engine.raw_connection()
+        try:
+            return read_table_raw(connection, query_template.format(table=table))
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tables)))) as executor:
+        futures = [executor.submit(fetch, table) for table in tables]
+        try:
+            for table, future in zip(tables, futures):
+                yield table, future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def write_dataframe_rows(workbook, sheet_name, df, batch_size=DB_FETCH_BATCH_SIZE, progress_callback=None):
+    """
+    Write a DataFrame to a new xlsxwriter worksheet in row order
+
+    DataFrame.to_excel writes column by column, which loses data when the
+    workbook uses constant_memory mode (only the current row is kept). This
+    writes the header and then each row in turn, leaving missing values blank.
+    Values xlsxwriter cannot write (bytes, UUIDs, ...) are written as text,
+    and infinite floats as 'inf'/'-inf' like DataFrame.to_excel.
+
+    Args:
+        workbook: xlsxwriter Workbook (e.g. pd.ExcelWriter(...).book)
+        sheet_name: Worksheet name
+        df: DataFrame to write (the index is not written)
+        batch_size: Rows converted to Python objects at a time
+        progress_callback: Optional callable receiving the number of rows
+            written, called after each batch
+
+    Raises:
+        ValueError: If the DataFrame has more rows than fit on a worksheet
+            (xlsxwriter would silently drop the rest)
+    """
+    if not fits_on_worksheet(df):
+        raise ValueError(
+            f"Sheet '{sheet_name}' is too large: {len(df)} rows exceed Excel's limit of {EXCEL_MAX_ROWS - 1}"
+        )
+
+    # Only object/categorical columns can hold values of arbitrary Python types
+    mixed_columns = [
+        idx for idx, dtype in enumerate(df.dtypes)
+        if dtype == object or isinstance(dtype, pd.CategoricalDtype)
+    ]
+    # xlsxwriter rejects inf in numeric cells; to_excel wrote it as text
+    float_columns = [idx for idx, dtype in enumerate(df.dtypes) if dtype.kind == 'f']
+
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+
+    for start in range(0, len(df), batch_size):
+        chunk = df.iloc[start:start + batch_size].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        # Convert on the ndarray: assigning back into the frame would let
+        # pandas re-infer a string dtype and turn None into NaN
+        rows = chunk.to_numpy(dtype=object, copy=True)
+        for idx in mixed_columns:
+            rows[:, idx] = _TO_EXCEL_CELL(rows[:, idx])
+        for idx in float_columns:
+            values = df.iloc[start:start + batch_size, idx].to_numpy(dtype=float, na_value=np.nan)
+            infinite = np.isinf(values)
+            if infinite.any():
+                rows[infinite, idx] = np.where(values[infinite] > 0, 'inf', '-inf')
+        for row_idx, row in enumerate(rows, start + 1):
+            worksheet.write_row(row_idx, 0, row)
+        if progress_callback:
+            progress_callback(start + len(chunk))
+
+
+def fits_on_worksheet(df):
+    """Return True if a DataFrame's rows plus the header row fit on one Excel worksheet"""
+    return len(df) < EXCEL_MAX_ROWS
+
+
+def write_table_index(workbook, excel_path, tables):
+    """
+    Add a sheet listing the tables that were too large for a worksheet
+
+    Such tables are stored only in the Parquet sheet cache next to the
+    workbook (see save_parquet_cache); the sheet tells anyone opening the
+    workbook where they went.
+
+    Args:
+        workbook: xlsxwriter Workbook
+        excel_path: Path of the workbook being written
+        tables: List of (table, sheet_name, row_count) tuples
+    """
+    worksheet = workbook.add_worksheet(TABLE_INDEX_SHEET)
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    worksheet.write_row(0, 0, ['Table', 'Sheet', 'Rows', 'Parquet Cache'], header_format)
+    cache_dir = str(parquet_cache_dir(excel_path))
+    for row_idx, (table, sheet_name, row_count) in enumerate(tables, 1):
+        worksheet.write_row(row_idx, 0, [table, sheet_name, row_count, cache_dir])
+
+
+class LazyExcelSheets(Mapping):
+    """
+    Read-only mapping of sheet name -> DataFrame for an Excel workbook
+
+    The workbook is opened once and each sheet is parsed the first time it
+    is accessed, so previewing one sheet does not parse the whole file.
+    Parsed sheets are kept for later access. columns() reads only a sheet's
+    header row when the sheet itself is not needed yet.
+
+    Tables listed in a TableIndex sheet (too large for a worksheet, see
+    write_table_index) are read from their Parquet cache files instead and
+    take the index sheet's place in the sheet list.
+    """
+
+    def __init__(self, excel_path):
+        self.excel_path = Path(excel_path)
+        self.excel_file = pd.ExcelFile(excel_path)
+        self.sheet_names = list(self.excel_file.sheet_names)
+        self.parquet_files = {}
+        if TABLE_INDEX_SHEET in self.sheet_names:
+            self.parquet_files = parquet_only_files(excel_path, self.excel_file.parse(TABLE_INDEX_SHEET))
+            if self.parquet_files:
+                self.sheet_names.remove(TABLE_INDEX_SHEET)
+                self.sheet_names.extend(self.parquet_files)
+        self.loaded = {}
+        self.headers = {}
+        self.lock = threading.Lock()
+
+    def __getitem__(self, sheet_name):
+        with self.lock:
+            if sheet_name not in self.loaded:
+                if sheet_name not in self.sheet_names:
+                    raise KeyError(sheet_name)
+                if sheet_name in self.parquet_files:
+                    self.loaded[sheet_name] = pd.read_parquet(self.parquet_files[sheet_name])
+                else:
+                    self.loaded[sheet_name] = self.excel_file.parse(sheet_name)
+            return self.loaded[sheet_name]
+
+    def __contains__(self, sheet_name):
+        # Checking membership must not parse the sheet
+        return sheet_name in self.sheet_names
+
+    def columns(self, sheet_name):
+        """Return a sheet's column names, parsing only its header row if it is not loaded"""
+        with self.lock:
+            if sheet_name in self.loaded:
+                return self.loaded[sheet_name].columns.tolist()
+            if sheet_name not in self.headers:
+                if sheet_name not in self.sheet_names:
+                    raise KeyError(sheet_name)
+                if sheet_name in self.parquet_files:
+                    self.headers[sheet_name] = pq.read_schema(self.parquet_files[sheet_name]).names
+                else:
+                    self.headers[sheet_name] = self.excel_file.parse(sheet_name, nrows=0).columns.tolist()
+            return self.headers[sheet_name]
+
+    @contextlib.contextmanager
+    def released(self):
+        """
+        Close the open workbook while it is rewritten, then reopen it
+
+        Parsing a sheet through a handle opened before the rewrite reads a
+        corrupt archive. Sheets not parsed yet are read from the rewritten
+        file afterwards; the sheet list is kept as it was.
+        """
+        with self.lock:
+            self.excel_file.close()
+            try:
+                yield
+            finally:
+                self.excel_file = pd.ExcelFile(self.excel_path)
+
+    def __iter__(self):
+        return iter(self.sheet_names)
+
+    def __len__(self):
+        return len(self.sheet_names)
+
+
+class LazyParquetSheets(Mapping):
+    """
+    Read-only mapping of sheet name -> DataFrame for a Parquet sheet cache
+
+    Same access pattern as LazyExcelSheets: each sheet's Parquet file is read
+    the first time the sheet is accessed and kept for later access, and
+    columns() reads only the file's schema. Sheets that are never opened are
+    never held in memory.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        manifest = read_parquet_manifest(self.cache_dir)
+        self.files = {entry['sheet_name']: entry['file'] for entry in manifest['sheets']}
+        self.sheet_names = list(self.files)
+        self.loaded = {}
+        self.lock = threading.Lock()
+
+    def __getitem__(self, sheet_name):
+        with self.lock:
+            if sheet_name not in self.loaded:
+                self.loaded[sheet_name] = pd.read_parquet(self.cache_dir / self.files[sheet_name])
+            return self.loaded[sheet_name]
+
+    def __contains__(self, sheet_name):
+        # Checking membership must not read the sheet
+        return sheet_name in self.files
+
+    def columns(self, sheet_name):
+        """Return a sheet's column names, reading only its schema if it is not loaded"""
+        with self.lock:
+            if sheet_name in self.loaded:
+                return self.loaded[sheet_name].columns.tolist()
+        return pq.read_schema(self.cache_dir / self.files[sheet_name]).names
+
+    def __iter__(self):
+        return iter(self.sheet_names)
+
+    def __len__(self):
+        return len(self.sheet_names)
+
+
+def sheet_columns(dataframes, sheet_name):
+    """
+    Return the column names of one sheet
+
+    Avoids reading the whole sheet when dataframes is a LazyExcelSheets or
+    LazyParquetSheets.
+
+    Args:
+        dataframes: dict, LazyExcelSheets or LazyParquetSheets of sheet name -> DataFrame
+        sheet_name: Sheet to inspect
+
+    Returns:
+        List of column names
+    """
+    if isinstance(dataframes, (LazyExcelSheets, LazyParquetSheets)):
+        return dataframes.columns(sheet_name)
+    return dataframes[sheet_name].columns.tolist()
+
+
+def parquet_cache_dir(excel_path):
+    """Return the Parquet sheet cache folder that sits next to an Excel file"""
+    excel_path = Path(excel_path)
+    return excel_path.with_name(excel_path.stem + '_sheets.parquet')
+
+
+def workbook_stamp(excel_path):
+    """Return the modification time and size that identify a workbook's current contents"""
+    stat = Path(excel_path).stat()
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def read_parquet_manifest(cache_dir):
+    """Return a Parquet cache's manifest: {'workbook': stamp, 'sheets': [{'sheet_name', 'file'}, ...]}"""
+    with open(Path(cache_dir) / PARQUET_CACHE_MANIFEST, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_parquet_manifest(cache_dir, manifest):
+    """Write a Parquet cache's manifest through a temp file so readers never see a partial one"""
+    manifest_file = Path(cache_dir) / PARQUET_CACHE_MANIFEST
+    tmp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_file, manifest_file)
+
+
+def parquet_cache_is_current(excel_path):
+    """Return True if the workbook still matches the stamp its Parquet cache was saved for"""
+    if not PARQUET_AVAILABLE:
+        return False
+    try:
+        manifest = read_parquet_manifest(parquet_cache_dir(excel_path))
+        return isinstance(manifest, dict) and manifest.get('workbook') == workbook_stamp(excel_path)
+    except Exception:
+        return False
+
+
+def parquet_only_files(excel_path, table_index):
+    """
+    Locate the Parquet cache files of the tables listed in a TableIndex sheet
+
+    These tables are not in the workbook, so edits to the workbook cannot
+    affect them and their files are used even when the rest of the cache
+    is stale.
+
+    Args:
+        excel_path: Path of the workbook
+        table_index: Parsed TableIndex sheet (see write_table_index)
+
+    Returns:
+        dict of sheet name -> Parquet file path, in TableIndex order
+        (empty when pyarrow is missing or the cache cannot be read)
+    """
+    if not PARQUET_AVAILABLE or 'Sheet' not in table_index.columns:
+        return {}
+    cache_dir = parquet_cache_dir(excel_path)
+    try:
+        files = {entry['sheet_name']: entry['file'] for entry in read_parquet_manifest(cache_dir)['sheets']}
+    except Exception:
+        return {}
+    return {
+        sheet_name: cache_dir / files[sheet_name]
+        for sheet_name in table_index['Sheet'].astype(str)
+        if sheet_name in files and (cache_dir / files[sheet_name]).exists()
+    }
+
+
+def refresh_parquet_cache(excel_path):
+    """
+    Re-stamp the Parquet cache after the wizard itself changed the workbook
+
+    Only valid for changes that leave the cached sheets as they are (e.g.
+    adding the Combined sheet); the caller checks parquet_cache_is_current()
+    before making the change.
+    """
+    cache_dir = parquet_cache_dir(excel_path)
+    try:
+        manifest = read_parquet_manifest(cache_dir)
+        manifest['workbook'] = workbook_stamp(excel_path)
+        write_parquet_manifest(cache_dir, manifest)
+    except Exception:
+        pass
+
+
+def save_parquet_cache(excel_path, dataframes):
+    """
+    Store exported sheets as Parquet files next to the Excel file
+
+    Reloading the workbook later can then skip Excel XML parsing entirely
+    (see load_parquet_cache). The manifest records the workbook's mtime and
+    size, so the cache is tied to the workbook as it is now. Does nothing
+    when pyarrow is not installed; a sheet that cannot be stored as Parquet
+    discards the whole cache.
+
+    Args:
+        excel_path: Path of the exported Excel file
+        dataframes: dict of sheet name -> DataFrame, in workbook order
+
+    Returns:
+        True if the cache was written
+    """
+    if not PARQUET_AVAILABLE:
+        return False
+
+    cache_dir = parquet_cache_dir(excel_path)
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        sheets = []
+        for idx, (sheet_name, df) in enumerate(dataframes.items()):
+            file_name = f"{idx:04d}.parquet"
+            df.to_parquet(cache_dir / file_name, compression='zstd', index=False)
+            sheets.append({'sheet_name': sheet_name, 'file': file_name})
+        # The manifest is written last, so its presence marks a complete cache
+        write_parquet_manifest(cache_dir, {'workbook': workbook_stamp(excel_path), 'sheets': sheets})
+        return True
+    except Exception:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return False
+
+
+def load_parquet_cache(excel_path):
+    """
+    Load sheets saved by save_parquet_cache
+
+    The cache is only used while the workbook's mtime and size match the
+    ones recorded when it was saved (or re-stamped by write_combined_sheet),
+    so a workbook edited outside the wizard is read from Excel again.
+    Sheets are read on first access.
+
+    Args:
+        excel_path: Path of the Excel file
+
+    Returns:
+        LazyParquetSheets of sheet name -> DataFrame, or None if there is no usable cache
+    """
+    if not parquet_cache_is_current(excel_path):
+        return None
+
+    try:
+        return LazyParquetSheets(parquet_cache_dir(excel_path))
+    except Exception:
+        return None
+
+
+def nonempty_mask(series):
+    """
+    Return a boolean mask of the cells that hold a value
+
+    Text cells that are blank after stripping count as empty. Numeric,
+    boolean and datetime columns cannot hold blank text, so only NaN is
+    checked there and the column is not converted to strings.
+
+    Args:
+        series: Column to inspect
+
+    Returns:
+        Boolean Series aligned with series
+    """
+    mask = series.notna()
+    if pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+        mask &= series.astype(str).str.strip().ne('')
+    return mask
+
+
+def display_strings(df):
+    """
+    Convert every cell of a DataFrame to its display text in one pass
+
+    Args:
+        df: DataFrame to convert
+
+    Returns:
+        2D object ndarray of str, with missing values as empty strings
+    """
+    text = _TO_STR(df.to_numpy(dtype=object))
+    text[df.isna().to_numpy()] = ''
+    return text
+
+
+def combine_mapped_sheets(dataframes, mappings, included_sheets, filters, progress_callback=None):
+    """
+    Combine sheets into one DataFrame using the column mapping page's mappings
+
+    Each sheet keeps its original columns and gains the standard columns
+    (MFG, MFG_PN, Part_Number, Description) copied from its mapped columns,
+    plus Source_Sheet. Rows failing the required-column filters are dropped.
+
+    Args:
+        dataframes: dict, LazyExcelSheets or LazyParquetSheets of sheet name -> DataFrame
+        mappings: Dict of {sheet_name: {'MFG': col, 'MFG_PN': col, 'MFG_PN_2': col, ...}}
+        included_sheets: Sheet names to combine, in order
+        filters: Dict of {'MFG': bool, 'MFG_PN': bool, 'Part_Number': bool,
+                 'Description': bool, 'Fill_TBD': bool}
+        progress_callback: Optional callable(sheet_name, index) called before each sheet
+
+    Returns:
+        Combined DataFrame (empty when no rows remain)
+    """
+    combined_data = []
+
+    for index, sheet_name in enumerate(included_sheets):
+        if sheet_name not in dataframes:
+            continue
+
+        if progress_callback:
+            progress_callback(sheet_name, index)
+
+        df = dataframes[sheet_name]
+        # Shallow copy: column data stays shared with the loaded sheet. Columns
+        # are only ever replaced below, never written in place, and the final
+        # concat makes the one real copy of the kept rows
+        df_copy = df.copy(deep=False)
+        df_copy['Source_Sheet'] = sheet_name
+
+        # Get mapped columns
+        sheet_mapping = mappings[sheet_name]
+
+        # ADD new standard columns by COPYING from mapped columns (preserve originals)
+        # This keeps original column names intact and adds standardized columns
+        for key, col_name in sheet_mapping.items():
+            if col_name and key != 'MFG_PN_2':  # MFG_PN_2 is handled separately
+                # Only add if the source column exists and target doesn't already exist
+                if col_name in df_copy.columns:
+                    # Copy values to new standard column name
+                    df_copy[key] = df_copy[col_name]
+
+        # Non-empty masks of the standard columns, each computed once and
+        # kept up to date by the fallback and TBD fill, then reused by the filters
+        masks = {
+            col: nonempty_mask(df_copy[col])
+            for col in ('MFG', 'MFG_PN', 'Part_Number', 'Description')
+            if col in df_copy.columns
+        }
+
+        # Handle MFG PN fallback: if MFG_PN is empty, use MFG_PN_2
+        if 'MFG_PN' in masks and sheet_mapping.get('MFG_PN_2'):
+            mfg_pn_2_col = sheet_mapping['MFG_PN_2']
+            if mfg_pn_2_col in df.columns:
+                # Fill empty MFG_PN with values from MFG_PN_2; only the filled
+                # rows need checking again
+                empty_mask = ~masks['MFG_PN']
+                df_copy['MFG_PN'] = df_copy['MFG_PN'].mask(empty_mask, df[mfg_pn_2_col])
+                masks['MFG_PN'][empty_mask] = nonempty_mask(df[mfg_pn_2_col][empty_mask])
+
+        # Handle TBD fill: if MFG_PN is not empty but MFG is empty, set MFG to 'TBD'
+        if filters.get('Fill_TBD') and 'MFG' in masks and 'MFG_PN' in masks:
+            tbd_mask = masks['MFG_PN'] & ~masks['MFG']
+            df_copy['MFG'] = df_copy['MFG'].mask(tbd_mask, 'TBD')
+            masks['MFG'] |= tbd_mask
+
+        # Apply filters using the NEW standard column names
+        # Combined as plain boolean arrays (the masks share df_copy's row order)
+        mask = np.ones(len(df_copy), dtype=bool)
+
+        for col in ('MFG', 'MFG_PN', 'Part_Number', 'Description'):
+            if filters[col] and col in masks:
+                mask &= masks[col].to_numpy()
+
+        # Boolean indexing copies every column even when nothing is dropped;
+        # concat below copies the rows anyway
+        df_filtered = df_copy if mask.all() else df_copy.iloc[mask]
+
+        if len(df_filtered) > 0:
+            combined_data.append(df_filtered)
+
+    if not combined_data:
+        return pd.DataFrame()
+
+    return pd.concat(combined_data, ignore_index=True, sort=False)
+
+
+def write_combined_sheet(excel_path, combined_df, dataframes):
+    """
+    Add or replace the Combined sheet of the output workbook
+
+    Args:
+        excel_path: Workbook to update
+        combined_df: Combined DataFrame to write
+        dataframes: The workbook's other sheets, used to rewrite legacy .xls files
+    """
+    # The Combined sheet is not part of the Parquet cache, so a cache that
+    # matched the workbook before this write still matches it afterwards
+    cache_current = parquet_cache_is_current(excel_path)
+
+    # A LazyExcelSheets reading this workbook must not keep its handle open
+    # across the rewrite
+    if isinstance(dataframes, LazyExcelSheets) and dataframes.excel_path.resolve() == Path(excel_path).resolve():
+        released = dataframes.released
+    else:
+        released = contextlib.nullcontext
+
+    if Path(excel_path).suffix.lower() in ('.xlsx', '.xlsm'):
+        # Add/update the Combined sheet in place; the other sheets are
+        # carried over by openpyxl without being parsed into DataFrames
+        with released(), \
+                pd.ExcelWriter(excel_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
+            combined_df.to_excel(writer, sheet_name='Combined', index=False)
+    else:
+        # openpyxl cannot append to legacy .xls workbooks, so rewrite the
+        # file from the sheets already held in memory instead of re-reading it
+        # (lazily held sheets are all parsed here, before the file is replaced)
+        existing_sheets = {name: dataframes[name] for name in dataframes if name != 'Combined'}
+        existing_sheets['Combined'] = combined_df
+
+        with released(), pd.ExcelWriter(excel_path, engine='xlsxwriter') as writer:
+            for sheet_name, df in existing_sheets.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    if cache_current:
+        refresh_parquet_cache(excel_path)
 
 
 def combine_dataframes(dataframes, mappings, include_sheets=None, filter_conditions=None):
@@ -150,3 +841,19 @@ def normalize_manufacturer_names(dataframe, normalizations, mfg_column='MFG'):
     )
 
     return dataframe
+
+
+def truncate_for_display(values, max_length=50):
+    """
+    Truncate text values for table display in one vectorized pass
+
+    Args:
+        values: Iterable of text values (missing values become empty strings)
+        max_length: Maximum characters kept before appending "..."
+
+    Returns:
+        List of display strings
+    """
+    series = pd.Series(list(values), dtype=object).fillna('').astype(str)
+    truncated = series.where(series.str.len() <= max_length, series.str.slice(0, max_length) + "...")
+    return truncated.tolist()
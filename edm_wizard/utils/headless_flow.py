@@ -11,18 +11,24 @@ from __future__ import annotations
 
 import argparse
 import json
-import urllib.parse
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional
 
 import pandas as pd
-import sqlalchemy as sa
 from sqlalchemy import inspect
 
 from . import constants
-from .data_processing import clean_sheet_name, extract_mfgpn_data, extract_unique_manufacturers
-from .xml_generation import create_mfg_xml, create_mfgpn_xml
+from .data_processing import (
+    clean_sheet_names,
+    create_access_engine,
+    extract_mfgpn_data,
+    extract_unique_manufacturers,
+    iter_tables_raw,
+    nonempty_mask,
+    write_dataframe_rows,
+)
+from .xml_generation import create_mfg_xml, create_mfgpn_xml, xml_header
 
 
 DEFAULT_FILTERS = {
@@ -94,7 +100,7 @@ def _load_workbook(input_path: Path) -> Dict[str, pd.DataFrame]:
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
     excel_file = pd.ExcelFile(input_path)
-    return {sheet: pd.read_excel(input_path, sheet_name=sheet) for sheet in excel_file.sheet_names}
+    return {sheet: excel_file.parse(sheet) for sheet in excel_file.sheet_names}
 
 
 def _export_access_to_excel(mdb_path: Path, output_dir: Path):
@@ -110,9 +116,7 @@ def _export_access_to_excel(mdb_path: Path, output_dir: Path):
     output_excel = output_dir / f"{mdb_path.stem}.xlsx"
 
     try:
-        conn_str = r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=" + str(mdb_path)
-        quoted_conn_str = urllib.parse.quote_plus(conn_str)
-        engine = sa.create_engine(f"access+pyodbc:///?odbc_connect={quoted_conn_str}")
+        engine = create_access_engine(mdb_path)
 
         inspector = inspect(engine)
         tables = inspector.get_table_names()
@@ -120,11 +124,14 @@ def _export_access_to_excel(mdb_path: Path, output_dir: Path):
             raise RuntimeError("No tables found in Access database.")
 
         dataframes: Dict[str, pd.DataFrame] = {}
-        with pd.ExcelWriter(output_excel, engine="xlsxwriter") as writer:
-            for table in tables:
-                df = pd.read_sql(f"SELECT * FROM [{table}]", engine)
-                sheet_name = clean_sheet_name(table)
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        with open(output_excel, "wb", buffering=constants.XLSX_WRITE_BUFFER_SIZE) as output, pd.ExcelWriter(
+            output,
+            engine="xlsxwriter",
+            engine_kwargs={"options": constants.XLSX_STREAMING_OPTIONS},
+        ) as writer:
+            tables_iter = iter_tables_raw(engine, tables, "SELECT * FROM [{table}]")
+            for sheet_name, (table, df) in zip(clean_sheet_names(tables), tables_iter):
+                write_dataframe_rows(writer.book, sheet_name, df)
                 dataframes[sheet_name] = df
 
         return output_excel, dataframes
@@ -140,16 +147,16 @@ def _apply_filters(df: pd.DataFrame, filters: Mapping[str, bool]) -> pd.DataFram
     mask = pd.Series(True, index=df.index)
 
     if filters.get("require_mfg") and "MFG" in df.columns:
-        mask &= df["MFG"].notna() & (df["MFG"].astype(str).str.strip() != "")
+        mask &= nonempty_mask(df["MFG"])
 
     if filters.get("require_mfg_pn") and "MFG_PN" in df.columns:
-        mask &= df["MFG_PN"].notna() & (df["MFG_PN"].astype(str).str.strip() != "")
+        mask &= nonempty_mask(df["MFG_PN"])
 
     if filters.get("require_part_number") and "Part_Number" in df.columns:
-        mask &= df["Part_Number"].notna() & (df["Part_Number"].astype(str).str.strip() != "")
+        mask &= nonempty_mask(df["Part_Number"])
 
     if filters.get("require_description") and "Description" in df.columns:
-        mask &= df["Description"].notna() & (df["Description"].astype(str).str.strip() != "")
+        mask &= nonempty_mask(df["Description"])
 
     return df.loc[mask].copy()
 
@@ -192,12 +199,12 @@ def _combine_sheets(
         if mfg_pn_primary and mfg_pn_secondary:
             if "MFG_PN" in df.columns and mfg_pn_secondary in dataframes[sheet_name].columns:
                 secondary_values = dataframes[sheet_name][mfg_pn_secondary]
-                empty_mask = df["MFG_PN"].isna() | (df["MFG_PN"].astype(str).str.strip() == "")
+                empty_mask = ~nonempty_mask(df["MFG_PN"])
                 df.loc[empty_mask, "MFG_PN"] = secondary_values[empty_mask].values
 
         if fill_tbd and {"MFG", "MFG_PN"} <= set(df.columns):
-            mfg_pn_present = df["MFG_PN"].notna() & (df["MFG_PN"].astype(str).str.strip() != "")
-            mfg_missing = df["MFG"].isna() | (df["MFG"].astype(str).str.strip() == "")
+            mfg_pn_present = nonempty_mask(df["MFG_PN"])
+            mfg_missing = ~nonempty_mask(df["MFG"])
             df.loc[mfg_pn_present & mfg_missing, "MFG"] = "TBD"
 
         filtered = _apply_filters(df, filters)
@@ -269,8 +276,9 @@ def run_headless_flow(config_like) -> HeadlessResult:
     mfg_xml_path = config.output_dir / f"{effective_input_path.stem}_MFG.xml"
     mfgpn_xml_path = config.output_dir / f"{effective_input_path.stem}_MFGPN.xml"
 
-    create_mfg_xml(manufacturers, mfg_xml_path, config.project_name, config.catalog)
-    create_mfgpn_xml(mfgpn_records, mfgpn_xml_path, config.project_name, config.catalog)
+    header = xml_header(config.project_name)
+    create_mfg_xml(manufacturers, mfg_xml_path, config.project_name, config.catalog, header=header)
+    create_mfgpn_xml(mfgpn_records, mfgpn_xml_path, config.project_name, config.catalog, header=header)
 
     return HeadlessResult(
         output_dir=config.output_dir,
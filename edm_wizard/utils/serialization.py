@@ -0,0 +1,44 @@
+"""
+JSON serialization helpers
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(obj, indent=False):
+    """
+    Serialize an object to a JSON string, using orjson when installed
+
+    orjson writes NumPy scalars as numbers and NaN as null; values it cannot
+    encode natively fall back to str(), like json.dumps(default=str).
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a 2-space indent
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def loads_json(text):
+    """Parse JSON text (str or bytes), using orjson when installed"""
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
@@ -2,28 +2,57 @@
 XML generation utilities for EDM Library Creator
 """
 
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import itertools
 from datetime import datetime
 import pandas as pd
 
-from .constants import XML_CLASS_MFG, XML_CLASS_MFGPN
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+from .constants import XML_CLASS_MFG, XML_CLASS_MFGPN, XML_SPECIAL_CHARS
+
+# Single-pass translation table: escape special characters and drop control
+# characters that are not allowed in XML 1.0 (lxml refuses to serialize them)
+_XML_INVALID_CHARS = [c for c in range(0x20) if c not in (0x09, 0x0a, 0x0d)]
+_XML_TRANS = str.maketrans({**XML_SPECIAL_CHARS, **dict.fromkeys(_XML_INVALID_CHARS)})
+
+# How often (in objects) write_xml_objects reports progress
+XML_PROGRESS_INTERVAL = 500
+
+# Output files are written as pre-encoded bytes through a large buffer
+XML_WRITE_BUFFER_SIZE = 1024 * 1024
 
 
 def escape_xml(text):
     """Escape special XML characters"""
-    if pd.isna(text):
+    if isinstance(text, str):
+        return text.translate(_XML_TRANS)
+    # Identity/float checks instead of pd.isna, which is called once per field
+    if text is None or text is pd.NA or text is pd.NaT or (isinstance(text, float) and text != text):
         return ""
-    text = str(text)
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-    text = text.replace('"', "&quot;")
-    text = text.replace("'", "&apos;")
-    return text
+    return str(text).translate(_XML_TRANS)
+
+
+def escape_xml_column(values):
+    """
+    Escape a whole column, equivalent to calling escape_xml on each value
+
+    Args:
+        values: pandas Series
+
+    Returns:
+        Object ndarray of escaped strings (missing values become "")
+    """
+    text = values.astype(object).where(values.notna(), '').astype(str)
+    return text.str.translate(_XML_TRANS).to_numpy(dtype=object)
 
 
-def create_mfg_xml(manufacturers, output_file, project_name, catalog):
+def create_mfg_xml(manufacturers, output_file, project_name, catalog, progress_callback=None,
+                   header=None):
     """
     Create MFG XML file (Manufacturer class 090)
 
@@ -32,107 +61,190 @@ def create_mfg_xml(manufacturers, output_file, project_name, catalog):
         output_file: Output file path
         project_name: DDP project name
         catalog: Catalog code (e.g., "VV")
+        progress_callback: Optional callable receiving the number of objects written
+        header: Optional xml_header() string, to share one header across files
 
     Returns:
         Number of manufacturers written
     """
     manufacturers = sorted([m for m in manufacturers if m])
 
-    root = ET.Element('data')
-
-    for mfg in manufacturers:
-        obj = ET.SubElement(root, 'object')
-        obj.set('objectid', escape_xml(mfg))
-        obj.set('catalog', catalog)
-        obj.set('class', XML_CLASS_MFG)
-
-        field1 = ET.SubElement(obj, 'field')
-        field1.set('id', '090obj_skn')
-        field1.text = catalog
+    def objects():
+        for mfg in manufacturers:
+            escaped = escape_xml(mfg)
+            yield (
+                {'objectid': escaped, 'catalog': catalog, 'class': XML_CLASS_MFG},
+                [('090obj_skn', catalog), ('090obj_id', escaped), ('090her_name', escaped)]
+            )
 
-        field2 = ET.SubElement(obj, 'field')
-        field2.set('id', '090obj_id')
-        field2.text = escape_xml(mfg)
-
-        field3 = ET.SubElement(obj, 'field')
-        field3.set('id', '090her_name')
-        field3.text = escape_xml(mfg)
-
-    save_xml(root, output_file, project_name)
+    write_xml_objects(objects(), output_file, project_name, progress_callback, header)
     return len(manufacturers)
 
 
-def create_mfgpn_xml(mfgpn_data, output_file, project_name, catalog):
+def create_mfgpn_xml(mfgpn_data, output_file, project_name, catalog, progress_callback=None,
+                     header=None):
     """
     Create MFGPN XML file (Manufacturer Part Number class 060)
 
     Args:
-        mfgpn_data: List of dicts with 'MFG', 'MFG_PN', 'Description' keys
+        mfgpn_data: List of dicts with 'MFG', 'MFG_PN', 'Description' keys,
+            an already-deduplicated dict of {(MFG, MFG_PN): Description},
+            or a DataFrame with those columns and no missing MFG/MFG_PN
         output_file: Output file path
         project_name: DDP project name
         catalog: Catalog code (e.g., "VV")
+        progress_callback: Optional callable receiving the number of objects written
+        header: Optional xml_header() string, to share one header across files
 
     Returns:
         Number of unique part numbers written
     """
-    # Remove duplicates
-    unique_pairs = {}
-    for item in mfgpn_data:
-        key = (item['MFG'], item['MFG_PN'])
-        if key not in unique_pairs:
-            unique_pairs[key] = item.get('Description', '')
-
-    root = ET.Element('data')
-
-    for (mfg, mfg_pn), description in unique_pairs.items():
-        objectid = f"{mfg}:{mfg_pn}"
-
-        obj = ET.SubElement(root, 'object')
-        obj.set('objectid', escape_xml(objectid))
-        obj.set('class', XML_CLASS_MFGPN)
-
-        field1 = ET.SubElement(obj, 'field')
-        field1.set('id', '060partnumber')
-        field1.text = escape_xml(mfg_pn)
-
-        field2 = ET.SubElement(obj, 'field')
-        field2.set('id', '060mfgref')
-        field2.text = escape_xml(mfg)
-
-        field3 = ET.SubElement(obj, 'field')
-        field3.set('id', '060komp_name')
-        field3.text = escape_xml(description)
-
-    save_xml(root, output_file, project_name)
+    if isinstance(mfgpn_data, pd.DataFrame):
+        # Remove duplicates (first description wins) and escape each column
+        # once up front rather than three escape_xml calls per row
+        unique_df = mfgpn_data.drop_duplicates(subset=['MFG', 'MFG_PN'], keep='first')
+        mfg_esc = escape_xml_column(unique_df['MFG'])
+        pn_esc = escape_xml_column(unique_df['MFG_PN'])
+        desc_esc = escape_xml_column(unique_df['Description'])
+
+        def df_objects():
+            for mfg, mfg_pn, description in zip(mfg_esc, pn_esc, desc_esc):
+                yield (
+                    {'objectid': f"{mfg}:{mfg_pn}", 'class': XML_CLASS_MFGPN},
+                    [('060partnumber', mfg_pn), ('060mfgref', mfg), ('060komp_name', description)]
+                )
+
+        write_xml_objects(df_objects(), output_file, project_name, progress_callback, header)
+        return len(unique_df)
+
+    if isinstance(mfgpn_data, dict):
+        unique_pairs = mfgpn_data
+    else:
+        # Remove duplicates (first description wins)
+        unique_pairs = {}
+        for item in mfgpn_data:
+            unique_pairs.setdefault((item['MFG'], item['MFG_PN']), item.get('Description', ''))
+
+    def objects():
+        for (mfg, mfg_pn), description in unique_pairs.items():
+            yield (
+                {'objectid': escape_xml(f"{mfg}:{mfg_pn}"), 'class': XML_CLASS_MFGPN},
+                [('060partnumber', escape_xml(mfg_pn)), ('060mfgref', escape_xml(mfg)),
+                 ('060komp_name', escape_xml(description))]
+            )
+
+    write_xml_objects(objects(), output_file, project_name, progress_callback, header)
     return len(unique_pairs)
 
 
-def save_xml(root, output_file, project_name):
+def xml_header(project_name):
     """
-    Format and save XML file with EDM Library Creator headers
+    Build the XML declaration and EDM Library Creator comment block
 
     Args:
-        root: ET.Element root node
-        output_file: Output file path
         project_name: DDP project name
-    """
-    xml_str = ET.tostring(root, encoding='utf-8', method='xml')
-    dom = minidom.parseString(xml_str)
 
+    Returns:
+        Header string ending with a newline
+    """
     comment_lines = [
         f'Created By: EDM Library Creator v1.7.000.0130',
         f'DDP Project: {project_name}',
         f'Date: {datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")}'
     ]
 
-    xml_lines = ['<?xml version="1.0" encoding="utf-8" standalone="yes"?>']
-    for comment in comment_lines:
-        xml_lines.append(f'<!--{comment}-->')
+    return (
+        '<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
+        + ''.join(f'<!--{comment}-->\n' for comment in comment_lines)
+    )
+
+
+def write_xml_objects(objects, output_file, project_name, progress_callback=None, header=None):
+    """
+    Write <object> elements under a <data> root
+
+    With lxml each object is serialized to disk as soon as it is built, so
+    memory use does not grow with the number of objects. Without lxml the
+    tree is built in memory and written by save_xml.
 
-    formatted = dom.toprettyxml(indent='  ', encoding='utf-8').decode('utf-8')
-    xml_content = '\n'.join(formatted.split('\n')[1:])
+    Args:
+        objects: Iterable of (attributes dict, [(field_id, text), ...]) tuples
+        output_file: Output file path
+        project_name: DDP project name
+        progress_callback: Optional callable receiving the number of objects
+            written, called every XML_PROGRESS_INTERVAL objects
+        header: Optional pre-built xml_header() string
+    """
+    if header is None:
+        header = xml_header(project_name)
+
+    if not LXML_AVAILABLE:
+        root = ET.Element('data')
+        for count, (attrib, fields) in enumerate(objects, 1):
+            obj = ET.SubElement(root, 'object', attrib)
+            for field_id, text in fields:
+                ET.SubElement(obj, 'field', id=field_id).text = text
+            if progress_callback and count % XML_PROGRESS_INTERVAL == 0:
+                progress_callback(count)
+        save_xml(root, output_file, project_name, header)
+        return
+
+    with open(output_file, 'wb', buffering=XML_WRITE_BUFFER_SIZE) as f:
+        f.write(header.encode('utf-8'))
+
+        objects = iter(objects)
+        first = next(objects, None)
+        if first is None:
+            f.write(b'<data/>\n')
+            return
+
+        with ET.xmlfile(f, encoding='utf-8') as xf:
+            with xf.element('data'):
+                for count, (attrib, fields) in enumerate(itertools.chain([first], objects), 1):
+                    # Indentation is added through text/tail so the output
+                    # matches the pretty-printed layout
+                    obj = ET.Element('object', attrib)
+                    obj.text = '\n    '
+                    field = None
+                    for field_id, text in fields:
+                        field = ET.SubElement(obj, 'field', id=field_id)
+                        field.text = text or None  # empty text serializes as <field .../>
+                        field.tail = '\n    '
+                    if field is not None:
+                        field.tail = '\n  '
+                    else:
+                        obj.text = None
+                    xf.write('\n  ')
+                    xf.write(obj)
+                    if progress_callback and count % XML_PROGRESS_INTERVAL == 0:
+                        progress_callback(count)
+                xf.write('\n')
+        f.write(b'\n')
+
+
+def save_xml(root, output_file, project_name, header=None):
+    """
+    Format and save XML file with EDM Library Creator headers
 
-    final_xml = '\n'.join(xml_lines) + '\n' + xml_content
+    Uses lxml's C serializer when available; otherwise indents the
+    ElementTree in place. Either way the tree is serialized once to UTF-8
+    bytes and written after the header, without joining the two in memory.
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(final_xml)
+    Args:
+        root: ET.Element root node
+        output_file: Output file path
+        project_name: DDP project name
+        header: Optional pre-built xml_header() string
+    """
+    if header is None:
+        header = xml_header(project_name)
+
+    if LXML_AVAILABLE:
+        body = ET.tostring(root, pretty_print=True, encoding='utf-8')
+    else:
+        ET.indent(root, space='  ')
+        body = ET.tostring(root, encoding='utf-8', xml_declaration=False) + b'\n'
+
+    with open(output_file, 'wb', buffering=XML_WRITE_BUFFER_SIZE) as f:
+        f.write(header.encode('utf-8'))
+        f.write(body)
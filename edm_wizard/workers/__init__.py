@@ -3,27 +3,36 @@ EDM Library Wizard worker threads package
 
 Provides QThread workers for background operations:
 - Database export (Access, SQLite)
+- Combining mapped sheets into the Combined sheet
+- Claude API key validation
 - AI-powered column detection
 - Part search via PAS API
 - Manufacturer normalization
+- XML file generation
 """
 
 from .threads import (
     AccessExportThread,
     SQLiteExportThread,
+    CombineThread,
+    ApiTestThread,
     SheetDetectionWorker,
     AIDetectionThread,
     PartialMatchAIThread,
     ManufacturerNormalizationAIThread,
-    PASSearchThread
+    PASSearchThread,
+    XMLGenerationThread
 )
 
 __all__ = [
     'AccessExportThread',
     'SQLiteExportThread',
+    'CombineThread',
+    'ApiTestThread',
     'SheetDetectionWorker',
     'AIDetectionThread',
     'PartialMatchAIThread',
     'ManufacturerNormalizationAIThread',
-    'PASSearchThread'
+    'PASSearchThread',
+    'XMLGenerationThread'
 ]
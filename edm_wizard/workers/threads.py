@@ -6,22 +6,25 @@ operations that need to keep the UI responsive:
 
 - AccessExportThread: Export Access databases to Excel
 - SQLiteExportThread: Export SQLite databases to Excel
+- CombineThread: Combine mapped sheets and write the Combined sheet
 - SheetDetectionWorker: AI-powered single sheet column detection
 - AIDetectionThread: Coordinator for parallel AI sheet detection
 - PartialMatchAIThread: AI suggestions for partial matches
 - ManufacturerNormalizationAIThread: AI manufacturer name normalization
 - PASSearchThread: Parallel PAS API part searching
+- XMLGenerationThread: Write MFG/MFGPN XML files
 """
 
 import json
+import re
 import time
 import threading
+from collections import deque
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import numpy as np
 import pandas as pd
-import sqlalchemy as sa
-import urllib.parse
 from sqlalchemy import inspect
 
 from PyQt5.QtCore import QThread, pyqtSignal
@@ -44,31 +47,111 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
-from ..utils.data_processing import clean_sheet_name
+from ..utils.constants import (
+    AI_DETECTION_OUTPUT_TOKENS_PER_SHEET, AI_DETECTION_TOKEN_BUDGET, AI_SAMPLE_MAX_CHARS,
+    XLSX_STREAMING_OPTIONS, XLSX_WRITE_BUFFER_SIZE
+)
+from ..utils.data_processing import (
+    PARQUET_AVAILABLE, clean_sheet_names, combine_mapped_sheets, create_access_engine, fits_on_worksheet,
+    iter_tables_raw, load_parquet_cache, save_parquet_cache, write_combined_sheet, write_dataframe_rows,
+    write_table_index
+)
+from ..utils.ai_cache import make_cache_key
+from ..utils.serialization import dumps_json, loads_json
+from ..utils.xml_generation import create_mfg_xml, create_mfgpn_xml, xml_header
+
+
+# Column detection instructions. This text is identical for every request, so
+# it is sent as a cached system prompt and only the sheet data varies per call.
+# Prompt caching needs a prefix of at least 1024 tokens to take effect.
+COLUMN_DETECTION_INSTRUCTIONS = """You map the columns of Excel sheets exported from parts libraries to the fields of an electronic component catalog. The user message lists one or more sheets. Each sheet has its column names, up to 50 sample rows (the first 20 rows, a random sample of up to 20 rows from the middle, and the last 10 rows), and statistics.
+
+For every sheet, identify which columns correspond to:
+1. MFG (Manufacturer name) - Look for manufacturer names like "Siemens", "ABB", "Schneider", etc.
+2. MFG_PN (Manufacturer Part Number) - The primary part number from the manufacturer
+3. MFG_PN_2 (Secondary/alternative Manufacturer Part Number) - An alternative or backup part number
+4. Part_Number (Internal part number) - Internal reference numbers
+5. Description (Part description) - Text description of the part
+
+Note: Rows with little to no information (less than 30% of columns filled) have been filtered out. Columns with no data in those rows are left out of the sample rows (see non_empty_counts), and long text values are truncated.
+
+Analyze the sample data carefully. Look at:
+- Column names (they might have hints like "Mfg", "Manufacturer", "PN", "Part", "Description", etc.)
+- Data patterns (manufacturer names vs part numbers vs descriptions)
+- Data completeness (statistics show total_rows, rows_with_data after filtering, and non_empty_counts per column)
+- Data consistency across the sample rows
+
+Field guide:
+
+MFG
+- Typical headers: "MFG", "Mfg", "Mfr", "Manufacturer", "Manufacturer Name", "Vendor", "Make", "Brand", "Supplier".
+- Values are company names, usually repeated many times across rows: "Texas Instruments", "TI", "Analog Devices", "Murata", "Vishay", "Panduit", "Phoenix Contact", "Allen-Bradley", "Rockwell Automation", "Eaton".
+- Values rarely contain long digit sequences. A column of short codes that repeat (e.g. "TI", "ADI", "AB") can still be MFG.
+- "Vendor" or "Supplier" columns may hold distributors (Digi-Key, Mouser, Grainger) rather than manufacturers; prefer a manufacturer column when both exist.
+
+MFG_PN
+- Typical headers: "MFG PN", "MFG_PN", "Mfr Part Number", "Manufacturer Part Number", "MPN", "Part No", "Catalog Number", "Cat No", "Model".
+- Values are alphanumeric codes, usually mostly unique per row, often with dashes, slashes or dots: "LM358DR", "GRM188R71H104KA93D", "1492-J4", "140M-C2E-B16", "3RV2011-1JA10".
+- When two part number columns exist, MFG_PN is the one that is more complete and pairs with the MFG column.
+
+MFG_PN_2
+- Typical headers: "MFG PN 2", "Alt PN", "Alternate Part Number", "Second Source", "Alt MPN", "Old Part Number", "Replacement".
+- Values look like manufacturer part numbers but are usually sparser than MFG_PN.
+- Use null when the sheet has only one manufacturer part number column.
+
+Part_Number
+- Typical headers: "Part Number", "Item", "Item Number", "Internal PN", "Company PN", "Stock Code", "ERP Number", "SAP Number", "ID".
+- Values are internal references, often with a consistent company format: fixed length, shared prefix or purely numeric ("100-00123", "PN004512", "710034").
+- A database key column ("ID", "RecordID") with sequential integers is usually not a part number unless nothing better exists; give it low confidence.
+
+Description
+- Typical headers: "Description", "Desc", "Part Description", "Long Description", "Item Description", "Notes", "Comment".
+- Values are free text with spaces, units and specifications: "CAP CER 0.1UF 50V X7R 0603", "IC OPAMP GP 2 CIRCUIT 8SOIC", "Circuit breaker, 3 pole, 16A".
+- When there is a short and a long description, prefer the one that best describes the part on its own.
+
+General rules:
+- Each catalog field maps to at most one column, and each column maps to at most one field.
+- Only use column names that appear in that sheet's "columns" list, spelled exactly as given.
+- Use null for the column when no column fits, with a confidence of 0.
+- Judge each sheet on its own data; sheets in the same request may have different layouts.
+- Columns that are entirely or almost entirely empty should not be chosen unless the header is an unambiguous match, and then only with low confidence.
+
+Return a JSON object with the mapping and confidence scores (0-100). Base confidence on:
+- How well the column name matches the expected field
+- How consistent the data pattern is with the expected field type
+- How complete the data is (columns with mostly empty values should have lower confidence)
+
+Return one entry for every sheet in the request, keyed by the exact sheet_name. Format:
+{
+  "<sheet_name>": {
+    "MFG": {"column": "column_name or null", "confidence": 0-100},
+    "MFG_PN": {"column": "column_name or null", "confidence": 0-100},
+    "MFG_PN_2": {"column": "column_name or null", "confidence": 0-100},
+    "Part_Number": {"column": "column_name or null", "confidence": 0-100},
+    "Description": {"column": "column_name or null", "confidence": 0-100}
+  }
+}
+
+Only return the JSON, no other text."""
 
 
 class AccessExportThread(QThread):
     """Background thread for exporting Access database to Excel"""
     progress = pyqtSignal(str)
-    finished = pyqtSignal(str, object)  # excel_path, dataframes_dict
+    finished = pyqtSignal(str, object, list)  # excel_path, dataframes_dict, tables kept for this session only
     error = pyqtSignal(str)
 
-    def __init__(self, mdb_file, output_file):
+    def __init__(self, mdb_file, output_file, engine=None):
         super().__init__()
         self.mdb_file = mdb_file
         self.output_file = output_file
+        self.engine = engine  # Optional shared engine for mdb_file (see create_access_engine)
 
     def run(self):
         try:
             self.progress.emit("Connecting to Access database...")
 
-            # Create connection string
-            conn_str = (
-                r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
-                r"DBQ=" + self.mdb_file
-            )
-            quoted_conn_str = urllib.parse.quote_plus(conn_str)
-            engine = sa.create_engine(f"access+pyodbc:///?odbc_connect={quoted_conn_str}")
+            engine = self.engine if self.engine is not None else create_access_engine(self.mdb_file)
 
             # Get table names
             inspector = inspect(engine)
@@ -76,20 +159,49 @@ class AccessExportThread(QThread):
 
             self.progress.emit(f"Found {len(tables)} tables. Exporting...")
 
-            # Export all tables
+            # Export all tables - fetches run in parallel, the workbook is
+            # written from this thread in table order
             dataframes = {}
-            with pd.ExcelWriter(self.output_file, engine='xlsxwriter') as writer:
-                for idx, table in enumerate(tables, 1):
-                    self.progress.emit(f"Exporting table {idx}/{len(tables)}: {table}")
-                    df = pd.read_sql(f"SELECT * FROM [{table}]", engine)
-
-                    # Clean sheet name
-                    sheet_name = clean_sheet_name(table)
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+            parquet_only = []  # (table, sheet_name, rows) too large for a worksheet
+            with open(self.output_file, 'wb', buffering=XLSX_WRITE_BUFFER_SIZE) as output, \
+                    pd.ExcelWriter(output, engine='xlsxwriter',
+                                   engine_kwargs={'options': XLSX_STREAMING_OPTIONS}) as writer:
+                tables_iter = iter_tables_raw(engine, tables, "SELECT * FROM [{table}]")
+                sheet_names = clean_sheet_names(tables)
+                for idx, (sheet_name, (table, df)) in enumerate(zip(sheet_names, tables_iter), 1):
+                    message = f"Exporting table {idx}/{len(tables)}: {table}"
+                    self.progress.emit(message)
+
+                    if PARQUET_AVAILABLE and not fits_on_worksheet(df):
+                        # A worksheet would truncate it: keep it in the Parquet cache only
+                        parquet_only.append((table, sheet_name, len(df)))
+                    else:
+                        write_dataframe_rows(
+                            writer.book, sheet_name, df,
+                            progress_callback=lambda rows: self.progress.emit(f"{message} ({rows}/{len(df)} rows)")
+                        )
                     dataframes[sheet_name] = df
 
-            self.progress.emit("Export completed successfully!")
-            self.finished.emit(self.output_file, dataframes)
+                if parquet_only:
+                    write_table_index(writer.book, self.output_file, parquet_only)
+
+            # Binary copy of the sheets for fast reloading of this workbook;
+            # when it is written, hand on a lazy view of it so the exported
+            # frames can be freed and only the sheets actually used are reread
+            unsaved_tables = []  # Too large for the workbook and not cached either
+            if save_parquet_cache(self.output_file, dataframes):
+                dataframes = load_parquet_cache(self.output_file) or dataframes
+            else:
+                unsaved_tables = [table for table, _, _ in parquet_only]
+
+            if unsaved_tables:
+                self.progress.emit(
+                    f"Export completed with warnings: {len(unsaved_tables)} table(s) exceed the Excel "
+                    "row limit and could not be saved to the Parquet cache"
+                )
+            else:
+                self.progress.emit("Export completed successfully!")
+            self.finished.emit(self.output_file, dataframes, unsaved_tables)
 
         except Exception as e:
             self.error.emit(f"Error exporting Access database: {str(e)}")
@@ -98,7 +210,7 @@ class AccessExportThread(QThread):
 class SQLiteExportThread(QThread):
     """Background thread for exporting SQLite database to Excel"""
     progress = pyqtSignal(str)
-    finished = pyqtSignal(str, object)  # excel_path, dataframes_dict
+    finished = pyqtSignal(str, object, list)  # excel_path, dataframes_dict, tables kept for this session only
     error = pyqtSignal(str)
 
     def __init__(self, sqlite_file, output_file):
@@ -129,146 +241,320 @@ class SQLiteExportThread(QThread):
 
             # Export all tables
             dataframes = {}
-            with pd.ExcelWriter(self.output_file, engine='xlsxwriter') as writer:
-                for idx, table in enumerate(tables, 1):
+            parquet_only = []  # (table, sheet_name, rows) too large for a worksheet
+            with open(self.output_file, 'wb', buffering=XLSX_WRITE_BUFFER_SIZE) as output, \
+                    pd.ExcelWriter(output, engine='xlsxwriter',
+                                   engine_kwargs={'options': XLSX_STREAMING_OPTIONS}) as writer:
+                sheet_names = clean_sheet_names(tables)
+                for idx, (table, sheet_name) in enumerate(zip(tables, sheet_names), 1):
                     self.progress.emit(f"Exporting table {idx}/{len(tables)}: {table}")
 
                     # Read table data (SQLite uses double quotes for identifiers)
                     df = pd.read_sql_query(f'SELECT * FROM "{table}"', conn)
 
-                    # Clean sheet name
-                    sheet_name = clean_sheet_name(table)
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    if PARQUET_AVAILABLE and not fits_on_worksheet(df):
+                        # A worksheet would truncate it: keep it in the Parquet cache only
+                        parquet_only.append((table, sheet_name, len(df)))
+                    else:
+                        write_dataframe_rows(writer.book, sheet_name, df)
                     dataframes[sheet_name] = df
 
+                if parquet_only:
+                    write_table_index(writer.book, self.output_file, parquet_only)
+
             conn.close()
-            self.progress.emit("Export completed successfully!")
-            self.finished.emit(self.output_file, dataframes)
+
+            # Binary copy of the sheets for fast reloading of this workbook;
+            # when it is written, hand on a lazy view of it so the exported
+            # frames can be freed and only the sheets actually used are reread
+            unsaved_tables = []  # Too large for the workbook and not cached either
+            if save_parquet_cache(self.output_file, dataframes):
+                dataframes = load_parquet_cache(self.output_file) or dataframes
+            else:
+                unsaved_tables = [table for table, _, _ in parquet_only]
+
+            if unsaved_tables:
+                self.progress.emit(
+                    f"Export completed with warnings: {len(unsaved_tables)} table(s) exceed the Excel "
+                    "row limit and could not be saved to the Parquet cache"
+                )
+            else:
+                self.progress.emit("Export completed successfully!")
+            self.finished.emit(self.output_file, dataframes, unsaved_tables)
 
         except Exception as e:
             self.error.emit(f"Error exporting SQLite database: {str(e)}")
 
 
-class SheetDetectionWorker(QThread):
-    """Worker thread for detecting columns in a single sheet using AI"""
-    finished = pyqtSignal(str, dict)  # sheet_name, mapping
-    error = pyqtSignal(str, str)  # sheet_name, error_msg
+class CombineThread(QThread):
+    """Background thread for combining mapped sheets and saving the Combined sheet"""
+    progress = pyqtSignal(str, int, int)  # message, current, total
+    finished = pyqtSignal(object)  # combined DataFrame (empty if no rows remained)
+    error = pyqtSignal(str)
 
-    def __init__(self, api_key, sheet_name, dataframe, model="claude-sonnet-4-5-20250929", max_retries=5):
+    def __init__(self, dataframes, mappings, included_sheets, filters, excel_path):
         super().__init__()
-        self.api_key = api_key
-        self.sheet_name = sheet_name
-        self.dataframe = dataframe
-        self.model = model
-        self.max_retries = max_retries
+        self.dataframes = dataframes
+        self.mappings = mappings
+        self.included_sheets = included_sheets
+        self.filters = filters
+        self.excel_path = excel_path
 
     def run(self):
-        retry_count = 0
-        base_delay = 10  # Start with 10 second delay
+        try:
+            total = len(self.included_sheets)
+            combined_df = combine_mapped_sheets(
+                self.dataframes, self.mappings, self.included_sheets, self.filters,
+                progress_callback=lambda sheet_name, index: self.progress.emit(
+                    f"Combining sheet: {sheet_name}", index, total)
+            )
 
-        while retry_count <= self.max_retries:
-            try:
-                client = Anthropic(api_key=self.api_key)
+            # Nothing to write when every row was filtered out
+            if not combined_df.empty:
+                self.progress.emit("Saving Combined sheet...", total, total)
+                write_combined_sheet(self.excel_path, combined_df, self.dataframes)
 
-                # Prepare column information
-                columns = self.dataframe.columns.tolist()
+            self.finished.emit(combined_df)
 
-                # Filter out rows that are mostly empty (less than 30% of columns have data)
-                min_fields_threshold = max(2, len(columns) * 0.3)
-                non_empty_counts = self.dataframe.notna().sum(axis=1)
-                df_filtered = self.dataframe[non_empty_counts >= min_fields_threshold].copy()
+        except Exception as e:
+            self.error.emit(str(e))
 
-                if len(df_filtered) == 0:
-                    df_filtered = self.dataframe.copy()
 
-                # Increase sample size to 50 rows for better detection
-                sample_rows = []
+# One Anthropic client per API key, shared by every AI thread
+_anthropic_clients = {}
+_anthropic_clients_lock = threading.Lock()
 
-                # First 20 rows
-                if len(df_filtered) > 0:
-                    sample_rows.extend(df_filtered.head(20).to_dict('records'))
 
-                # Random sample from middle (if we have more than 40 rows)
-                if len(df_filtered) > 40:
-                    middle_sample = df_filtered.iloc[20:-10].sample(n=min(20, len(df_filtered) - 30), random_state=42)
-                    sample_rows.extend(middle_sample.to_dict('records'))
+def get_anthropic_client(api_key):
+    """
+    Return the shared Anthropic client for an API key, creating it on first use
 
-                # Last 10 rows (if we have more than 30 rows total)
-                if len(df_filtered) > 30:
-                    sample_rows.extend(df_filtered.tail(10).to_dict('records'))
+    The client keeps an HTTP connection pool, so reusing it lets the key
+    test and later AI requests skip a new TCP/TLS handshake per call.
+    """
+    with _anthropic_clients_lock:
+        client = _anthropic_clients.get(api_key)
+        if client is None:
+            client = _anthropic_clients[api_key] = Anthropic(api_key=api_key)
+        return client
 
-                # Get basic statistics
-                stats = {
-                    'total_rows': len(self.dataframe),
-                    'rows_with_data': len(df_filtered),
-                    'non_empty_counts': {}
-                }
 
-                for col in columns:
-                    non_empty = df_filtered[col].notna().sum()
-                    stats['non_empty_counts'][col] = non_empty
+class ApiTestThread(QThread):
+    """Background thread that validates a Claude API key with a minimal request"""
+    finished = pyqtSignal(bool, str)  # success, error_msg
 
-                sheet_info = {
-                    'sheet_name': self.sheet_name,
-                    'columns': columns,
-                    'sample_data': sample_rows,
-                    'statistics': stats
-                }
+    def __init__(self, api_key, model="claude-haiku-4-5-20251001"):
+        super().__init__()
+        self.api_key = api_key
+        self.model = model
 
-                # Create prompt for Claude
-                prompt = f"""Analyze the following Excel sheet and its columns. Identify which columns correspond to:
-1. MFG (Manufacturer name) - Look for manufacturer names like "Siemens", "ABB", "Schneider", etc.
-2. MFG_PN (Manufacturer Part Number) - The primary part number from the manufacturer
-3. MFG_PN_2 (Secondary/alternative Manufacturer Part Number) - An alternative or backup part number
-4. Part_Number (Internal part number) - Internal reference numbers
-5. Description (Part description) - Text description of the part
+    def run(self):
+        try:
+            client = get_anthropic_client(self.api_key)
+            # Simple test message - Claude Haiku 4.5 is fast and cost-effective
+            client.messages.create(
+                model=self.model,
+                max_tokens=10,
+                messages=[{"role": "user", "content": "test"}]
+            )
+            self.finished.emit(True, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+
+def build_sheet_info(sheet_name, dataframe):
+    """
+    Summarize a sheet for AI column detection
+
+    Args:
+        sheet_name: Name of the sheet
+        dataframe: Sheet contents
+
+    Returns:
+        dict with the sheet name, columns, up to 50 sample rows and statistics
+    """
+    columns = dataframe.columns.tolist()
+
+    # Filter out rows that are mostly empty (less than 30% of columns have data).
+    # Work on row positions so only the sampled rows are ever copied.
+    min_fields_threshold = max(2, len(columns) * 0.3)
+    not_na = dataframe.notna().to_numpy()
+    rows = np.flatnonzero(not_na.sum(axis=1) >= min_fields_threshold)
+
+    if len(rows) == 0 or len(rows) == len(dataframe):
+        # Nothing filtered out: count non-empty cells without copying the mask
+        rows = np.arange(len(dataframe))
+        non_empty_counts = not_na.sum(axis=0)
+    else:
+        non_empty_counts = not_na[rows].sum(axis=0)
+
+    # Increase sample size to 50 rows for better detection:
+    # first 20 rows, a random sample of up to 20 from the middle (if we have
+    # more than 40 rows) and the last 10 rows (if we have more than 30 rows)
+    picks = [rows[:20]]
+    if len(rows) > 40:
+        middle = rows[20:-10]
+        # Same draw as DataFrame.sample(random_state=42)
+        chosen = np.random.RandomState(42).choice(len(middle), size=min(20, len(rows) - 30), replace=False)
+        picks.append(middle[chosen])
+    if len(rows) > 30:
+        picks.append(rows[-10:])
+
+    # Keep the payload small: columns with no data in the kept rows are left
+    # out of the samples (they stay in 'columns') and long text is truncated
+    filled = np.flatnonzero(non_empty_counts > 0)
+    sample_df = dataframe.iloc[np.concatenate(picks), filled]
+    sample_rows = [
+        {key: value[:AI_SAMPLE_MAX_CHARS] if isinstance(value, str) else value for key, value in record.items()}
+        for record in sample_df.to_dict('records')
+    ]
+
+    # Get basic statistics
+    stats = {
+        'total_rows': len(dataframe),
+        'rows_with_data': len(rows),
+        'non_empty_counts': dict(zip(columns, non_empty_counts.tolist()))
+    }
+
+    return {
+        'sheet_name': sheet_name,
+        'columns': columns,
+        'sample_data': sample_rows,
+        'statistics': stats
+    }
+
+
+# Markdown code fence around an AI response: ```json ... ``` (closing fence optional)
+_CODE_FENCE_RE = re.compile(r'^```(?:json)?\s*(.*?)\s*(?:```|$)', re.S)
+
+
+def strip_code_fence(response_text):
+    """Return the body of a response wrapped in a ``` code block, else the text unchanged"""
+    match = _CODE_FENCE_RE.match(response_text)
+    return match.group(1) if match else response_text
+
+
+def estimate_tokens(sheet_info):
+    """Rough input token estimate for a sheet summary (~4 characters per token)"""
+    return len(dumps_json(sheet_info)) // 4
+
+
+def pack_sheet_batches(sheets_info, token_budget):
+    """
+    Greedily group sheet summaries so each group fits within a token budget
+
+    A sheet larger than the budget on its own still gets a batch of its own.
+
+    Args:
+        sheets_info: List of dicts from build_sheet_info()
+        token_budget: Estimated input tokens allowed per batch
+
+    Returns:
+        List of batches (lists of sheet summaries), in sheet order
+    """
+    batches = []
+    batch = []
+    batch_tokens = 0
+    for info in sheets_info:
+        tokens = estimate_tokens(info)
+        if batch and batch_tokens + tokens > token_budget:
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(info)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def build_column_detection_payload(sheets_info):
+    """
+    Build the per-request part of the column detection prompt
+
+    Args:
+        sheets_info: List of dicts from build_sheet_info()
+
+    Returns:
+        User message listing the sheets to analyze (the instructions are sent
+        separately as COLUMN_DETECTION_INSTRUCTIONS)
+    """
+    sheet_names = json.dumps([info['sheet_name'] for info in sheets_info])
+    return f"""Sheets to analyze: {sheet_names}
+
+Here are the sheets with their columns, sample data (up to 50 rows each), and statistics:
+
+{dumps_json(sheets_info, indent=True)}"""
+
+
+def request_column_mappings(client, model, payload, max_tokens=4096):
+    """
+    Send one column detection request and parse the JSON response
+
+    Args:
+        client: Anthropic client
+        model: Claude model ID
+        payload: User message from build_column_detection_payload()
+        max_tokens: Response token limit
+
+    Returns:
+        dict mapping sheet name -> field mapping
+    """
+    response = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        system=[{
+            "type": "text",
+            "text": COLUMN_DETECTION_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"}
+        }],
+        messages=[{"role": "user", "content": payload}]
+    )
 
-Here is the sheet with its columns, sample data (up to 50 rows), and statistics:
+    # Parse response
+    response_text = strip_code_fence(response.content[0].text.strip())
+    return loads_json(response_text)
 
-{json.dumps(sheet_info, indent=2, default=str)}
 
-Note: Rows with little to no information (less than 30% of columns filled) have been filtered out.
+def is_rate_limit_error(error_str):
+    """Check whether an API error message indicates rate limiting or overload (429)"""
+    return '429' in error_str or 'rate_limit' in error_str.lower() or 'overloaded' in error_str.lower()
 
-Analyze the sample data carefully. Look at:
-- Column names (they might have hints like "Mfg", "Manufacturer", "PN", "Part", "Description", etc.)
-- Data patterns (manufacturer names vs part numbers vs descriptions)
-- Data completeness (statistics show total_rows, rows_with_data after filtering, and non_empty_counts per column)
-- Data consistency across the sample rows
 
-Return a JSON object with the mapping and confidence scores (0-100). Base confidence on:
-- How well the column name matches the expected field
-- How consistent the data pattern is with the expected field type
-- How complete the data is (columns with mostly empty values should have lower confidence)
+def is_context_length_error(error_str):
+    """Check whether an API error message indicates the prompt exceeded the context window"""
+    lowered = error_str.lower()
+    return 'prompt is too long' in lowered or 'context_length' in lowered or 'context window' in lowered
 
-Format:
-{{
-  "{self.sheet_name}": {{
-    "MFG": {{"column": "column_name or null", "confidence": 0-100}},
-    "MFG_PN": {{"column": "column_name or null", "confidence": 0-100}},
-    "MFG_PN_2": {{"column": "column_name or null", "confidence": 0-100}},
-    "Part_Number": {{"column": "column_name or null", "confidence": 0-100}},
-    "Description": {{"column": "column_name or null", "confidence": 0-100}}
-  }}
-}}
 
-Only return the JSON, no other text."""
+class SheetDetectionWorker(QThread):
+    """Worker thread for detecting columns in a single sheet using AI"""
+    finished = pyqtSignal(str, dict)  # sheet_name, mapping
+    error = pyqtSignal(str, str)  # sheet_name, error_msg
 
-                # Call Claude API with selected model
-                response = client.messages.create(
-                    model=self.model,
-                    max_tokens=4096,
-                    messages=[{"role": "user", "content": prompt}]
-                )
+    def __init__(self, api_key, sheet_name, dataframe, model="claude-sonnet-4-5-20250929", max_retries=5):
+        super().__init__()
+        self.api_key = api_key
+        self.sheet_name = sheet_name
+        self.dataframe = dataframe
+        self.model = model
+        self.max_retries = max_retries
 
-                # Parse response
-                response_text = response.content[0].text.strip()
-                if response_text.startswith('```'):
-                    response_text = response_text.split('```')[1]
-                    if response_text.startswith('json'):
-                        response_text = response_text[4:]
-                    response_text = response_text.strip()
+    def run(self):
+        retry_count = 0
+        base_delay = 10  # Start with 10 second delay
 
-                mapping = json.loads(response_text)
+        # The client and the request payload are the same for every retry
+        try:
+            client = get_anthropic_client(self.api_key)
+            payload = build_column_detection_payload([build_sheet_info(self.sheet_name, self.dataframe)])
+        except Exception as e:
+            self.error.emit(self.sheet_name, str(e))
+            return
+
+        while retry_count <= self.max_retries:
+            try:
+                mapping = request_column_mappings(client, self.model, payload)
 
                 # Emit the mapping for this sheet
                 if self.sheet_name in mapping:
@@ -282,10 +568,7 @@ Only return the JSON, no other text."""
             except Exception as e:
                 error_str = str(e)
 
-                # Check if it's a rate limit error (429)
-                is_rate_limit = '429' in error_str or 'rate_limit' in error_str.lower() or 'overloaded' in error_str.lower()
-
-                if is_rate_limit and retry_count < self.max_retries:
+                if is_rate_limit_error(error_str) and retry_count < self.max_retries:
                     # Calculate exponential backoff delay
                     delay = base_delay * (2 ** retry_count)  # 10s, 20s, 40s, 80s, 160s
                     retry_count += 1
@@ -303,58 +586,120 @@ Only return the JSON, no other text."""
 
 
 class AIDetectionThread(QThread):
-    """Coordinator thread for parallel AI column detection across all sheets"""
+    """Coordinator thread for batched AI column detection across all sheets"""
     progress = pyqtSignal(str, int, int)  # message, current, total
     finished = pyqtSignal(dict)  # mappings
     error = pyqtSignal(str)
 
-    def __init__(self, api_key, dataframes, model="claude-sonnet-4-5-20250929"):
+    def __init__(self, api_key, dataframes, model="claude-sonnet-4-5-20250929", max_retries=5,
+                 ai_cache=None, ignore_cache=False):
         super().__init__()
         self.api_key = api_key
         self.dataframes = dataframes
         self.model = model
+        self.max_retries = max_retries
+        self.ai_cache = ai_cache  # Optional persistent AICache
+        self.ignore_cache = ignore_cache  # Re-query AI even when a cached answer exists
         self.all_mappings = {}
         self.completed_count = 0
         self.error_count = 0
-        self.workers = []
+
+    def detect_batch(self, client, batch):
+        """
+        Request mappings for a batch of sheets, retrying on rate limits
+
+        Raises the last API error when it is not a rate limit or retries run out.
+        """
+        retry_count = 0
+        base_delay = 10  # Start with 10 second delay
+        max_tokens = max(4096, AI_DETECTION_OUTPUT_TOKENS_PER_SHEET * len(batch))
+        payload = build_column_detection_payload(batch)
+
+        while True:
+            try:
+                return request_column_mappings(client, self.model, payload, max_tokens=max_tokens)
+            except Exception as e:
+                if is_rate_limit_error(str(e)) and retry_count < self.max_retries:
+                    delay = base_delay * (2 ** retry_count)  # 10s, 20s, 40s, 80s, 160s
+                    retry_count += 1
+                    time.sleep(delay)
+                    continue
+                raise
 
     def run(self):
         try:
             sheet_names = list(self.dataframes.keys())
             total_sheets = len(sheet_names)
 
-            self.progress.emit(f"Starting parallel analysis of {total_sheets} sheets...", 0, total_sheets)
+            client = get_anthropic_client(self.api_key)
 
-            # Create a worker for each sheet
-            for sheet_name in sheet_names:
-                worker = SheetDetectionWorker(
-                    self.api_key,
-                    sheet_name,
-                    self.dataframes[sheet_name],
-                    self.model
-                )
-                worker.finished.connect(self.on_sheet_completed)
-                worker.error.connect(self.on_sheet_error)
-                self.workers.append(worker)
+            sheets_info = []
+            cache_keys = {}
+            groups = {}  # column signature -> sheet names
+            for name in sheet_names:
+                info = build_sheet_info(name, self.dataframes[name])
 
-            # Start workers with staggered delays to avoid rate limiting
-            # Conservative approach: process one at a time with longer delays
-            batch_size = 1  # Process one sheet at a time to avoid rate limits
-            delay_between_requests = 12.0  # 12 second delay between requests (safe for most API tiers)
+                # Sheets analyzed in a previous run (same name, columns and
+                # sample data) reuse the cached mapping instead of querying the API
+                cache_key = make_cache_key(info)
+                cached = self.ai_cache.get('column_mapping', cache_key) if self.ai_cache else None
+                if cached is not None and not self.ignore_cache:
+                    self.on_sheet_completed(name, cached)
+                    continue
+                cache_keys[name] = cache_key
+
+                # Sheets sharing the exact same columns (e.g. partitioned Access
+                # tables) get one representative in the request; its mapping is
+                # applied to every sheet in the group
+                signature = tuple(map(str, info['columns']))
+                if signature not in groups:
+                    groups[signature] = []
+                    sheets_info.append(info)
+                groups[signature].append(name)
+            siblings = {group[0]: group for group in groups.values()}
+
+            # Pack as many sheets per request as fit in the token budget so the
+            # instruction prompt is sent once per batch rather than once per sheet
+            pending = deque(pack_sheet_batches(sheets_info, AI_DETECTION_TOKEN_BUDGET))
+
+            self.progress.emit(
+                f"Analyzing {len(cache_keys)} sheets ({len(sheets_info)} distinct layouts) "
+                f"in {len(pending)} request(s)...",
+                self.completed_count,
+                total_sheets
+            )
 
-            for i in range(0, len(self.workers), batch_size):
-                batch = self.workers[i:i + batch_size]
+            delay_between_requests = 12.0  # 12 second delay between requests (safe for most API tiers)
 
-                # Start workers in this batch
-                for worker in batch:
-                    worker.start()
+            while pending:
+                batch = pending.popleft()
 
-                # Wait for this batch to complete before starting next
-                for worker in batch:
-                    worker.wait()
+                try:
+                    mapping = self.detect_batch(client, batch)
+                except Exception as e:
+                    error_str = str(e)
+                    if is_context_length_error(error_str) and len(batch) > 1:
+                        # Estimate was too optimistic: split the batch in half and retry
+                        mid = len(batch) // 2
+                        pending.appendleft(batch[mid:])
+                        pending.appendleft(batch[:mid])
+                        continue
+                    for info in batch:
+                        for sheet_name in siblings[info['sheet_name']]:
+                            self.on_sheet_error(sheet_name, error_str)
+                else:
+                    for info in batch:
+                        sheet_mapping = mapping.get(info['sheet_name'])
+                        for sheet_name in siblings[info['sheet_name']]:
+                            if sheet_mapping is not None:
+                                if self.ai_cache:
+                                    self.ai_cache.set('column_mapping', cache_keys[sheet_name], sheet_mapping)
+                                self.on_sheet_completed(sheet_name, sheet_mapping)
+                            else:
+                                self.on_sheet_error(sheet_name, "Sheet mapping not found in response")
 
                 # If not the last batch, wait before starting next request
-                if i + batch_size < len(self.workers):
+                if pending:
                     self.progress.emit(
                         f"Rate limit protection: waiting {delay_between_requests}s before next request...",
                         self.completed_count,
@@ -362,8 +707,8 @@ class AIDetectionThread(QThread):
                     )
                     time.sleep(delay_between_requests)
 
-            # All workers have already completed (waited in the loop above)
-            # No need to wait again
+            if self.ai_cache:
+                self.ai_cache.save()
 
             # Check if we got at least some results
             if len(self.all_mappings) > 0:
@@ -429,35 +774,26 @@ class PartialMatchAIThread(QThread):
     finished = pyqtSignal(dict)  # part_number -> suggested_match_index
     error = pyqtSignal(str)
 
-    def __init__(self, api_key, parts_needing_review, combined_data):
+    def __init__(self, api_key, parts_needing_review, combined_data, max_workers=8,
+                 ai_cache=None, ignore_cache=False):
         super().__init__()
         self.api_key = api_key
         self.parts_needing_review = parts_needing_review
         self.combined_data = combined_data
+        self.max_workers = max_workers  # Number of concurrent AI requests
+        self.ai_cache = ai_cache  # Optional persistent AICache
+        self.ignore_cache = ignore_cache  # Re-query AI even when a cached answer exists
+        self.completed_count = 0
 
-    def run(self):
-        try:
-            client = Anthropic(api_key=self.api_key)
-            suggestions = {}
-
-            total = len(self.parts_needing_review)
-            for idx, part in enumerate(self.parts_needing_review):
-                # Skip parts with only one match - no AI needed
-                if len(part['matches']) <= 1:
-                    self.progress.emit(f"Skipping part {idx + 1} of {total} (only one match)...", idx + 1, total)
-                    # Still mark as processed
-                    self.part_analyzed.emit(idx, {'skipped': True, 'reason': 'single_match'})
-                    continue
-
-                self.progress.emit(f"Analyzing part {idx + 1} of {total}...", idx, total)
-
-                # Get original description from combined data
-                description = self.get_description_for_part(part['PartNumber'], part['ManufacturerName'])
+    def analyze_single_part(self, client, part):
+        """Ask the AI to pick the best SupplyFrame match for a single part"""
+        # Get original description from combined data
+        description = self.get_description_for_part(part['PartNumber'], part['ManufacturerName'])
 
-                # Create prompt for AI
-                matches_text = "\n".join([f"{i+1}. {m}" for i, m in enumerate(part['matches'])])
+        # Create prompt for AI
+        matches_text = "\n".join([f"{i+1}. {m}" for i, m in enumerate(part['matches'])])
 
-                prompt = f"""Analyze this electronic component and suggest the best matching part number from SupplyFrame.
+        prompt = f"""Analyze this electronic component and suggest the best matching part number from SupplyFrame.
 
 Original Part:
 - Part Number: {part['PartNumber']}
@@ -482,31 +818,77 @@ Return a JSON object with:
 
 Only return the JSON, no other text."""
 
-                try:
-                    response = client.messages.create(
-                        model="claude-haiku-4-5-20251001",
-                        max_tokens=500,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
+        response = client.messages.create(
+            model="claude-haiku-4-5-20251001",
+            max_tokens=500,
+            temperature=0,  # Ensure consistent results
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        response_text = strip_code_fence(response.content[0].text.strip())
+        return json.loads(response_text)
 
-                    response_text = response.content[0].text.strip()
-                    if response_text.startswith('```'):
-                        response_text = response_text.split('```')[1]
-                        if response_text.startswith('json'):
-                            response_text = response_text[4:]
-                        response_text = response_text.strip()
+    def run(self):
+        try:
+            client = get_anthropic_client(self.api_key)
+            suggestions = {}
 
-                    result = json.loads(response_text)
-                    suggestions[part['PartNumber']] = result
+            total = len(self.parts_needing_review)
+            self.completed_count = 0
 
-                    # Emit per-part update for real-time UI refresh
-                    self.part_analyzed.emit(idx, result)
+            # Parts with only one match need no AI; cached parts are answered
+            # from disk; everything else is queued
+            pending = []
+            for idx, part in enumerate(self.parts_needing_review):
+                if len(part['matches']) <= 1:
+                    self.completed_count += 1
+                    self.progress.emit(f"Skipping part {idx + 1} of {total} (only one match)...", self.completed_count, total)
+                    # Still mark as processed
+                    self.part_analyzed.emit(idx, {'skipped': True, 'reason': 'single_match'})
+                    continue
 
-                except Exception as e:
-                    # If AI fails for this part, emit error result
-                    self.part_analyzed.emit(idx, {'error': str(e)})
+                cache_key = make_cache_key(part['PartNumber'], part['ManufacturerName'], part['matches'])
+                cached = self.ai_cache.get('partial_match', cache_key) if self.ai_cache else None
+                if cached is not None and not self.ignore_cache:
+                    self.completed_count += 1
+                    suggestions[part['PartNumber']] = cached
+                    self.part_analyzed.emit(idx, cached)
+                    self.progress.emit(f"Using cached suggestion for part {idx + 1} of {total}...", self.completed_count, total)
                     continue
 
+                pending.append((idx, part, cache_key))
+
+            if pending:
+                self.progress.emit(f"Analyzing {len(pending)} parts...", self.completed_count, total)
+
+            # Overlap AI round-trips with a thread pool (same approach as PASSearchThread)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                future_to_part = {
+                    executor.submit(self.analyze_single_part, client, part): (idx, part, cache_key)
+                    for idx, part, cache_key in pending
+                }
+
+                for future in as_completed(future_to_part):
+                    idx, part, cache_key = future_to_part[future]
+                    self.completed_count += 1
+                    try:
+                        result = future.result()
+                        suggestions[part['PartNumber']] = result
+                        if self.ai_cache:
+                            self.ai_cache.set('partial_match', cache_key, result)
+
+                        # Emit per-part update for real-time UI refresh
+                        self.part_analyzed.emit(idx, result)
+
+                    except Exception as e:
+                        # If AI fails for this part, emit error result
+                        self.part_analyzed.emit(idx, {'error': str(e)})
+
+                    self.progress.emit(f"Analyzed part {self.completed_count} of {total}...", self.completed_count, total)
+
+            if self.ai_cache:
+                self.ai_cache.save()
+
             self.finished.emit(suggestions)
 
         except Exception as e:
@@ -531,26 +913,21 @@ class ManufacturerNormalizationAIThread(QThread):
     finished = pyqtSignal(dict, dict)  # (normalizations, reasoning_map)
     error = pyqtSignal(str)
 
-    def __init__(self, api_key, all_manufacturers, supplyframe_manufacturers):
+    def __init__(self, api_key, all_manufacturers, supplyframe_manufacturers,
+                 ai_cache=None, ignore_cache=False):
         super().__init__()
         self.api_key = api_key
         self.all_manufacturers = all_manufacturers
         self.supplyframe_manufacturers = supplyframe_manufacturers
+        self.ai_cache = ai_cache  # Optional persistent AICache
+        self.ignore_cache = ignore_cache  # Re-query AI even when a cached answer exists
 
-    def run(self):
-        try:
-            normalizations = {}
-            reasoning_map = {}
-
-            # Pure AI analysis - no fuzzy matching pre-filter
-            if ANTHROPIC_AVAILABLE and self.api_key:
-                self.progress.emit("AI analyzing all manufacturers...")
+    def request_normalizations(self):
+        """Ask the AI for manufacturer normalizations and return the parsed result"""
+        client = get_anthropic_client(self.api_key)
 
-                if self.all_manufacturers:
-                    client = Anthropic(api_key=self.api_key)
-
-                    # Create prompt for AI to analyze ALL manufacturers
-                    prompt = f"""Analyze these manufacturer names and detect variations that need normalization.
+        # Create prompt for AI to analyze ALL manufacturers
+        prompt = f"""Analyze these manufacturer names and detect variations that need normalization.
 
 SOURCE manufacturers (from user's data - these are what need normalizing):
 {json.dumps(sorted(self.all_manufacturers), indent=2)}
@@ -590,45 +967,57 @@ IMPORTANT:
 - Return ONLY valid JSON, no markdown, no other text
 - Ensure all quotes inside strings are escaped with backslash"""
 
-                    response = client.messages.create(
-                        model="claude-sonnet-4-5-20250929",
-                        max_tokens=4096,
-                        temperature=0,  # Ensure consistent results
-                        messages=[{"role": "user", "content": prompt}]
-                    )
+        response = client.messages.create(
+            model="claude-sonnet-4-5-20250929",
+            max_tokens=4096,
+            temperature=0,  # Ensure consistent results
+            messages=[{"role": "user", "content": prompt}]
+        )
 
-                    response_text = response.content[0].text.strip()
+        # Clean up code blocks
+        response_text = strip_code_fence(response.content[0].text.strip())
 
-                    # Clean up code blocks
-                    if response_text.startswith('```'):
-                        # Extract content between code blocks
-                        parts = response_text.split('```')
-                        if len(parts) >= 2:
-                            response_text = parts[1]
-                            # Remove 'json' language identifier if present
-                            if response_text.startswith('json'):
-                                response_text = response_text[4:]
-                            response_text = response_text.strip()
+        # Try to parse JSON with better error handling
+        try:
+            ai_result = json.loads(response_text)
+        except json.JSONDecodeError as je:
+            # Log the error and try to extract what we can
+            self.progress.emit(f"JSON parse error at char {je.pos}: {je.msg}")
+
+            # Fallback: Try to find JSON object in the response
+            import re
+            json_match = re.search(r'\{[\s\S]*\}', response_text)
+            if json_match:
+                try:
+                    ai_result = json.loads(json_match.group())
+                except:
+                    # If all parsing fails, return empty results
+                    self.progress.emit("Could not parse AI response")
+                    ai_result = {"normalizations": {}, "reasoning": {}}
+            else:
+                ai_result = {"normalizations": {}, "reasoning": {}}
 
-                    # Try to parse JSON with better error handling
-                    try:
-                        ai_result = json.loads(response_text)
-                    except json.JSONDecodeError as je:
-                        # Log the error and try to extract what we can
-                        self.progress.emit(f"JSON parse error at char {je.pos}: {je.msg}")
-
-                        # Fallback: Try to find JSON object in the response
-                        import re
-                        json_match = re.search(r'\{[\s\S]*\}', response_text)
-                        if json_match:
-                            try:
-                                ai_result = json.loads(json_match.group())
-                            except:
-                                # If all parsing fails, return empty results
-                                self.progress.emit("Could not parse AI response")
-                                ai_result = {"normalizations": {}, "reasoning": {}}
-                        else:
-                            ai_result = {"normalizations": {}, "reasoning": {}}
+        return ai_result
+
+    def run(self):
+        try:
+            normalizations = {}
+            reasoning_map = {}
+
+            # Pure AI analysis - no fuzzy matching pre-filter
+            if ANTHROPIC_AVAILABLE and self.api_key:
+                self.progress.emit("AI analyzing all manufacturers...")
+
+                if self.all_manufacturers:
+                    cache_key = make_cache_key(sorted(self.all_manufacturers), sorted(self.supplyframe_manufacturers))
+                    ai_result = self.ai_cache.get('normalization', cache_key) if self.ai_cache else None
+                    if ai_result is not None and not self.ignore_cache:
+                        self.progress.emit("Using cached AI normalization results...")
+                    else:
+                        ai_result = self.request_normalizations()
+                        if self.ai_cache and ai_result.get('normalizations'):
+                            self.ai_cache.set('normalization', cache_key, ai_result)
+                            self.ai_cache.save()
 
                     ai_normalizations = ai_result.get('normalizations', {})
                     ai_reasoning = ai_result.get('reasoning', {})
@@ -825,3 +1214,47 @@ class PASSearchThread(QThread):
 
         except Exception as e:
             self.error.emit(str(e))
+
+
+class XMLGenerationThread(QThread):
+    """Background thread for writing MFG and MFGPN XML files"""
+    progress = pyqtSignal(str, int, int)  # message, current, total
+    finished = pyqtSignal(dict)  # {'mfg_count': int, 'mfgpn_count': int}
+    error = pyqtSignal(str)
+
+    def __init__(self, manufacturers, mfgpn_data, mfg_xml_path, mfgpn_xml_path, project_name, catalog):
+        super().__init__()
+        self.manufacturers = manufacturers
+        self.mfgpn_data = mfgpn_data  # List of dicts or {(MFG, MFG_PN): Description}
+        self.mfg_xml_path = mfg_xml_path
+        self.mfgpn_xml_path = mfgpn_xml_path
+        self.project_name = project_name
+        self.catalog = catalog
+
+    def run(self):
+        try:
+            total = len(self.manufacturers) + len(self.mfgpn_data)
+            mfg_total = len(self.manufacturers)
+            header = xml_header(self.project_name)  # Same header/timestamp for both files
+
+            self.progress.emit("Writing MFG XML...", 0, total)
+            mfg_count = create_mfg_xml(
+                self.manufacturers, self.mfg_xml_path, self.project_name, self.catalog,
+                progress_callback=lambda count: self.progress.emit(
+                    f"Writing MFG XML ({count} manufacturers)...", count, total),
+                header=header
+            )
+
+            self.progress.emit("Writing MFGPN XML...", mfg_total, total)
+            mfgpn_count = create_mfgpn_xml(
+                self.mfgpn_data, self.mfgpn_xml_path, self.project_name, self.catalog,
+                progress_callback=lambda count: self.progress.emit(
+                    f"Writing MFGPN XML ({count} part numbers)...", mfg_total + count, total),
+                header=header
+            )
+
+            self.progress.emit("XML generation complete", total, total)
+            self.finished.emit({'mfg_count': mfg_count, 'mfgpn_count': mfgpn_count})
+
+        except Exception as e:
+            self.error.emit(str(e))